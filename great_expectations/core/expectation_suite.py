@@ -1,6 +1,7 @@
 import datetime
 import json
 import logging
+from bisect import insort
 from copy import deepcopy
 from typing import Any, List, Union
 
@@ -32,6 +33,102 @@ from great_expectations.types import SerializableDictDot
 
 logger = logging.getLogger(__name__)
 
+_INDEXED_MATCH_TYPES = ("domain", "success")
+
+
+def _freeze_kwargs(value):
+    """Convert a kwargs value into a hashable form that compares equal exactly when the original values do.
+
+    Raises TypeError for values that cannot be made hashable.
+    """
+    if isinstance(value, dict):
+        return (
+            dict,
+            tuple(sorted((key, _freeze_kwargs(val)) for key, val in value.items())),
+        )
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze_kwargs(val) for val in value))
+    if isinstance(value, (set, frozenset)):
+        return (set, frozenset(_freeze_kwargs(val) for val in value))
+    hash(value)
+    return value
+
+
+def _get_expectation_index_key(
+    expectation_configuration: ExpectationConfiguration, match_type: str
+):
+    """The key under which an ExpectationConfiguration is indexed for match_type, or None if it cannot be hashed."""
+    if match_type == "domain":
+        kwargs = expectation_configuration.get_domain_kwargs()
+    else:
+        kwargs = expectation_configuration.get_success_kwargs()
+    try:
+        return expectation_configuration.expectation_type, _freeze_kwargs(kwargs)
+    except TypeError:
+        return None
+
+
+class _ExpectationConfigurationList(list):
+    """A list that counts in-place modifications, so that ExpectationSuite can tell when its lookup indexes are stale."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+    def _modified(self):
+        self.version += 1
+
+    def append(self, *args):
+        super().append(*args)
+        self._modified()
+
+    def extend(self, *args):
+        super().extend(*args)
+        self._modified()
+
+    def insert(self, *args):
+        super().insert(*args)
+        self._modified()
+
+    def pop(self, *args):
+        item = super().pop(*args)
+        self._modified()
+        return item
+
+    def remove(self, *args):
+        super().remove(*args)
+        self._modified()
+
+    def clear(self):
+        super().clear()
+        self._modified()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._modified()
+
+    def reverse(self):
+        super().reverse()
+        self._modified()
+
+    def __setitem__(self, *args):
+        super().__setitem__(*args)
+        self._modified()
+
+    def __delitem__(self, *args):
+        super().__delitem__(*args)
+        self._modified()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._modified()
+        return result
+
+    def __imul__(self, other):
+        result = super().__imul__(other)
+        self._modified()
+        return result
+
 
 class ExpectationSuite(SerializableDictDot):
     """
@@ -40,6 +137,11 @@ class ExpectationSuite(SerializableDictDot):
         -read: self.find_expectation_indexes()
         -update: self.add_expectation() or self.patch_expectation()
         -delete: self.remove_expectation()
+
+    Lookups by "domain" and "success" match_type use hash indexes keyed by expectation_type and the corresponding
+    kwargs; the indexes are rebuilt lazily after self.expectations is modified. Modifying the kwargs of an
+    ExpectationConfiguration in place, other than through patch_expectation, is not detected; reassign
+    self.expectations afterwards to rebuild the indexes.
     """
 
     def __init__(
@@ -76,6 +178,71 @@ class ExpectationSuite(SerializableDictDot):
         ensure_json_serializable(meta)
         self.meta = meta
 
+    @property
+    def expectations(self) -> List[ExpectationConfiguration]:
+        return self._expectations
+
+    @expectations.setter
+    def expectations(self, expectations):
+        self._expectations = _ExpectationConfigurationList(expectations)
+        self._invalidate_expectation_indexes()
+
+    def _invalidate_expectation_indexes(self):
+        self._expectation_indexes = {}
+        self._expectation_indexes_version = None
+
+    def _get_expectation_index(self, match_type: str) -> dict:
+        """The index for match_type, mapping index keys to sorted positions in self.expectations; positions of
+        expectations whose kwargs cannot be hashed are kept under the key None."""
+        if self._expectation_indexes_version != self._expectations.version:
+            self._expectation_indexes = {}
+            self._expectation_indexes_version = self._expectations.version
+        index = self._expectation_indexes.get(match_type)
+        if index is None:
+            index = {}
+            for idx, expectation in enumerate(self._expectations):
+                index.setdefault(
+                    _get_expectation_index_key(expectation, match_type), []
+                ).append(idx)
+            self._expectation_indexes[match_type] = index
+        return index
+
+    def _set_expectation(
+        self, idx: int, expectation_configuration: ExpectationConfiguration
+    ):
+        """Place expectation_configuration at position idx (or append it if idx is None), updating any indexes that
+        are already built instead of discarding them."""
+        indexes_are_current = (
+            self._expectation_indexes_version == self._expectations.version
+        )
+        if idx is None:
+            idx = len(self._expectations)
+            self._expectations.append(expectation_configuration)
+            previous_expectation = None
+        else:
+            previous_expectation = self._expectations[idx]
+            self._expectations[idx] = expectation_configuration
+        if not indexes_are_current:
+            return
+        for match_type, index in self._expectation_indexes.items():
+            if previous_expectation is not None:
+                try:
+                    index[
+                        _get_expectation_index_key(previous_expectation, match_type)
+                    ].remove(idx)
+                except (KeyError, ValueError):
+                    # The replaced expectation's kwargs were changed after it was indexed
+                    self._invalidate_expectation_indexes()
+                    return
+            insort(
+                index.setdefault(
+                    _get_expectation_index_key(expectation_configuration, match_type),
+                    [],
+                ),
+                idx,
+            )
+        self._expectation_indexes_version = self._expectations.version
+
     def add_citation(
         self,
         comment,
@@ -220,7 +387,7 @@ class ExpectationSuite(SerializableDictDot):
            Notes:
                May want to add type-checking in the future.
         """
-        self.expectations.append(expectation_config)
+        self._set_expectation(None, expectation_config)
 
     def remove_expectation(
         self,
@@ -308,6 +475,19 @@ class ExpectationSuite(SerializableDictDot):
             raise InvalidExpectationConfigurationError(
                 "Ensure that expectation configuration is valid."
             )
+        if match_type in _INDEXED_MATCH_TYPES:
+            key = _get_expectation_index_key(expectation_configuration, match_type)
+            if key is not None:
+                index = self._get_expectation_index(match_type)
+                candidate_indexes = sorted(index.get(key, []) + index.get(None, []))
+                return [
+                    idx
+                    for idx in candidate_indexes
+                    if self.expectations[idx].isEquivalentTo(
+                        expectation_configuration, match_type
+                    )
+                ]
+
         match_indexes = []
         for idx, expectation in enumerate(self.expectations):
             if expectation.isEquivalentTo(expectation_configuration, match_type):
@@ -323,14 +503,7 @@ class ExpectationSuite(SerializableDictDot):
         found_expectation_indexes = self.find_expectation_indexes(
             expectation_configuration, match_type
         )
-        if len(found_expectation_indexes) > 0:
-            return [
-                expectation
-                for idx, expectation in enumerate(self.expectations)
-                if idx in found_expectation_indexes
-            ]
-        else:
-            return []
+        return [self.expectations[idx] for idx in found_expectation_indexes]
 
     def patch_expectation(
         self,
@@ -370,6 +543,7 @@ class ExpectationSuite(SerializableDictDot):
             )
 
         self.expectations[found_expectation_indexes[0]].patch(op, path, value)
+        self._invalidate_expectation_indexes()
         return self.expectations[found_expectation_indexes[0]]
 
     def add_expectation(
@@ -408,9 +582,9 @@ class ExpectationSuite(SerializableDictDot):
             #   .kwargs, expectation_configuration.kwargs)
             # patch_expectation.apply(self.expectations[found_expectation_index].kwargs, in_place=True)
             if overwrite_existing:
-                self.expectations[
-                    found_expectation_indexes[0]
-                ] = expectation_configuration
+                self._set_expectation(
+                    found_expectation_indexes[0], expectation_configuration
+                )
             else:
                 raise DataContextError(
                     "A matching ExpectationConfiguration already exists. If you would like to overwrite this "
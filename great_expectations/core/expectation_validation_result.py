@@ -1,6 +1,6 @@
 import json
 import logging
-from copy import deepcopy
+from copy import copy
 
 from great_expectations.core.expectation_configuration import (
     ExpectationConfigurationSchema,
@@ -234,7 +234,7 @@ class ExpectationValidationResultSchema(Schema):
     # noinspection PyUnusedLocal
     @pre_dump
     def convert_result_to_serializable(self, data, **kwargs):
-        data = deepcopy(data)
+        data = copy(data)
         data.result = convert_to_json_serializable(data.result)
         return data
 
@@ -303,7 +303,8 @@ class ExpectationSuiteValidationResult(SerializableDictDot):
         return json.dumps(self.to_json_dict(), indent=2)
 
     def to_json_dict(self):
-        myself = deepcopy(self)
+        # convert_to_json_serializable returns new objects, so a shallow copy is enough to leave self unchanged
+        myself = copy(self)
         # NOTE - JPC - 20191031: migrate to expectation-specific schemas that subclass result with properly-typed
         # schemas to get serialization all-the-way down via dump
         myself["evaluation_parameters"] = convert_to_json_serializable(
@@ -365,7 +366,7 @@ class ExpectationSuiteValidationResultSchema(Schema):
     # noinspection PyUnusedLocal
     @pre_dump
     def prepare_dump(self, data, **kwargs):
-        data = deepcopy(data)
+        data = copy(data)
         data.meta = convert_to_json_serializable(data.meta)
         return data
 
@@ -0,0 +1,289 @@
+import datetime
+import json
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Pattern
+
+import jsonschema
+import numpy as np
+import pandas as pd
+from dateutil.parser import parse
+
+logger = logging.getLogger(__name__)
+
+# Columns shorter than this are evaluated directly; factorizing them costs more than it saves.
+CATEGORICAL_FAST_PATH_MIN_ROWS = 10000
+# Number of leading values inspected to estimate whether a column is low-cardinality.
+CARDINALITY_SAMPLE_SIZE = 1000
+# Maximum ratio of distinct values to rows (in the sample) for a column to be treated as low-cardinality.
+LOW_CARDINALITY_RATIO = 0.1
+
+
+@lru_cache(maxsize=128)
+def _get_value_set_index(typed_value_set: tuple, dtype_name: str) -> pd.Index:
+    value_set = [value for _, value in typed_value_set]
+    if dtype_name == "object":
+        return pd.Index(value_set, dtype="object")
+    return pd.Index(value_set)
+
+
+def get_value_set_index(value_set: Iterable, dtype=None) -> pd.Index:
+    """Build (or fetch from cache) the hashed index used to test membership in value_set.
+
+    The index is cached by (value_set, dtype), so repeated expectations against the same value_set on columns of the
+    same dtype hash the value_set only once. The types of the members are part of the cache key, since values such as
+    1 and True compare (and hash) equal but build differently typed indexes.
+
+    Args:
+        value_set: the collection of values to test membership against
+        dtype: dtype of the column that will be tested
+
+    Returns:
+        a pandas Index over the values of value_set
+    """
+    dtype_name = str(dtype) if dtype is not None else ""
+    if isinstance(value_set, pd.Index):
+        return value_set
+    try:
+        return _get_value_set_index(
+            tuple((type(value), value) for value in value_set), dtype_name
+        )
+    except TypeError:
+        # unhashable members (e.g. lists) cannot be cached
+        return pd.Index(list(value_set), dtype="object")
+
+
+def is_low_cardinality(series: pd.Series) -> bool:
+    """Cheaply estimate whether series is worth evaluating through its distinct values rather than row by row."""
+    if len(series) < CATEGORICAL_FAST_PATH_MIN_ROWS:
+        return False
+    if pd.api.types.is_categorical_dtype(series.dtype):
+        return True
+    sample = series.iloc[:CARDINALITY_SAMPLE_SIZE]
+    try:
+        n_unique = sample.nunique(dropna=False)
+    except TypeError:
+        # unhashable values cannot be factorized
+        return False
+    return n_unique <= LOW_CARDINALITY_RATIO * len(sample)
+
+
+def _broadcast_codes(codes: np.ndarray, unique_mask: np.ndarray) -> np.ndarray:
+    """Map unique_mask to the rows through codes; rows with null values (code -1) are left False."""
+    mask = np.zeros(len(codes), dtype=np.bool_)
+    valid = codes >= 0
+    mask[valid] = unique_mask[codes[valid]]
+    return mask
+
+
+def column_values_in_set(column: pd.Series, value_set: Iterable) -> pd.Series:
+    """Compute a boolean Series that is True wherever column's value is a member of value_set.
+
+    Semantics match pandas.Series.isin. For categorical columns (and for large object columns that appear to be
+    low-cardinality, which are factorized first), membership is computed once per distinct value and broadcast back to
+    the rows through the category codes.
+
+    Args:
+        column: the pandas Series to evaluate
+        value_set: the collection of allowed values
+
+    Returns:
+        a boolean Series aligned with column
+    """
+    value_set_index = get_value_set_index(value_set, dtype=column.dtype)
+
+    if pd.api.types.is_categorical_dtype(column.dtype):
+        codes = np.asarray(column.cat.codes)
+        uniques = column.cat.categories
+    elif column.dtype == object and is_low_cardinality(column):
+        try:
+            codes, uniques = pd.factorize(column, sort=False)
+        except TypeError:
+            return column.isin(value_set_index)
+    else:
+        return column.isin(value_set_index)
+
+    unique_mask = np.asarray(uniques.isin(value_set_index), dtype=np.bool_)
+    mask = _broadcast_codes(codes=codes, unique_mask=unique_mask)
+    null_positions = np.flatnonzero(codes < 0)
+    if len(null_positions) > 0 and value_set_index.hasnans:
+        # None and NaN factorize together, but isin only matches each to itself
+        mask[null_positions] = np.asarray(
+            column.iloc[null_positions].isin(value_set_index), dtype=np.bool_
+        )
+    return pd.Series(mask, index=column.index, name=column.name)
+
+
+@lru_cache(maxsize=256)
+def get_compiled_regex(regex: str) -> Pattern:
+    """Compile regex, caching the compiled pattern by its pattern string."""
+    return re.compile(regex)
+
+
+def _is_string_series(series: pd.Series) -> bool:
+    return series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) in (
+        "string",
+        "empty",
+    )
+
+
+def map_unique_values(column: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """Apply func to every value of column, evaluating it only once per distinct value.
+
+    String and categorical columns are factorized and func is applied to the distinct values, with the results broadcast
+    back to the rows through the codes. Null rows are evaluated individually, since None and NaN factorize together but
+    need not map to the same result. Other columns (where distinct values could compare equal across types, e.g. 1 and
+    True) fall back to Series.map.
+
+    Args:
+        column: the pandas Series to map
+        func: a pure function of a single value
+
+    Returns:
+        a Series aligned with column holding func's result for each value
+    """
+    if len(column) == 0:
+        return column.map(func)
+
+    if pd.api.types.is_categorical_dtype(column.dtype):
+        codes = np.asarray(column.cat.codes)
+        uniques = column.cat.categories
+    elif _is_string_series(column):
+        codes, uniques = pd.factorize(column, sort=False)
+    else:
+        return column.map(func)
+
+    unique_results = np.empty(len(uniques), dtype=object)
+    unique_results[:] = [func(value) for value in uniques]
+    valid = codes >= 0
+    results = np.empty(len(codes), dtype=object)
+    results[valid] = unique_results[codes[valid]]
+    if not valid.all():
+        results[~valid] = [func(value) for value in column.to_numpy()[~valid]]
+    return pd.Series(results, index=column.index, name=column.name).infer_objects()
+
+
+def evaluate_condition_on_unique_values(
+    column: pd.Series, condition: Callable[[pd.Series], Any]
+) -> pd.Series:
+    """Evaluate a vectorized boolean condition on the distinct values of column and broadcast the result to its rows.
+
+    condition must be a pure function of each value (the result for a row may not depend on any other row). String and
+    categorical columns are factorized so that condition sees each distinct value once; null rows are passed through
+    condition separately. For any other column, condition is simply applied to column.
+
+    Args:
+        column: the pandas Series to evaluate
+        condition: a function mapping a Series to a boolean Series (or array) of the same length
+
+    Returns:
+        a boolean Series aligned with column
+    """
+    if pd.api.types.is_categorical_dtype(column.dtype):
+        codes = np.asarray(column.cat.codes)
+        uniques = column.cat.categories
+    elif _is_string_series(column):
+        codes, uniques = pd.factorize(column, sort=False)
+    else:
+        return condition(column)
+
+    unique_results = np.asarray(
+        condition(pd.Series(uniques, name=column.name)), dtype=np.bool_
+    )
+    valid = codes >= 0
+    results = np.empty(len(codes), dtype=np.bool_)
+    results[valid] = unique_results[codes[valid]]
+    if not valid.all():
+        results[~valid] = np.asarray(condition(column[~valid]), dtype=np.bool_)
+    return pd.Series(results, index=column.index, name=column.name)
+
+
+def _as_string_series(column: pd.Series) -> pd.Series:
+    if _is_string_series(column):
+        return column
+    return column.astype(str)
+
+
+def column_values_match_regex(column: pd.Series, regex: str) -> pd.Series:
+    """Equivalent to column.astype(str).str.contains(regex), using a cached compiled pattern over distinct values."""
+    pattern = get_compiled_regex(regex)
+    return map_unique_values(
+        _as_string_series(column),
+        lambda value: pattern.search(str(value)) is not None,
+    )
+
+
+def column_values_match_regex_list(
+    column: pd.Series, regex_list: List[str]
+) -> pd.DataFrame:
+    """Evaluate column_values_match_regex for each regex, returning one boolean column per regex."""
+    strings = _as_string_series(column)
+    regex_matches = [column_values_match_regex(strings, regex) for regex in regex_list]
+    return pd.concat(regex_matches, axis=1, ignore_index=True)
+
+
+def column_values_match_strftime_format(
+    column: pd.Series, strftime_format: str
+) -> pd.Series:
+    def is_parseable_by_format(val):
+        try:
+            datetime.datetime.strptime(val, strftime_format)
+            return True
+        except TypeError:
+            raise TypeError(
+                "Values passed to expect_column_values_to_match_strftime_format must be of type string.\n"
+                "If you want to validate a column of dates or timestamps, please call the expectation before "
+                "converting from string format."
+            )
+        except ValueError:
+            return False
+
+    return map_unique_values(column, is_parseable_by_format)
+
+
+def column_values_dateutil_parseable(column: pd.Series) -> pd.Series:
+    def is_parseable(val):
+        try:
+            if not isinstance(val, str):
+                raise TypeError(
+                    "Values passed to expect_column_values_to_be_dateutil_parseable must be of type string.\n"
+                    "If you want to validate a column of dates or timestamps, please call the expectation before "
+                    "converting from string format."
+                )
+
+            parse(val)
+            return True
+
+        except (ValueError, OverflowError):
+            return False
+
+    return map_unique_values(column, is_parseable)
+
+
+def column_values_json_parseable(column: pd.Series) -> pd.Series:
+    def is_json(val):
+        try:
+            json.loads(val)
+            return True
+        except (ValueError, TypeError):
+            return False
+
+    return map_unique_values(column, is_json)
+
+
+def column_values_match_json_schema(column: pd.Series, json_schema: dict) -> pd.Series:
+    # Equivalent to calling jsonschema.validate per value, but the schema is checked and the validator built only once.
+    validator_class = jsonschema.validators.validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    validator = validator_class(json_schema)
+
+    def matches_json_schema(val):
+        val_json = json.loads(val)
+        try:
+            validator.validate(val_json)
+            return True
+        except jsonschema.ValidationError:
+            return False
+
+    return map_unique_values(column, matches_json_schema)
@@ -1,25 +1,29 @@
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
-from great_expectations.execution_engine import (
-    ExecutionEngine,
-    PandasExecutionEngine,
-    SparkDFExecutionEngine,
-    SqlAlchemyExecutionEngine,
-)
 
 
 class ExecutionEngineAnonymizer(Anonymizer):
     def __init__(self, salt=None):
         super().__init__(salt=salt)
-
-        # ordered bottom up in terms of inheritance order
-        self._ge_classes = [
-            PandasExecutionEngine,
-            SparkDFExecutionEngine,
-            SqlAlchemyExecutionEngine,
-            ExecutionEngine,
-        ]
+        self._ge_classes = None
 
     def anonymize_execution_engine_info(self, name, config):
+        if self._ge_classes is None:
+            # Imported here so that creating a usage statistics handler does not import every execution engine
+            from great_expectations.execution_engine import (
+                ExecutionEngine,
+                PandasExecutionEngine,
+                SparkDFExecutionEngine,
+                SqlAlchemyExecutionEngine,
+            )
+
+            # ordered bottom up in terms of inheritance order
+            self._ge_classes = [
+                PandasExecutionEngine,
+                SparkDFExecutionEngine,
+                SqlAlchemyExecutionEngine,
+                ExecutionEngine,
+            ]
+
         anonymized_info_dict = dict()
         anonymized_info_dict["anonymized_name"] = self.anonymize(name)
 
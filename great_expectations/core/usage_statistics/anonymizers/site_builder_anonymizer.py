@@ -1,21 +1,26 @@
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
-from great_expectations.render.renderer.site_builder import (
-    DefaultSiteIndexBuilder,
-    DefaultSiteSectionBuilder,
-    SiteBuilder,
-)
 
 
 class SiteBuilderAnonymizer(Anonymizer):
     def __init__(self, salt=None):
         super().__init__(salt=salt)
-        self._ge_classes = [
-            SiteBuilder,
-            DefaultSiteSectionBuilder,
-            DefaultSiteIndexBuilder,
-        ]
+        self._ge_classes = None
 
     def anonymize_site_builder_info(self, site_builder_config):
+        if self._ge_classes is None:
+            # Imported here so that creating a usage statistics handler does not import the render stack
+            from great_expectations.render.renderer.site_builder import (
+                DefaultSiteIndexBuilder,
+                DefaultSiteSectionBuilder,
+                SiteBuilder,
+            )
+
+            self._ge_classes = [
+                SiteBuilder,
+                DefaultSiteSectionBuilder,
+                DefaultSiteIndexBuilder,
+            ]
+
         class_name = site_builder_config.get("class_name")
         module_name = site_builder_config.get("module_name")
         if module_name is None:
@@ -1,5 +1,6 @@
 import datetime
 import decimal
+import json
 import logging
 import sys
 from collections import OrderedDict
@@ -8,7 +9,6 @@ from typing import Any, Optional, Union
 
 import numpy as np
 import pandas as pd
-from IPython import get_ipython
 
 from great_expectations import exceptions as ge_exceptions
 from great_expectations.core.run_identifier import RunIdentifier
@@ -29,6 +29,14 @@ except ImportError:
         "Unable to load pyspark; install optional spark dependency if you will be working with Spark dataframes"
     )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    logger.debug(
+        "Unable to load orjson; install optional orjson dependency for faster serialization of validation results"
+    )
+
 
 def nested_update(d, u):
     """update d with items from u, recursively and joining elements"""
@@ -49,8 +57,12 @@ def nested_update(d, u):
 
 
 def in_jupyter_notebook():
+    # A notebook kernel always has IPython loaded; avoid paying for importing it anywhere else
+    ipython = sys.modules.get("IPython")
+    if ipython is None:
+        return False
     try:
-        shell = get_ipython().__class__.__name__
+        shell = ipython.get_ipython().__class__.__name__
         if shell == "ZMQInteractiveShell":
             return True  # Jupyter notebook or qtconsole
         elif shell == "TerminalInteractiveShell":
@@ -61,6 +73,34 @@ def in_jupyter_notebook():
         return False  # Probably standard Python interpreter
 
 
+# Types that are returned as-is by convert_to_json_serializable. Dispatch is on the exact type, so that subclasses
+# (e.g. numpy.float64, which subclasses float) still go through the full conversion.
+_JSON_PRIMITIVE_TYPES = frozenset([str, int, bool, type(None)])
+
+# dtype kinds whose arrays are converted to json serializable lists with a single vectorized tolist()
+_JSON_NUMERIC_DTYPE_KINDS = frozenset("biuf")
+
+
+def _is_json_numeric_dtype(dtype) -> bool:
+    # float128 (longdouble) does not convert to python floats in tolist()
+    return (
+        isinstance(dtype, np.dtype)
+        and dtype.kind in _JSON_NUMERIC_DTYPE_KINDS
+        and dtype.itemsize <= 8
+    )
+
+
+def _convert_numeric_array_to_json_serializable(data: np.ndarray) -> list:
+    """Convert a numeric numpy array to a (possibly nested) list, replacing NaN with None, without visiting each value
+    in python."""
+    if data.dtype.kind == "f":
+        nan_mask = np.isnan(data)
+        if nan_mask.any():
+            data = data.astype(object)
+            data[nan_mask] = None
+    return data.tolist()
+
+
 def convert_to_json_serializable(data):
     """
     Helper function to convert an object to one that is json serializable
@@ -72,6 +112,54 @@ def convert_to_json_serializable(data):
         test_obj may also be converted in place.
     """
 
+    # Fast paths for the types that make up the bulk of large results (e.g. unexpected_list), which avoid calling
+    # pd.isna on every scalar
+    data_type = type(data)
+    if data_type in _JSON_PRIMITIVE_TYPES:
+        return data
+
+    if data_type is float:
+        # NaN is the only value not equal to itself
+        return None if data != data else data
+
+    if data_type is dict:
+        return {
+            str(key): value
+            if type(value) in _JSON_PRIMITIVE_TYPES
+            else convert_to_json_serializable(value)
+            for key, value in data.items()
+        }
+
+    if data_type is list or data_type is tuple:
+        new_list = []
+        for value in data:
+            value_type = type(value)
+            if value_type in _JSON_PRIMITIVE_TYPES:
+                new_list.append(value)
+            elif value_type is float:
+                new_list.append(None if value != value else value)
+            else:
+                new_list.append(convert_to_json_serializable(value))
+        return new_list
+
+    if data_type is np.ndarray and _is_json_numeric_dtype(data.dtype):
+        return _convert_numeric_array_to_json_serializable(data)
+
+    if (
+        data_type is pd.Series
+        and _is_json_numeric_dtype(data.dtype)
+        and _is_json_numeric_dtype(data.index.dtype)
+    ):
+        index_name = data.index.name or "index"
+        value_name = data.name or "value"
+        return [
+            {index_name: idx, value_name: val}
+            for idx, val in zip(
+                _convert_numeric_array_to_json_serializable(data.index.to_numpy()),
+                _convert_numeric_array_to_json_serializable(data.to_numpy()),
+            )
+        ]
+
     # If it's one of our types, we use our own conversion; this can move to full schema
     # once nesting goes all the way down
     if isinstance(data, SerializableDictDot):
@@ -173,6 +261,28 @@ def convert_to_json_serializable(data):
         )
 
 
+def dumps_json_serializable(data, **kwargs) -> str:
+    """
+    Encode json serializable data (see convert_to_json_serializable) as a json string.
+
+    When orjson is installed and no json.dumps formatting options are given, it is used instead of the json module,
+    which it outperforms by several times on large payloads. Data that orjson cannot encode (e.g. integers wider than
+    64 bits) falls back to json.dumps.
+    Args:
+        data: json serializable data
+        **kwargs: options for json.dumps (e.g. indent, sort_keys)
+    Returns:
+        (str) The json string
+    """
+    if orjson is not None and not kwargs:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # orjson.JSONEncodeError is a TypeError
+            pass
+    return json.dumps(data, **kwargs)
+
+
 def ensure_json_serializable(data):
     """
     Helper function to convert an object to one that is json serializable
@@ -913,6 +913,10 @@ class DataAsset:
             for col in columns:
                 expectations_to_evaluate.extend(columns[col])
 
+            self._prefetch_expectation_metrics(
+                expectations_to_evaluate, runtime_evaluation_parameters, result_format
+            )
+
             for expectation in expectations_to_evaluate:
 
                 try:
@@ -1015,6 +1019,7 @@ class DataAsset:
             raise
         finally:
             self._active_validation = False
+            self._clear_prefetched_expectation_metrics()
 
         if getattr(data_context, "_usage_statistics_handler", None):
             handler = data_context._usage_statistics_handler
@@ -1025,6 +1030,26 @@ class DataAsset:
             )
         return result
 
+    def _prefetch_expectation_metrics(
+        self, expectations, evaluation_parameters=None, result_format=None
+    ):
+        """Hook called by validate with every expectation about to be evaluated, before any of them is evaluated.
+
+        Subclasses may override it to compute what several expectations need at once (e.g. in a single query), rather
+        than once per expectation. The default implementation does nothing.
+
+        Args:
+            expectations (List[ExpectationConfiguration]): the expectations that will be evaluated
+            evaluation_parameters (dict or None): the evaluation parameters available to the validation run
+            result_format (str, dict or None): the result_format passed to validate, which overrides the result_format \
+                of each expectation
+        """
+        pass
+
+    def _clear_prefetched_expectation_metrics(self):
+        """Hook called at the end of validate to discard whatever _prefetch_expectation_metrics computed."""
+        pass
+
     def get_evaluation_parameter(self, parameter_name, default_value=None):
         """Get an evaluation parameter value that has been stored in meta.
 
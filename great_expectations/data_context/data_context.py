@@ -9,12 +9,13 @@ import logging
 import os
 import shutil
 import sys
+import time
 import traceback
 import uuid
 import warnings
 import webbrowser
 from collections import OrderedDict
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union, cast
 
 from dateutil.parser import parse
 from ruamel.yaml import YAML, YAMLError
@@ -78,9 +79,9 @@ from great_expectations.datasource import LegacyDatasource
 from great_expectations.datasource.new_datasource import BaseDatasource, Datasource
 from great_expectations.marshmallow__shade import ValidationError
 from great_expectations.profile.basic_dataset_profiler import BasicDatasetProfiler
-from great_expectations.render.renderer.site_builder import SiteBuilder
 from great_expectations.util import (
     filter_properties_dict,
+    invalidate_sqlalchemy_metadata_cache,
     verify_dynamic_loading_support,
 )
 from great_expectations.validator.validator import BridgeValidator, Validator
@@ -92,6 +93,10 @@ except ImportError:
     # just fall through
     SQLAlchemyError = ge_exceptions.ProfilerError
 
+if TYPE_CHECKING:
+    # The render stack is only imported when data docs are built (see _load_site_builder_from_site_config)
+    from great_expectations.render.renderer.site_builder import SiteBuilder
+
 logger = logging.getLogger(__name__)
 yaml = YAML()
 yaml.indent(mapping=2, sequence=4, offset=2)
@@ -293,6 +298,8 @@ class BaseDataContext:
 
         # Store cached datasources but don't init them
         self._cached_datasources = {}
+        # Set by start_session(); holds the suites and refresh time of a long-running session
+        self._session = None
 
         # Build the datasources we know about and have access to
         self._init_datasources(self.project_config_with_variables_substituted)
@@ -656,7 +663,7 @@ class BaseDataContext:
 
         return site_urls
 
-    def _load_site_builder_from_site_config(self, site_config) -> SiteBuilder:
+    def _load_site_builder_from_site_config(self, site_config) -> "SiteBuilder":
         default_module_name = "great_expectations.render.renderer.site_builder"
         site_builder = instantiate_class_from_config(
             config=site_config,
@@ -1482,6 +1489,8 @@ class BaseDataContext:
 
         This method attempts to return any number of batches, including an empty list.
         """
+        if self._session is not None:
+            self._expire_session_if_stale()
 
         datasource_name: str
         if batch_request:
@@ -1956,6 +1965,8 @@ class BaseDataContext:
             )
         else:
             self.expectations_store.set(key, expectation_suite)
+            if self._session is not None:
+                self._session["expectation_suites"].pop(expectation_suite_name, None)
 
         return expectation_suite
 
@@ -1975,6 +1986,8 @@ class BaseDataContext:
             )
         else:
             self.expectations_store.remove_key(key)
+            if self._session is not None:
+                self._session["expectation_suites"].pop(expectation_suite_name, None)
             return True
 
     def get_expectation_suite(self, expectation_suite_name):
@@ -1986,6 +1999,18 @@ class BaseDataContext:
         Returns:
             expectation_suite
         """
+        if self._session is not None:
+            self._expire_session_if_stale()
+            session_suites = self._session["expectation_suites"]
+            if expectation_suite_name not in session_suites:
+                session_suites[
+                    expectation_suite_name
+                ] = self._get_expectation_suite_from_store(expectation_suite_name)
+            return copy.deepcopy(session_suites[expectation_suite_name])
+
+        return self._get_expectation_suite_from_store(expectation_suite_name)
+
+    def _get_expectation_suite_from_store(self, expectation_suite_name):
         key = ExpectationSuiteIdentifier(expectation_suite_name=expectation_suite_name)
 
         if self.expectations_store.has_key(key):
@@ -1995,6 +2020,51 @@ class BaseDataContext:
                 "expectation_suite %s not found" % expectation_suite_name
             )
 
+    def start_session(self, ttl_seconds: Optional[float] = None) -> None:
+        """Keep parsed expectation suites and data connector reference caches between requests, for long-running
+        services that validate many batches with the same DataContext.
+
+        Datasources and their execution engines (and so their database connections and Spark sessions) are always
+        kept by the DataContext. In a session, get_expectation_suite additionally returns copies of suites parsed on
+        first use, and data connectors keep the data references they listed until the session is refreshed. Saving,
+        creating or deleting a suite through this DataContext updates the session immediately.
+
+        Args:
+            ttl_seconds: if set, cached suites and data references are reloaded on the first request made more than
+                ttl_seconds after the last refresh. If None, they are kept until refresh_session() is called.
+        """
+        self._session = {
+            "ttl_seconds": ttl_seconds,
+            "refreshed_at": time.monotonic(),
+            "expectation_suites": {},
+        }
+
+    def refresh_session(self) -> None:
+        """Discard the expectation suites and SQL table and column metadata cached by the current session, and bring
+        data connector references up to date (incrementally, for data connectors that support it)."""
+        if self._session is None:
+            return
+        self._session["expectation_suites"].clear()
+        invalidate_sqlalchemy_metadata_cache()
+        for datasource in self._cached_datasources.values():
+            for data_connector in getattr(datasource, "data_connectors", {}).values():
+                if data_connector._data_references_cache is not None:
+                    data_connector._refresh_data_references_cache_incrementally()
+        self._session["refreshed_at"] = time.monotonic()
+
+    def end_session(self) -> None:
+        """Stop caching expectation suites; subsequent requests read them from the expectations store again."""
+        self._session = None
+
+    def _expire_session_if_stale(self) -> None:
+        ttl_seconds = self._session["ttl_seconds"]
+        if (
+            ttl_seconds is not None
+            and time.monotonic() - self._session["refreshed_at"] > ttl_seconds
+        ):
+            logger.debug("Session TTL expired; refreshing cached suites and data references")
+            self.refresh_session()
+
     def list_expectation_suite_names(self):
         """Lists the available expectation suite names"""
         sorted_expectation_suite_names = [
@@ -2029,6 +2099,10 @@ class BaseDataContext:
             )
 
         self.expectations_store.set(key, expectation_suite)
+        if self._session is not None:
+            self._session["expectation_suites"].pop(
+                key.expectation_suite_name, None
+            )
         self._evaluation_parameter_dependencies_compiled = False
 
     def _store_metrics(self, requested_metrics, validation_results, target_store_name):
@@ -2059,6 +2133,7 @@ class BaseDataContext:
             "data_asset_name"
         )
 
+        metrics_to_store = []
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (
                 expectation_suite_dependency != expectation_suite_name
@@ -2080,19 +2155,21 @@ class BaseDataContext:
                         metric_value = validation_results.get_metric(
                             metric_name, **metric_kwargs
                         )
-                        self.stores[target_store_name].set(
-                            ValidationMetricIdentifier(
-                                run_id=run_id,
-                                data_asset_name=data_asset_name,
-                                expectation_suite_identifier=ExpectationSuiteIdentifier(
-                                    expectation_suite_name
-                                ),
-                                metric_name=metric_name,
-                                metric_kwargs_id=get_metric_kwargs_id(
-                                    metric_name, metric_kwargs
+                        metrics_to_store.append(
+                            (
+                                ValidationMetricIdentifier(
+                                    run_id=run_id,
+                                    data_asset_name=data_asset_name,
+                                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                                        expectation_suite_name
+                                    ),
+                                    metric_name=metric_name,
+                                    metric_kwargs_id=get_metric_kwargs_id(
+                                        metric_name, metric_kwargs
+                                    ),
                                 ),
-                            ),
-                            metric_value,
+                                metric_value,
+                            )
                         )
                     except ge_exceptions.UnavailableMetricError:
                         # This will happen frequently in larger pipelines
@@ -2101,6 +2178,10 @@ class BaseDataContext:
                             "this validation result.".format(metric_name)
                         )
 
+        # Write all metrics of this validation result in one round trip where the store backend supports it
+        if metrics_to_store:
+            self.stores[target_store_name].set_many(metrics_to_store)
+
     def store_validation_result_metrics(
         self, requested_metrics, validation_results, target_store_name
     ):
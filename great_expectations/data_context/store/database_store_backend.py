@@ -9,6 +9,7 @@ from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.util import (
     filter_properties_dict,
     get_currently_executing_function_call_arguments,
+    get_sqlalchemy_engine,
 )
 
 try:
@@ -18,9 +19,12 @@ try:
         MetaData,
         String,
         Table,
+        UniqueConstraint,
         and_,
+        bindparam,
         column,
         create_engine,
+        or_,
         select,
         text,
     )
@@ -34,8 +38,37 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Fragments of the (lowercased) errors raised by an upsert into a table without a unique constraint on the key
+# columns, i.e. without a target for ON CONFLICT
+UPSERT_MISSING_CONFLICT_TARGET_ERROR_MESSAGES = (
+    # postgresql
+    "no unique or exclusion constraint matching the on conflict specification",
+    # sqlite
+    "on conflict clause does not match any primary key or unique constraint",
+)
+# SQLSTATE of the postgresql error above (invalid_column_reference)
+UPSERT_MISSING_CONFLICT_TARGET_PGCODE = "42P10"
+
+
+def _is_upsert_missing_conflict_target_error(error) -> bool:
+    """Whether error was raised because the table has no unique constraint on the key columns for an upsert."""
+    original_error = getattr(error, "orig", None)
+    if (
+        getattr(original_error, "pgcode", None)
+        == UPSERT_MISSING_CONFLICT_TARGET_PGCODE
+    ):
+        return True
+    message = str(original_error if original_error is not None else error).lower()
+    return any(
+        fragment in message
+        for fragment in UPSERT_MISSING_CONFLICT_TARGET_ERROR_MESSAGES
+    )
+
 
 class DatabaseStoreBackend(StoreBackend):
+    # Number of keys read or written per statement by get_many and set_many
+    BULK_OPERATION_BATCH_SIZE = 500
+
     def __init__(
         self,
         table_name,
@@ -81,10 +114,10 @@ class DatabaseStoreBackend(StoreBackend):
         elif credentials is not None:
             self.engine = self._build_engine(credentials=credentials, **kwargs)
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = get_sqlalchemy_engine(connection_string, **kwargs)
         elif url is not None:
             self.drivername = urlparse(url).scheme
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = get_sqlalchemy_engine(url, **kwargs)
         else:
             raise ge_exceptions.InvalidConfigError(
                 "Credentials, url, connection_string, or an engine are required for a DatabaseStoreBackend."
@@ -123,6 +156,8 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Unable to connect to table {table_name} because of an error. It is possible your table needs to be migrated to a new schema.  SqlAlchemyError: {str(e)}"
                 )
         self._table = table
+        # MySQL's ON DUPLICATE KEY UPDATE inserts duplicates into a table without a unique key instead of failing
+        self._use_upsert = self._has_unique_key_constraint()
         # Initialize with store_backend_id
         self._store_backend_id = None
         self._store_backend_id = self.store_backend_id
@@ -177,7 +212,7 @@ class DatabaseStoreBackend(StoreBackend):
 
         self.drivername = drivername
 
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = get_sqlalchemy_engine(options, **create_engine_kwargs)
         return engine
 
     def _get_sqlalchemy_key_pair_auth_url(
@@ -249,31 +284,189 @@ class DatabaseStoreBackend(StoreBackend):
             logger.debug("Error fetching value: " + str(e))
             raise ge_exceptions.StoreError("Unable to fetch value for key: " + str(key))
 
+    def _key_condition(self, key):
+        return and_(
+            *[
+                getattr(self._table.columns, key_col) == val
+                for key_col, val in zip(self.key_columns, key)
+            ]
+        )
+
+    def _get_many(self, keys):
+        values = {}
+        key_columns = [getattr(self._table.columns, col) for col in self.key_columns]
+        for start in range(0, len(keys), self.BULK_OPERATION_BATCH_SIZE):
+            sel = select(key_columns + [self._table.columns.value]).where(
+                or_(
+                    *[
+                        self._key_condition(key)
+                        for key in keys[start : start + self.BULK_OPERATION_BATCH_SIZE]
+                    ]
+                )
+            )
+            try:
+                for row in self.engine.execute(sel).fetchall():
+                    values[tuple(row[:-1])] = row[-1]
+            except SQLAlchemyError as e:
+                logger.debug("Error fetching values: " + str(e))
+                raise ge_exceptions.StoreError("Unable to fetch values for keys")
+        for key in keys:
+            if tuple(key) not in values:
+                raise ge_exceptions.StoreError(
+                    "Unable to fetch value for key: " + str(key)
+                )
+        return [values[tuple(key)] for key in keys]
+
     def _set(self, key, value, allow_update=True):
-        cols = {k: v for (k, v) in zip(self.key_columns, key)}
-        cols["value"] = value
-
-        if allow_update:
-            if self.has_key(key):
-                ins = (
-                    self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
-                    .values(**cols)
+        self._set_many([(key, value)], allow_update=allow_update)
+
+    def _set_many(self, key_value_pairs, allow_update=True):
+        """Write all key_value_pairs in one transaction: with a single upsert statement executed for all rows where the
+        dialect supports one, and otherwise with one query for the keys that exist, followed by a bulk INSERT of the
+        new keys and a bulk UPDATE of the existing ones."""
+        rows = {}
+        for key, value in key_value_pairs:
+            row = {k: v for (k, v) in zip(self.key_columns, key)}
+            row["value"] = value
+            rows[tuple(key)] = row
+        if not rows:
+            return
+
+        if not allow_update:
+            self._insert_many(list(rows.values()))
+            return
+
+        upsert = self._build_upsert_statement() if self._use_upsert else None
+        if upsert is not None:
+            try:
+                with self.engine.begin() as connection:
+                    connection.execute(upsert, list(rows.values()))
+                return
+            except SQLAlchemyError as e:
+                # Only a table that cannot support upserts (e.g., a pre-existing table without a primary key on the
+                # key columns) disables them; any other error (a lost connection, bad data) may be transient.
+                if not _is_upsert_missing_conflict_target_error(e):
+                    raise ge_exceptions.StoreBackendError(
+                        f"Unable to store values: got sqlalchemy error {str(e)}"
+                    )
+                logger.debug(
+                    f"Upsert into {self._table} failed ({str(e)}); falling back to separate INSERT and UPDATE."
                 )
-            else:
-                ins = self._table.insert().values(**cols)
-        else:
-            ins = self._table.insert().values(**cols)
+                self._use_upsert = False
 
         try:
-            self.engine.execute(ins)
-        except IntegrityError as e:
-            if self._get(key) == value:
-                logger.info(f"Key {str(key)} already exists with the same value.")
-            else:
-                raise ge_exceptions.StoreBackendError(
-                    f"Integrity error {str(e)} while trying to store key"
+            with self.engine.begin() as connection:
+                self._insert_or_update_many(connection=connection, rows=rows)
+        except SQLAlchemyError as e:
+            raise ge_exceptions.StoreBackendError(
+                f"Unable to store values: got sqlalchemy error {str(e)}"
+            )
+
+    def _insert_or_update_many(self, connection, rows):
+        existing_keys = set()
+        keys = list(rows.keys())
+        key_columns = [getattr(self._table.columns, col) for col in self.key_columns]
+        for start in range(0, len(keys), self.BULK_OPERATION_BATCH_SIZE):
+            sel = select(key_columns).where(
+                or_(
+                    *[
+                        self._key_condition(key)
+                        for key in keys[start : start + self.BULK_OPERATION_BATCH_SIZE]
+                    ]
+                )
+            )
+            existing_keys.update(
+                tuple(row) for row in connection.execute(sel).fetchall()
+            )
+
+        new_rows = [row for key, row in rows.items() if key not in existing_keys]
+        if new_rows:
+            connection.execute(self._table.insert(), new_rows)
+
+        updated_rows = [
+            dict(
+                {f"_key_{col}": row[col] for col in self.key_columns},
+                _value=row["value"],
+            )
+            for key, row in rows.items()
+            if key in existing_keys
+        ]
+        if updated_rows:
+            update = (
+                self._table.update()
+                .where(
+                    and_(
+                        *[
+                            getattr(self._table.columns, col)
+                            == bindparam(f"_key_{col}")
+                            for col in self.key_columns
+                        ]
+                    )
                 )
+                .values(value=bindparam("_value"))
+            )
+            connection.execute(update, updated_rows)
+
+    def _insert_many(self, rows):
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(self._table.insert(), rows)
+        except IntegrityError:
+            # At least one key exists already; that is only an error if it holds a different value
+            for row in rows:
+                key = tuple(row[col] for col in self.key_columns)
+                try:
+                    self.engine.execute(self._table.insert().values(**row))
+                except IntegrityError as e:
+                    if self._get(key) == row["value"]:
+                        logger.info(
+                            f"Key {str(key)} already exists with the same value."
+                        )
+                    else:
+                        raise ge_exceptions.StoreBackendError(
+                            f"Integrity error {str(e)} while trying to store key"
+                        )
+
+    def _has_unique_key_constraint(self) -> bool:
+        """Whether the primary key, a unique constraint or a unique index of the table is on exactly the key columns,
+        which upserts need to find the row to update."""
+        unique_column_sets = [self._table.primary_key.columns]
+        unique_column_sets.extend(
+            constraint.columns
+            for constraint in self._table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        )
+        unique_column_sets.extend(
+            index.columns for index in self._table.indexes if index.unique
+        )
+        return any(
+            {str(col.name).lower() for col in columns} == set(self.key_columns)
+            for columns in unique_column_sets
+        )
+
+    def _build_upsert_statement(self):
+        """An INSERT ... ON CONFLICT (or ON DUPLICATE KEY) UPDATE statement for dialects that support one, else None."""
+        dialect_name = self.engine.dialect.name
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect_name == "sqlite":
+            from sqlalchemy.dialects import sqlite
+
+            # sqlite.insert, with on_conflict_do_update, is available in SQLAlchemy>=1.4
+            insert = getattr(sqlite, "insert", None)
+            if insert is None:
+                return None
+        elif dialect_name == "mysql":
+            from sqlalchemy.dialects.mysql import insert
+
+            statement = insert(self._table)
+            return statement.on_duplicate_key_update(value=statement.inserted.value)
+        else:
+            return None
+        statement = insert(self._table)
+        return statement.on_conflict_do_update(
+            index_elements=self.key_columns, set_={"value": statement.excluded.value}
+        )
 
     def _move(self):
         raise NotImplementedError
@@ -7,6 +7,7 @@ from great_expectations.data_context.store.store import Store
 from great_expectations.util import (
     filter_properties_dict,
     get_currently_executing_function_call_arguments,
+    get_sqlalchemy_engine,
 )
 
 try:
@@ -18,7 +19,6 @@ try:
         Table,
         and_,
         column,
-        create_engine,
         select,
         text,
     )
@@ -26,7 +26,6 @@ try:
     from sqlalchemy.exc import SQLAlchemyError
 except ImportError:
     sqlalchemy = None
-    create_engine = None
 
 
 logger = logging.getLogger(__name__)
@@ -78,11 +77,11 @@ class SqlAlchemyQueryStore(Store):
         if "engine" in credentials:
             self.engine = credentials["engine"]
         elif "url" in credentials:
-            self.engine = create_engine(credentials["url"])
+            self.engine = get_sqlalchemy_engine(credentials["url"])
         else:
             drivername = credentials.pop("drivername")
             options = URL(drivername, **credentials)
-            self.engine = create_engine(options)
+            self.engine = get_sqlalchemy_engine(options)
 
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
@@ -133,6 +133,29 @@ class Store:
                 self.key_to_tuple(key), self.serialize(key, value)
             )
 
+    def get_many(self, keys):
+        """Return the deserialized values of keys, in the same order, fetching them from the backend in bulk."""
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        values = self._store_backend.get_many([self.key_to_tuple(key) for key in keys])
+        return [
+            self.deserialize(key, value) if value else None
+            for key, value in zip(keys, values)
+        ]
+
+    def set_many(self, key_value_pairs):
+        """Serialize and store several values at once, writing them to the backend in bulk."""
+        key_value_pairs = list(key_value_pairs)
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+        return self._store_backend.set_many(
+            [
+                (self.key_to_tuple(key), self.serialize(key, value))
+                for key, value in key_value_pairs
+            ]
+        )
+
     def list_keys(self):
         keys_without_store_backend_id = [
             key
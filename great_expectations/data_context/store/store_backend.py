@@ -125,6 +125,28 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def get_many(self, keys, **kwargs):
+        """Return the values of keys, in the same order; backends that can fetch several keys in one request
+        override _get_many."""
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        return self._get_many(keys, **kwargs)
+
+    def set_many(self, key_value_pairs, **kwargs):
+        """Set several keys at once; backends that can write several keys in one request override _set_many."""
+        key_value_pairs = list(key_value_pairs)
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+            self._validate_value(value)
+        try:
+            return self._set_many(key_value_pairs, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
     def move(self, source_key, dest_key, **kwargs):
         self._validate_key(source_key)
         self._validate_key(dest_key)
@@ -172,6 +194,12 @@ class StoreBackend(metaclass=ABCMeta):
     def _set(self, key, value, **kwargs):
         raise NotImplementedError
 
+    def _get_many(self, keys, **kwargs):
+        return [self._get(key, **kwargs) for key in keys]
+
+    def _set_many(self, key_value_pairs, **kwargs):
+        return [self._set(key, value, **kwargs) for key, value in key_value_pairs]
+
     @abstractmethod
     def _move(self, source_key, dest_key, **kwargs):
         raise NotImplementedError
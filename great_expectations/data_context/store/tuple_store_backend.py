@@ -5,6 +5,7 @@ import random
 import re
 import shutil
 from abc import ABCMeta
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
 
 from great_expectations.data_context.store.store_backend import StoreBackend
@@ -16,6 +17,18 @@ from great_expectations.util import (
 
 logger = logging.getLogger(__name__)
 
+# Number of requests get_many and set_many keep in flight at once on remote store backends
+MAX_CONCURRENT_REQUESTS = 16
+
+
+def _map_concurrently(fn, items, max_workers):
+    """Apply fn to every item, on up to max_workers threads, and return the results in the order of items."""
+    items = list(items)
+    if len(items) <= 1 or max_workers <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fn, items))
+
 
 class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     r"""
@@ -24,13 +37,20 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
 
     For example, in the following template path: expectations/{0}/{1}/{2}/prefix-{2}.json, keys must have
     three components.
+
+    Values are always written with filepath_suffix; alternate_filepath_suffixes lists further suffixes under which
+    existing values are found by get, has_key and list_keys (e.g. ".json" results written before a store switched to
+    ".json.gz"). Values stored under a suffix in BINARY_FILEPATH_SUFFIXES are returned as bytes, all others as str.
     """
 
+    BINARY_FILEPATH_SUFFIXES = (".gz", ".zst", ".msgpack")
+
     def __init__(
         self,
         filepath_template=None,
         filepath_prefix=None,
         filepath_suffix=None,
+        alternate_filepath_suffixes=None,
         forbidden_substrings=None,
         platform_specific_separator=True,
         fixed_length_key=False,
@@ -54,6 +74,10 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             raise ValueError(
                 "filepath_suffix may only be used when filepath_template is None"
             )
+        if alternate_filepath_suffixes and filepath_suffix is None:
+            raise ValueError(
+                "alternate_filepath_suffixes may only be used when filepath_suffix is set"
+            )
 
         self.filepath_template = filepath_template
         if filepath_prefix and len(filepath_prefix) > 0:
@@ -66,6 +90,11 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
                 )
         self.filepath_prefix = filepath_prefix
         self.filepath_suffix = filepath_suffix
+        self.alternate_filepath_suffixes = [
+            suffix
+            for suffix in (alternate_filepath_suffixes or [])
+            if suffix != filepath_suffix
+        ]
         self.base_public_path = base_public_path
 
         if filepath_template is not None:
@@ -100,7 +129,26 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
                 )
             )
 
-    def _convert_key_to_filepath(self, key):
+    @property
+    def readable_filepath_suffixes(self):
+        """The suffix values are written with, followed by the alternate suffixes existing values may be read from."""
+        return [self.filepath_suffix] + self.alternate_filepath_suffixes
+
+    def _get_filepath_suffix(self, filepath):
+        """Return the (longest) readable suffix filepath ends with, or None if it has none of them."""
+        matching_suffixes = [
+            suffix
+            for suffix in self.readable_filepath_suffixes
+            if suffix and filepath.endswith(suffix)
+        ]
+        if not matching_suffixes:
+            return None
+        return max(matching_suffixes, key=len)
+
+    def _is_binary_filepath(self, filepath):
+        return filepath.endswith(self.BINARY_FILEPATH_SUFFIXES)
+
+    def _convert_key_to_filepath(self, key, filepath_suffix=None):
         # NOTE: This method uses a hard-coded forward slash as a separator,
         # and then replaces that with a platform-specific separator if requested (the default)
         self._validate_key(key)
@@ -119,8 +167,10 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
 
         if self.filepath_prefix:
             converted_string = self.filepath_prefix + "/" + converted_string
-        if self.filepath_suffix:
-            converted_string += self.filepath_suffix
+        if filepath_suffix is None:
+            filepath_suffix = self.filepath_suffix
+        if filepath_suffix:
+            converted_string += filepath_suffix
         if self.platform_specific_separator:
             converted_string = os.path.normpath(converted_string)
 
@@ -147,14 +197,15 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
                 filepath = filepath[len(self.filepath_prefix) + 1 :]
 
         if self.filepath_suffix:
-            if not filepath.endswith(self.filepath_suffix):
+            filepath_suffix = self._get_filepath_suffix(filepath)
+            if filepath_suffix is None:
                 # If filepath_suffix is set, we expect that it is the last component of a valid filepath.
                 raise ValueError(
                     "filepath must end with the filepath_suffix when one is set by the store_backend"
                 )
             else:
                 # Remove the suffix before processing
-                filepath = filepath[: -len(self.filepath_suffix)]
+                filepath = filepath[: -len(filepath_suffix)]
 
         if self.filepath_template:
             # filepath_template is always specified with forward slashes, but it is then
@@ -236,6 +287,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         filepath_template=None,
         filepath_prefix=None,
         filepath_suffix=None,
+        alternate_filepath_suffixes=None,
         forbidden_substrings=None,
         platform_specific_separator=True,
         root_directory=None,
@@ -249,6 +301,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             filepath_template=filepath_template,
             filepath_prefix=filepath_prefix,
             filepath_suffix=filepath_suffix,
+            alternate_filepath_suffixes=alternate_filepath_suffixes,
             forbidden_substrings=forbidden_substrings,
             platform_specific_separator=platform_specific_separator,
             fixed_length_key=fixed_length_key,
@@ -292,15 +345,24 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         filepath: str = os.path.join(
             self.full_base_directory, self._convert_key_to_filepath(key)
         )
-        try:
-            with open(filepath) as infile:
-                contents: str = infile.read()
-        except FileNotFoundError:
-            raise InvalidKeyError(
-                f"Unable to retrieve object from TupleFilesystemStoreBackend with the following Key: {str(filepath)}"
+        for filepath_suffix in self.readable_filepath_suffixes:
+            candidate_filepath: str = os.path.join(
+                self.full_base_directory,
+                self._convert_key_to_filepath(key, filepath_suffix=filepath_suffix),
             )
+            try:
+                if self._is_binary_filepath(candidate_filepath):
+                    with open(candidate_filepath, "rb") as infile:
+                        return infile.read()
+                with open(candidate_filepath) as infile:
+                    contents: str = infile.read()
+                return contents
+            except FileNotFoundError:
+                continue
 
-        return contents
+        raise InvalidKeyError(
+            f"Unable to retrieve object from TupleFilesystemStoreBackend with the following Key: {str(filepath)}"
+        )
 
     def _set(self, key, value, **kwargs):
         if not isinstance(key, tuple):
@@ -337,6 +399,8 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
 
     def list_keys(self, prefix=()):
         key_list = []
+        # A key may be stored under more than one of the readable_filepath_suffixes
+        found_keys = set()
         for root, dirs, files in os.walk(
             os.path.join(self.full_base_directory, *prefix)
         ):
@@ -355,12 +419,14 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                     self.filepath_prefix
                 ):
                     continue
-                elif self.filepath_suffix and not filepath.endswith(
+                elif (
                     self.filepath_suffix
+                    and self._get_filepath_suffix(filepath) is None
                 ):
                     continue
                 key = self._convert_filepath_to_key(filepath)
-                if key and not self.is_ignored_key(key):
+                if key and not self.is_ignored_key(key) and key not in found_keys:
+                    found_keys.add(key)
                     key_list.append(key)
 
         return key_list
@@ -383,16 +449,19 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         if not isinstance(key, tuple):
             key = key.to_tuple()
 
-        filepath = os.path.join(
-            self.full_base_directory, self._convert_key_to_filepath(key)
-        )
-
-        if os.path.exists(filepath):
-            d_path = os.path.dirname(filepath)
-            os.remove(filepath)
-            self.rrmdir(self.full_base_directory, d_path)
-            return True
-        return False
+        # The key may be stored under any of the readable suffixes, and get would return a copy left behind
+        removed = False
+        for filepath_suffix in self.readable_filepath_suffixes:
+            filepath = os.path.join(
+                self.full_base_directory,
+                self._convert_key_to_filepath(key, filepath_suffix=filepath_suffix),
+            )
+            if os.path.exists(filepath):
+                d_path = os.path.dirname(filepath)
+                os.remove(filepath)
+                self.rrmdir(self.full_base_directory, d_path)
+                removed = True
+        return removed
 
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
@@ -415,8 +484,14 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         return public_url
 
     def _has_key(self, key):
-        return os.path.isfile(
-            os.path.join(self.full_base_directory, self._convert_key_to_filepath(key))
+        return any(
+            os.path.isfile(
+                os.path.join(
+                    self.full_base_directory,
+                    self._convert_key_to_filepath(key, filepath_suffix=filepath_suffix),
+                )
+            )
+            for filepath_suffix in self.readable_filepath_suffixes
         )
 
     @property
@@ -440,6 +515,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         filepath_template=None,
         filepath_prefix=None,
         filepath_suffix=None,
+        alternate_filepath_suffixes=None,
         forbidden_substrings=None,
         platform_specific_separator=False,
         fixed_length_key=False,
@@ -448,11 +524,13 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        max_concurrent_requests=MAX_CONCURRENT_REQUESTS,
     ):
         super().__init__(
             filepath_template=filepath_template,
             filepath_prefix=filepath_prefix,
             filepath_suffix=filepath_suffix,
+            alternate_filepath_suffixes=alternate_filepath_suffixes,
             forbidden_substrings=forbidden_substrings,
             platform_specific_separator=platform_specific_separator,
             fixed_length_key=fixed_length_key,
@@ -471,6 +549,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
             prefix = prefix.strip("/")
         self.prefix = prefix
         self.endpoint_url = endpoint_url
+        self.max_concurrent_requests = max_concurrent_requests
+        self._s3_client = None
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -485,72 +565,101 @@ class TupleS3StoreBackend(TupleStoreBackend):
         )
         filter_properties_dict(properties=self._config, inplace=True)
 
-    def _build_s3_object_key(self, key):
+    def _get_s3_client(self):
+        """Return the boto3 client shared by all requests of this store backend (boto3 clients are thread-safe)."""
+        if self._s3_client is None:
+            import boto3
+
+            self._s3_client = boto3.client("s3", endpoint_url=self.endpoint_url)
+        return self._s3_client
+
+    def _build_s3_object_key(self, key, filepath_suffix=None):
+        filepath = self._convert_key_to_filepath(key, filepath_suffix=filepath_suffix)
         if self.platform_specific_separator:
             if self.prefix:
-                s3_object_key = os.path.join(
-                    self.prefix, self._convert_key_to_filepath(key)
-                )
+                s3_object_key = os.path.join(self.prefix, filepath)
             else:
-                s3_object_key = self._convert_key_to_filepath(key)
+                s3_object_key = filepath
         else:
             if self.prefix:
-                s3_object_key = "/".join(
-                    (self.prefix, self._convert_key_to_filepath(key))
-                )
+                s3_object_key = "/".join((self.prefix, filepath))
             else:
-                s3_object_key = self._convert_key_to_filepath(key)
+                s3_object_key = filepath
         return s3_object_key
 
     def _get(self, key):
-        import boto3
-
-        s3 = boto3.client("s3", endpoint_url=self.endpoint_url)
+        s3 = self._get_s3_client()
 
         s3_object_key = self._build_s3_object_key(key)
 
-        try:
-            s3_response_object = s3.get_object(Bucket=self.bucket, Key=s3_object_key)
-        except (s3.exceptions.NoSuchKey, s3.exceptions.NoSuchBucket):
-            raise InvalidKeyError(
-                f"Unable to retrieve object from TupleS3StoreBackend with the following Key: {str(s3_object_key)}"
+        for filepath_suffix in self.readable_filepath_suffixes:
+            candidate_s3_object_key = self._build_s3_object_key(
+                key, filepath_suffix=filepath_suffix
             )
+            try:
+                s3_response_object = s3.get_object(
+                    Bucket=self.bucket, Key=candidate_s3_object_key
+                )
+            except s3.exceptions.NoSuchKey:
+                continue
+            except s3.exceptions.NoSuchBucket:
+                break
 
-        return (
-            s3_response_object["Body"]
-            .read()
-            .decode(s3_response_object.get("ContentEncoding", "utf-8"))
+            contents = s3_response_object["Body"].read()
+            if self._is_binary_filepath(candidate_s3_object_key):
+                return contents
+            return contents.decode(s3_response_object.get("ContentEncoding", "utf-8"))
+
+        raise InvalidKeyError(
+            f"Unable to retrieve object from TupleS3StoreBackend with the following Key: {str(s3_object_key)}"
         )
 
     def _set(
         self, key, value, content_encoding="utf-8", content_type="application/json"
     ):
-        import boto3
+        from botocore.exceptions import ClientError
 
-        s3 = boto3.resource("s3", endpoint_url=self.endpoint_url)
+        s3 = self._get_s3_client()
 
         s3_object_key = self._build_s3_object_key(key)
 
         try:
-            result_s3 = s3.Object(self.bucket, s3_object_key)
             if isinstance(value, str):
-                result_s3.put(
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
                     Body=value.encode(content_encoding),
                     ContentEncoding=content_encoding,
                     ContentType=content_type,
                 )
             else:
-                result_s3.put(Body=value, ContentType=content_type)
-        except s3.meta.client.exceptions.ClientError as e:
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
+                    Body=value,
+                    ContentType=content_type,
+                )
+        except ClientError as e:
             logger.debug(str(e))
             raise StoreBackendError("Unable to set object in s3.")
 
         return s3_object_key
 
-    def _move(self, source_key, dest_key, **kwargs):
-        import boto3
+    def _get_many(self, keys, **kwargs):
+        # Create the shared client before it is used from several threads
+        self._get_s3_client()
+        return _map_concurrently(self._get, keys, self.max_concurrent_requests)
+
+    def _set_many(self, key_value_pairs, **kwargs):
+        self._get_s3_client()
+        return _map_concurrently(
+            lambda key_value_pair: self._set(*key_value_pair, **kwargs),
+            key_value_pairs,
+            self.max_concurrent_requests,
+        )
 
-        s3 = boto3.resource("s3", endpoint_url=self.endpoint_url)
+    def _move(self, source_key, dest_key, **kwargs):
+        s3 = self._get_s3_client()
 
         source_filepath = self._convert_key_to_filepath(source_key)
         if not source_filepath.startswith(self.prefix):
@@ -559,18 +668,18 @@ class TupleS3StoreBackend(TupleStoreBackend):
         if not dest_filepath.startswith(self.prefix):
             dest_filepath = os.path.join(self.prefix, dest_filepath)
 
-        s3.Bucket(self.bucket).copy(
-            {"Bucket": self.bucket, "Key": source_filepath}, dest_filepath
+        s3.copy(
+            {"Bucket": self.bucket, "Key": source_filepath}, self.bucket, dest_filepath
         )
 
-        s3.Object(self.bucket, source_filepath).delete()
+        s3.delete_object(Bucket=self.bucket, Key=source_filepath)
 
     def list_keys(self):
         key_list = []
+        # A key may be stored under more than one of the readable_filepath_suffixes
+        found_keys = set()
 
-        import boto3
-
-        s3 = boto3.client("s3", endpoint_url=self.endpoint_url)
+        s3 = self._get_s3_client()
         paginator = s3.get_paginator("list_objects_v2")
 
         if self.prefix:
@@ -611,31 +720,24 @@ class TupleS3StoreBackend(TupleStoreBackend):
                 self.filepath_prefix
             ):
                 continue
-            elif self.filepath_suffix and not s3_object_key.endswith(
+            elif (
                 self.filepath_suffix
+                and self._get_filepath_suffix(s3_object_key) is None
             ):
                 continue
             key = self._convert_filepath_to_key(s3_object_key)
-            if key:
+            if key and key not in found_keys:
+                found_keys.add(key)
                 key_list.append(key)
 
         return key_list
 
     def get_url_for_key(self, key, protocol=None):
-        import boto3
-
-        location = boto3.client(
-            "s3", endpoint_url=self.endpoint_url
-        ).get_bucket_location(Bucket=self.bucket)["LocationConstraint"]
-        if location is None:
-            location = "s3"
-        else:
-            location = "s3-" + location
         s3_key = self._convert_key_to_filepath(key)
 
-        location = boto3.client(
-            "s3", endpoint_url=self.endpoint_url
-        ).get_bucket_location(Bucket=self.bucket)["LocationConstraint"]
+        location = self._get_s3_client().get_bucket_location(Bucket=self.bucket)[
+            "LocationConstraint"
+        ]
         if location is None:
             location = "s3"
         else:
@@ -664,39 +766,47 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return public_url
 
     def remove_key(self, key):
-        import boto3
         from botocore.exceptions import ClientError
 
         if not isinstance(key, tuple):
             key = key.to_tuple()
 
-        s3 = boto3.resource("s3", endpoint_url=self.endpoint_url)
-        s3_object_key = self._build_s3_object_key(key)
-        s3.Object(self.bucket, s3_object_key).delete()
-        if s3_object_key:
-            try:
-                #
-                objects_to_delete = s3.meta.client.list_objects_v2(
-                    Bucket=self.bucket, Prefix=self.prefix
-                )
-
-                delete_keys = {"Objects": []}
-                delete_keys["Objects"] = [
-                    {"Key": k}
-                    for k in [
-                        obj["Key"] for obj in objects_to_delete.get("Contents", [])
+        s3 = self._get_s3_client()
+        # The key may be stored under any of the readable suffixes, and get would return a copy left behind
+        try:
+            s3.delete_objects(
+                Bucket=self.bucket,
+                Delete={
+                    "Objects": [
+                        {
+                            "Key": self._build_s3_object_key(
+                                key, filepath_suffix=filepath_suffix
+                            )
+                        }
+                        for filepath_suffix in self.readable_filepath_suffixes
                     ]
-                ]
-                s3.meta.client.delete_objects(Bucket=self.bucket, Delete=delete_keys)
-                return True
-            except ClientError as e:
-                return False
-        else:
+                },
+            )
+        except ClientError as e:
+            logger.debug(str(e))
             return False
+        return True
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        from botocore.exceptions import ClientError
+
+        s3 = self._get_s3_client()
+        for filepath_suffix in self.readable_filepath_suffixes:
+            try:
+                s3.head_object(
+                    Bucket=self.bucket,
+                    Key=self._build_s3_object_key(key, filepath_suffix=filepath_suffix),
+                )
+                return True
+            except ClientError as e:
+                if e.response["Error"]["Code"] not in ("404", "NoSuchKey"):
+                    raise
+        return False
 
     @property
     def config(self) -> dict:
@@ -721,6 +831,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         filepath_template=None,
         filepath_prefix=None,
         filepath_suffix=None,
+        alternate_filepath_suffixes=None,
         forbidden_substrings=None,
         platform_specific_separator=False,
         fixed_length_key=False,
@@ -729,11 +840,13 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_urls=True,
         base_public_path=None,
         store_name=None,
+        max_concurrent_requests=MAX_CONCURRENT_REQUESTS,
     ):
         super().__init__(
             filepath_template=filepath_template,
             filepath_prefix=filepath_prefix,
             filepath_suffix=filepath_suffix,
+            alternate_filepath_suffixes=alternate_filepath_suffixes,
             forbidden_substrings=forbidden_substrings,
             platform_specific_separator=platform_specific_separator,
             fixed_length_key=fixed_length_key,
@@ -746,6 +859,9 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         self.prefix = prefix
         self.project = project
         self._public_urls = public_urls
+        self.max_concurrent_requests = max_concurrent_requests
+        self._gcs_client = None
+        self._gcs_bucket = None
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -760,50 +876,59 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         )
         filter_properties_dict(properties=self._config, inplace=True)
 
-    def _build_gcs_object_key(self, key):
+    def _get_gcs_client(self):
+        """Return the client shared by all requests of this store backend."""
+        if self._gcs_client is None:
+            from google.cloud import storage
+
+            self._gcs_client = storage.Client(project=self.project)
+        return self._gcs_client
+
+    def _get_gcs_bucket(self):
+        if self._gcs_bucket is None:
+            self._gcs_bucket = self._get_gcs_client().get_bucket(self.bucket)
+        return self._gcs_bucket
+
+    def _build_gcs_object_key(self, key, filepath_suffix=None):
+        filepath = self._convert_key_to_filepath(key, filepath_suffix=filepath_suffix)
         if self.platform_specific_separator:
             if self.prefix:
-                gcs_object_key = os.path.join(
-                    self.prefix, self._convert_key_to_filepath(key)
-                )
+                gcs_object_key = os.path.join(self.prefix, filepath)
             else:
-                gcs_object_key = self._convert_key_to_filepath(key)
+                gcs_object_key = filepath
         else:
             if self.prefix:
-                gcs_object_key = "/".join(
-                    (self.prefix, self._convert_key_to_filepath(key))
-                )
+                gcs_object_key = "/".join((self.prefix, filepath))
             else:
-                gcs_object_key = self._convert_key_to_filepath(key)
+                gcs_object_key = filepath
         return gcs_object_key
 
     def _move(self, source_key, dest_key, **kwargs):
         pass
 
     def _get(self, key):
-        gcs_object_key = self._build_gcs_object_key(key)
-
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
-        gcs_response_object = bucket.get_blob(gcs_object_key)
-        if not gcs_response_object:
-            raise InvalidKeyError(
-                f"Unable to retrieve object from TupleGCSStoreBackend with the following Key: {str(key)}"
+        bucket = self._get_gcs_bucket()
+        for filepath_suffix in self.readable_filepath_suffixes:
+            gcs_object_key = self._build_gcs_object_key(
+                key, filepath_suffix=filepath_suffix
             )
-        else:
-            return gcs_response_object.download_as_string().decode("utf-8")
+            gcs_response_object = bucket.get_blob(gcs_object_key)
+            if gcs_response_object:
+                contents = gcs_response_object.download_as_string()
+                if self._is_binary_filepath(gcs_object_key):
+                    return contents
+                return contents.decode("utf-8")
+
+        raise InvalidKeyError(
+            f"Unable to retrieve object from TupleGCSStoreBackend with the following Key: {str(key)}"
+        )
 
     def _set(
         self, key, value, content_encoding="utf-8", content_type="application/json"
     ):
         gcs_object_key = self._build_gcs_object_key(key)
 
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+        bucket = self._get_gcs_bucket()
         blob = bucket.blob(gcs_object_key)
 
         if isinstance(value, str):
@@ -815,11 +940,21 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             blob.upload_from_string(value, content_type=content_type)
         return gcs_object_key
 
-    def _move(self, source_key, dest_key, **kwargs):
-        from google.cloud import storage
+    def _get_many(self, keys, **kwargs):
+        # Create the shared client and bucket before they are used from several threads
+        self._get_gcs_bucket()
+        return _map_concurrently(self._get, keys, self.max_concurrent_requests)
+
+    def _set_many(self, key_value_pairs, **kwargs):
+        self._get_gcs_bucket()
+        return _map_concurrently(
+            lambda key_value_pair: self._set(*key_value_pair, **kwargs),
+            key_value_pairs,
+            self.max_concurrent_requests,
+        )
 
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+    def _move(self, source_key, dest_key, **kwargs):
+        bucket = self._get_gcs_bucket()
 
         source_filepath = self._convert_key_to_filepath(source_key)
         if not source_filepath.startswith(self.prefix):
@@ -833,10 +968,10 @@ class TupleGCSStoreBackend(TupleStoreBackend):
 
     def list_keys(self):
         key_list = []
+        # A key may be stored under more than one of the readable_filepath_suffixes
+        found_keys = set()
 
-        from google.cloud import storage
-
-        gcs = storage.Client(self.project)
+        gcs = self._get_gcs_client()
 
         for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
             gcs_object_name = blob.name
@@ -848,12 +983,14 @@ class TupleGCSStoreBackend(TupleStoreBackend):
                 self.filepath_prefix
             ):
                 continue
-            elif self.filepath_suffix and not gcs_object_key.endswith(
+            elif (
                 self.filepath_suffix
+                and self._get_filepath_suffix(gcs_object_key) is None
             ):
                 continue
             key = self._convert_filepath_to_key(gcs_object_key)
-            if key:
+            if key and key not in found_keys:
+                found_keys.add(key)
                 key_list.append(key)
         return key_list
 
@@ -895,20 +1032,34 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return path_url
 
     def remove_key(self, key):
-        from google.cloud import storage
         from google.cloud.exceptions import NotFound
 
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+        if not isinstance(key, tuple):
+            key = key.to_tuple()
+
+        bucket = self._get_gcs_bucket()
         try:
-            bucket.delete_blobs(blobs=list(bucket.list_blobs(prefix=self.prefix)))
+            # The key may be stored under any of the readable suffixes; copies that do not exist are skipped
+            bucket.delete_blobs(
+                blobs=[
+                    self._build_gcs_object_key(key, filepath_suffix=filepath_suffix)
+                    for filepath_suffix in self.readable_filepath_suffixes
+                ],
+                on_error=lambda blob: None,
+            )
         except NotFound:
             return False
         return True
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        bucket = self._get_gcs_bucket()
+        return any(
+            bucket.get_blob(
+                self._build_gcs_object_key(key, filepath_suffix=filepath_suffix)
+            )
+            is not None
+            for filepath_suffix in self.readable_filepath_suffixes
+        )
 
     @property
     def config(self) -> dict:
@@ -1,25 +1,68 @@
+import gzip
+import json
+import logging
+import os
 import random
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
 
+from great_expectations import exceptions as ge_exceptions
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationSuiteValidationResultSchema,
 )
+from great_expectations.core.util import (
+    convert_to_json_serializable,
+    dumps_json_serializable,
+)
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
-from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
+from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.data_context.store.tuple_store_backend import (
+    TupleFilesystemStoreBackend,
+    TupleGCSStoreBackend,
+    TupleS3StoreBackend,
+    TupleStoreBackend,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
-from great_expectations.data_context.util import load_class
+from great_expectations.data_context.util import (
+    instantiate_class_from_config,
+    load_class,
+)
 from great_expectations.util import (
     filter_properties_dict,
     get_currently_executing_function_call_arguments,
     verify_dynamic_loading_support,
 )
 
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+    logger.debug(
+        "Unable to load zstandard; install optional zstandard dependency to store validation results as "
+        "zstd-compressed JSON"
+    )
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+    logger.debug(
+        "Unable to load msgpack; install optional msgpack dependency to store validation results as msgpack"
+    )
+
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+ZSTD_MAGIC_NUMBER = b"\x28\xb5\x2f\xfd"
+
 
 class ValidationsStore(Store):
     """
@@ -88,15 +131,70 @@ class ValidationsStore(Store):
             bug_risk: Moderate
 
     --ge-feature-maturity-info--
+
+    serialization_format selects how validation results are written: "json" (the default), gzip- or
+    zstd-compressed JSON ("json.gz", "json.zst") or "msgpack". Tuple store backends name their files after the
+    format, and keep reading results stored in any of the other formats, so that the format of an existing store can
+    be changed without migrating its results.
+
+    With summary_index, the store also maintains a compact index holding the success flag, statistics, validation
+    time, batch_kwargs and batch_spec of every result it writes. Each write appends a JSON-lines segment to the
+    index, in a ".ge_validation_result_summary_index" directory next to the results (or in a
+    "<table_name>_summary_index" table for a DatabaseStoreBackend), so that writers neither rewrite nor overwrite
+    each other's summaries. get_summaries reads the segments instead of fetching every full result, and when it
+    lists all results, compacts them into one.
     """
 
     _key_class = ValidationResultIdentifier
 
-    def __init__(self, store_backend=None, runtime_environment=None, store_name=None):
+    # The filepath_suffix used by TupleStoreBackends for each serialization_format
+    SERIALIZATION_FORMAT_SUFFIXES = {
+        "json": ".json",
+        "json.gz": ".json.gz",
+        "json.zst": ".json.zst",
+        "msgpack": ".msgpack",
+    }
+    SUMMARY_INDEX_DIRECTORY = ".ge_validation_result_summary_index"
+    SUMMARY_INDEX_SEGMENT_SUFFIX = ".jsonl"
+    # store_backend settings that shape result keys, which do not apply to the summary index segment keys
+    _SUMMARY_INDEX_EXCLUDED_STORE_BACKEND_KEYS = (
+        "filepath_template",
+        "filepath_suffix",
+        "alternate_filepath_suffixes",
+        "fixed_length_key",
+        "manually_initialize_store_backend_id",
+    )
+
+    def __init__(
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        store_name=None,
+        serialization_format="json",
+        summary_index=False,
+    ):
         self._expectationSuiteValidationResultSchema = (
             ExpectationSuiteValidationResultSchema()
         )
 
+        if serialization_format not in self.SERIALIZATION_FORMAT_SUFFIXES:
+            raise ge_exceptions.InvalidConfigError(
+                f"Unknown serialization_format {serialization_format} for ValidationsStore; choose from "
+                f"{list(self.SERIALIZATION_FORMAT_SUFFIXES.keys())}"
+            )
+        if serialization_format == "json.zst" and zstandard is None:
+            raise ge_exceptions.InvalidConfigError(
+                "serialization_format json.zst requires the zstandard package"
+            )
+        if serialization_format == "msgpack" and msgpack is None:
+            raise ge_exceptions.InvalidConfigError(
+                "serialization_format msgpack requires the msgpack package"
+            )
+        self._serialization_format = serialization_format
+
+        summary_index_store_backend = (
+            {"class_name": "InMemoryStoreBackend"} if summary_index else None
+        )
         if store_backend is not None:
             store_backend_module_name = store_backend.get(
                 "module_name", "great_expectations.data_context.store"
@@ -112,10 +210,61 @@ class ValidationsStore(Store):
             # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
             if issubclass(store_backend_class, TupleStoreBackend):
                 # Provide defaults for this common case
+                filepath_suffix = self.SERIALIZATION_FORMAT_SUFFIXES[
+                    serialization_format
+                ]
                 store_backend["filepath_suffix"] = store_backend.get(
-                    "filepath_suffix", ".json"
+                    "filepath_suffix", filepath_suffix
                 )
+                if serialization_format != "json":
+                    # Results written before the serialization_format was changed remain readable
+                    store_backend["alternate_filepath_suffixes"] = store_backend.get(
+                        "alternate_filepath_suffixes",
+                        [
+                            suffix
+                            for suffix in self.SERIALIZATION_FORMAT_SUFFIXES.values()
+                            if suffix != filepath_suffix
+                        ],
+                    )
+                if summary_index:
+                    summary_index_store_backend = {
+                        key: value
+                        for key, value in store_backend.items()
+                        if key not in self._SUMMARY_INDEX_EXCLUDED_STORE_BACKEND_KEYS
+                    }
+                    summary_index_store_backend["suppress_store_backend_id"] = True
+                    # Keep the segments in a directory of their own, so that listing them does not list the results
+                    if issubclass(store_backend_class, TupleFilesystemStoreBackend):
+                        summary_index_store_backend["base_directory"] = os.path.join(
+                            store_backend.get("base_directory", ""),
+                            self.SUMMARY_INDEX_DIRECTORY,
+                        )
+                    elif issubclass(
+                        store_backend_class, (TupleS3StoreBackend, TupleGCSStoreBackend)
+                    ):
+                        summary_index_store_backend["prefix"] = "/".join(
+                            part
+                            for part in (
+                                store_backend.get("prefix"),
+                                self.SUMMARY_INDEX_DIRECTORY,
+                            )
+                            if part
+                        )
+                    else:
+                        summary_index_store_backend["filepath_prefix"] = "/".join(
+                            part
+                            for part in (
+                                store_backend.get("filepath_prefix"),
+                                self.SUMMARY_INDEX_DIRECTORY,
+                            )
+                            if part
+                        )
             elif issubclass(store_backend_class, DatabaseStoreBackend):
+                if serialization_format != "json":
+                    raise ge_exceptions.InvalidConfigError(
+                        "DatabaseStoreBackend stores values as strings; only the json serialization_format may be "
+                        "used with it"
+                    )
                 # Provide defaults for this common case
                 store_backend["table_name"] = store_backend.get(
                     "table_name", "ge_validations_store"
@@ -129,12 +278,30 @@ class ValidationsStore(Store):
                         "batch_identifier",
                     ],
                 )
+                if summary_index:
+                    summary_index_store_backend = dict(
+                        store_backend,
+                        table_name=f"{store_backend['table_name']}_summary_index",
+                        key_columns=["summary_index_key"],
+                        suppress_store_backend_id=True,
+                    )
         super().__init__(
             store_backend=store_backend,
             runtime_environment=runtime_environment,
             store_name=store_name,
         )
 
+        self._summary_index_store_backend = None
+        if summary_index_store_backend is not None:
+            self._summary_index_store_backend = instantiate_class_from_config(
+                config=summary_index_store_backend,
+                runtime_environment=runtime_environment or {},
+                config_defaults={
+                    "module_name": "great_expectations.data_context.store",
+                    "store_name": self._store_name,
+                },
+            )
+
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
         self._config = get_currently_executing_function_call_arguments(
@@ -145,12 +312,198 @@ class ValidationsStore(Store):
         )
         filter_properties_dict(properties=self._config, inplace=True)
 
+    @property
+    def serialization_format(self):
+        return self._serialization_format
+
     def serialize(self, key, value):
-        return self._expectationSuiteValidationResultSchema.dumps(value)
+        serialized_value = self._expectationSuiteValidationResultSchema.dump(value)
+        if self._serialization_format == "msgpack":
+            return msgpack.packb(serialized_value, use_bin_type=True)
+
+        serialized_value = dumps_json_serializable(serialized_value)
+        if self._serialization_format == "json.gz":
+            return gzip.compress(serialized_value.encode("utf-8"))
+        elif self._serialization_format == "json.zst":
+            return zstandard.ZstdCompressor().compress(
+                serialized_value.encode("utf-8")
+            )
+        return serialized_value
 
     def deserialize(self, key, value):
+        if isinstance(value, bytes):
+            # The format is detected from the value itself, since a store may hold results written in several formats
+            if value.startswith(GZIP_MAGIC_NUMBER):
+                value = gzip.decompress(value)
+            elif value.startswith(ZSTD_MAGIC_NUMBER):
+                if zstandard is None:
+                    raise ge_exceptions.StoreError(
+                        f"Unable to read validation result {key}: it is zstd-compressed, but zstandard is not "
+                        "installed"
+                    )
+                value = zstandard.ZstdDecompressor().decompress(value)
+            elif not value.lstrip().startswith(b"{"):
+                if msgpack is None:
+                    raise ge_exceptions.StoreError(
+                        f"Unable to read validation result {key}: it is not JSON, and msgpack is not installed"
+                    )
+                return self._expectationSuiteValidationResultSchema.load(
+                    msgpack.unpackb(value, raw=False, strict_map_key=False)
+                )
+            value = value.decode("utf-8")
         return self._expectationSuiteValidationResultSchema.loads(value)
 
+    def set(self, key, value):
+        result = super().set(key, value)
+        if (
+            self._summary_index_store_backend is not None
+            and key != StoreBackend.STORE_BACKEND_ID_KEY
+        ):
+            self._append_to_summary_index({key.to_tuple(): self._summarize(value)})
+        return result
+
+    def set_many(self, key_value_pairs):
+        key_value_pairs = list(key_value_pairs)
+        result = super().set_many(key_value_pairs)
+        if self._summary_index_store_backend is not None:
+            self._append_to_summary_index(
+                {key.to_tuple(): self._summarize(value) for key, value in key_value_pairs}
+            )
+        return result
+
+    def get_summaries(
+        self, keys: Optional[List[ValidationResultIdentifier]] = None
+    ) -> Dict[ValidationResultIdentifier, dict]:
+        """Return the summaries of the validation results of keys (by default, of all validation results).
+
+        A summary holds the success flag, statistics, validation_time, batch_kwargs and batch_spec of a result.
+        Results that are not in the summary index (because the index is disabled, or they were written by another
+        store or before the index was enabled) are read in full, and added to the index. Keys that cannot be read
+        are left out of the returned dictionary. Reading more than one index segment compacts the index into a single
+        segment, so that it does not grow a segment per write; listing all results also drops the summaries of removed
+        results from it.
+        """
+        list_all_keys = keys is None
+        if list_all_keys:
+            keys = self.list_keys()
+
+        indexed_summaries, segment_keys = self._load_summary_index()
+        unindexed_keys = [
+            key for key in keys if key.to_tuple() not in indexed_summaries
+        ]
+        new_summaries = {
+            key.to_tuple(): self._summarize(value)
+            for key, value in self._get_readable(unindexed_keys)
+            if value is not None
+        }
+        summaries = {}
+        for key in keys:
+            summary = indexed_summaries.get(key.to_tuple()) or new_summaries.get(
+                key.to_tuple()
+            )
+            if summary is not None:
+                summaries[key] = summary
+
+        if self._summary_index_store_backend is not None:
+            if list_all_keys:
+                index = {key.to_tuple(): summary for key, summary in summaries.items()}
+                has_removed_results = len(indexed_summaries) + len(
+                    new_summaries
+                ) > len(summaries)
+            else:
+                # Only some of the results were asked for, so the summaries of all the others are kept
+                index = {**indexed_summaries, **new_summaries}
+                has_removed_results = False
+            if len(segment_keys) > 1 or has_removed_results:
+                self._compact_summary_index(index, segment_keys)
+            elif new_summaries:
+                self._append_to_summary_index(new_summaries)
+        return summaries
+
+    def _get_readable(self, keys):
+        """Return (key, validation result) pairs for the keys that can be read, fetching them in bulk."""
+        try:
+            return list(zip(keys, self.get_many(keys)))
+        except ge_exceptions.StoreError:
+            pass
+
+        key_value_pairs = []
+        for key in keys:
+            try:
+                key_value_pairs.append((key, self.get(key)))
+            except ge_exceptions.StoreError as e:
+                logger.debug(f"Unable to read validation result {key}: {str(e)}")
+        return key_value_pairs
+
+    @staticmethod
+    def _summarize(validation_result: ExpectationSuiteValidationResult) -> dict:
+        meta = validation_result.meta or {}
+        return convert_to_json_serializable(
+            {
+                "success": validation_result.success,
+                "statistics": validation_result.statistics,
+                "validation_time": meta.get("validation_time"),
+                "batch_kwargs": meta.get("batch_kwargs", {}),
+                "batch_spec": meta.get("batch_spec", {}),
+            }
+        )
+
+    def _load_summary_index(self) -> Tuple[dict, List[tuple]]:
+        """Return the indexed summaries by key tuple, and the keys of the index segments they were read from."""
+        if self._summary_index_store_backend is None:
+            return {}, []
+        # Segment names start with the time they were written, so later segments take precedence
+        segment_keys = sorted(
+            key
+            for key in self._summary_index_store_backend.list_keys()
+            if key[-1].endswith(self.SUMMARY_INDEX_SEGMENT_SUFFIX)
+        )
+        try:
+            segments = self._summary_index_store_backend.get_many(segment_keys)
+        except ge_exceptions.StoreError:
+            # A concurrent compaction removed some of the segments; read the ones that remain
+            segments = []
+            for segment_key in segment_keys:
+                try:
+                    segments.append(self._summary_index_store_backend.get(segment_key))
+                except ge_exceptions.StoreError:
+                    pass
+
+        summaries = {}
+        for contents in segments:
+            for line in contents.splitlines():
+                if line.strip():
+                    summary = json.loads(line)
+                    summaries[tuple(summary.pop("key"))] = summary
+        return summaries, segment_keys
+
+    @staticmethod
+    def _serialize_summaries(summaries: dict) -> str:
+        return "".join(
+            dumps_json_serializable(dict(summary, key=list(key_tuple))) + "\n"
+            for key_tuple, summary in summaries.items()
+        )
+
+    def _append_to_summary_index(self, summaries: dict):
+        segment_key = (
+            f"{int(time.time() * 1e6):020d}-{uuid.uuid4().hex}{self.SUMMARY_INDEX_SEGMENT_SUFFIX}",
+        )
+        self._summary_index_store_backend.set(
+            segment_key, self._serialize_summaries(summaries)
+        )
+
+    def _compact_summary_index(self, summaries: dict, segment_keys: List[tuple]):
+        if not segment_keys:
+            self._append_to_summary_index(summaries)
+            return
+        # Overwrite the newest segment that was read, so that segments appended since keep precedence over it. A
+        # result rewritten while the index is compacted may keep its previous summary until the next compaction.
+        self._summary_index_store_backend.set(
+            segment_keys[-1], self._serialize_summaries(summaries)
+        )
+        for segment_key in segment_keys[:-1]:
+            self._summary_index_store_backend.remove_key(segment_key)
+
     def self_check(self, pretty_print):
         return_obj = {}
 
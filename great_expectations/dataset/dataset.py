@@ -9,7 +9,6 @@ from typing import Any, List, Optional, Set, Union
 import numpy as np
 import pandas as pd
 from dateutil.parser import parse
-from scipy import stats
 
 from great_expectations.data_asset.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
@@ -249,6 +248,19 @@ class Dataset(MetaDataset):
         is suitable really when a constructor knows to take its own type. In general, this should be overridden"""
         return cls(dataset)
 
+    def prefetch_column_aggregates(self, columns, aggregates):
+        """Compute several column aggregates for many columns at once, so that the corresponding getters (e.g.
+        get_column_min) return them without recomputing.
+
+        Backends for which computing the aggregates one at a time is cheap need not implement this, and by default it
+        does nothing. The prefetched values are only used when caching is enabled.
+
+        Args:
+            columns (List[str]): the columns for which to compute the aggregates
+            aggregates (List[str]): any of "nonnull_count", "unique_count", "min", "max", "mean" and "sum"
+        """
+        pass
+
     def get_row_count(self):
         """Returns: int, table row count"""
         raise NotImplementedError
@@ -3762,6 +3774,8 @@ class Dataset(MetaDataset):
                     }
                 }
         """
+        from scipy import stats
+
         if not is_valid_categorical_partition_object(partition_object):
             raise ValueError("Invalid partition object.")
 
@@ -4032,6 +4046,8 @@ class Dataset(MetaDataset):
             <great_expectations.dataset.dataset.Dataset.expect_column_unique_value_count_to_be_between>`
 
         """
+        from scipy import stats
+
         if partition_object is None:
             if bucketize_data:
                 partition_object = build_continuous_partition_object(
@@ -4413,6 +4429,8 @@ class Dataset(MetaDataset):
             :ref:`include_config`, :ref:`catch_exceptions`, and :ref:`meta`.
 
         """
+        from scipy import stats
+
         crosstab = self.get_crosstab(
             column_A, column_B, bins_A, bins_B, n_bins_A, n_bins_B
         )
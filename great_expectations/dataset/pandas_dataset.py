@@ -1,18 +1,24 @@
 import inspect
-import json
 import logging
 import warnings
 from datetime import datetime
 from functools import wraps
 from typing import List
 
-import jsonschema
 import numpy as np
 import pandas as pd
 from dateutil.parser import parse
-from scipy import stats
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.pandas_util import (
+    column_values_dateutil_parseable,
+    column_values_in_set,
+    column_values_json_parseable,
+    column_values_match_json_schema,
+    column_values_match_regex,
+    column_values_match_regex_list,
+    column_values_match_strftime_format,
+)
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
 from great_expectations.dataset.util import (
@@ -1123,7 +1129,7 @@ Notes:
         else:
             parsed_value_set = value_set
 
-        return column.isin(parsed_value_set)
+        return column_values_in_set(column, parsed_value_set)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1145,7 +1151,7 @@ Notes:
         else:
             parsed_value_set = value_set
 
-        return ~column.isin(parsed_value_set)
+        return ~column_values_in_set(column, parsed_value_set)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1433,7 +1439,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        return column.astype(str).str.contains(regex)
+        return column_values_match_regex(column, regex)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1449,7 +1455,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        return ~column.astype(str).str.contains(regex)
+        return ~column_values_match_regex(column, regex)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1467,10 +1473,7 @@ Notes:
         meta=None,
     ):
 
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
+        regex_match_df = column_values_match_regex_list(column, regex_list)
 
         if match_on == "any":
             return regex_match_df.any(axis="columns")
@@ -1493,10 +1496,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
+        regex_match_df = column_values_match_regex_list(column, regex_list)
 
         return ~regex_match_df.any(axis="columns")
 
@@ -1523,18 +1523,7 @@ Notes:
         except ValueError as e:
             raise ValueError("Unable to use provided strftime_format. " + str(e))
 
-        def is_parseable_by_format(val):
-            try:
-                datetime.strptime(val, strftime_format)
-                return True
-            except TypeError:
-                raise TypeError(
-                    "Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
-                )
-            except ValueError:
-                return False
-
-        return column.map(is_parseable_by_format)
+        return column_values_match_strftime_format(column, strftime_format)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1549,20 +1538,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        def is_parseable(val):
-            try:
-                if type(val) != str:
-                    raise TypeError(
-                        "Values passed to expect_column_values_to_be_dateutil_parseable must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
-                    )
-
-                parse(val)
-                return True
-
-            except (ValueError, OverflowError):
-                return False
-
-        return column.map(is_parseable)
+        return column_values_dateutil_parseable(column)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1577,14 +1553,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        def is_json(val):
-            try:
-                json.loads(val)
-                return True
-            except:
-                return False
-
-        return column.map(is_json)
+        return column_values_json_parseable(column)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1600,21 +1569,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        def matches_json_schema(val):
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
-
-        return column.map(matches_json_schema)
+        return column_values_match_json_schema(column, json_schema)
 
     @DocInherit
     @MetaPandasDataset.column_aggregate_expectation
@@ -1631,6 +1586,8 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
+        from scipy import stats
+
         column = self[column]
 
         if p_value <= 0 or p_value >= 1:
@@ -1680,6 +1637,8 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
+        from scipy import stats
+
         column = self[column]
 
         if not is_valid_continuous_partition_object(partition_object):
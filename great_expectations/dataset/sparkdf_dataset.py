@@ -40,6 +40,7 @@ try:
     from pyspark.sql.functions import (
         lit,
         monotonically_increasing_id,
+        rand,
         stddev_samp,
         struct,
         udf,
@@ -625,6 +626,31 @@ class SparkDFDataset(MetaSparkDFDataset):
             ),
         )
 
+    def random_sample(self, n=5, random_state=None):
+        """Returns a *PandasDataset* with *n* rows drawn uniformly at random from the given Dataset.
+
+        A Bernoulli sample of slightly more than *n* rows is shuffled and truncated, so that the sample does not
+        depend on how rows are partitioned.
+        """
+        row_count = self.get_row_count()
+        fraction = min(1.0, 1.5 * n / row_count) if row_count else 1.0
+        sample_df = (
+            self.spark_df.sample(
+                withReplacement=False, fraction=fraction, seed=random_state
+            )
+            .orderBy(rand(seed=random_state))
+            .limit(n)
+        )
+        return PandasDataset(
+            sample_df.toPandas(),
+            expectation_suite=self.get_expectation_suite(
+                discard_failed_expectations=False,
+                discard_result_format_kwargs=False,
+                discard_catch_exceptions_kwargs=False,
+                discard_include_config_kwargs=False,
+            ),
+        )
+
     def get_row_count(self):
         return self.spark_df.count()
 
@@ -5,12 +5,13 @@ import uuid
 import warnings
 from datetime import datetime
 from functools import wraps
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 
+from great_expectations.core.evaluation_parameters import build_evaluation_parameters
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
@@ -26,13 +27,32 @@ from .pandas_dataset import PandasDataset
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of column_map_expectations whose counts are computed by a single fused SELECT during validate
+FUSED_COUNT_QUERY_MAX_EXPECTATIONS = 50
+# Maximum number of columns whose aggregates are computed by a single fused SELECT in prefetch_column_aggregates
+FUSED_AGGREGATE_QUERY_MAX_COLUMNS = 50
+# Name of the function returning a random number, by dialect, used to draw random samples in random_sample
+RANDOM_FUNCTION_BY_DIALECT = {
+    "sqlite": "random",
+    "postgresql": "random",
+    "redshift": "random",
+    "snowflake": "random",
+    "mysql": "rand",
+    "bigquery": "rand",
+    "mssql": "newid",
+}
+# Dialects supporting TABLESAMPLE BERNOULLI, which random_sample uses to avoid sorting the whole table
+TABLESAMPLE_DIALECTS = {"postgresql", "snowflake"}
+# Factor by which TABLESAMPLE oversamples, so that the Bernoulli sample rarely has fewer than the requested rows
+TABLESAMPLE_OVERSAMPLING = 1.5
+
 try:
     import sqlalchemy as sa
     from sqlalchemy.dialects import registry
     from sqlalchemy.engine import reflection
     from sqlalchemy.engine.default import DefaultDialect
     from sqlalchemy.engine.result import RowProxy
-    from sqlalchemy.exc import ProgrammingError
+    from sqlalchemy.exc import ProgrammingError, SQLAlchemyError
     from sqlalchemy.sql.elements import Label, TextClause, WithinGroup, quoted_name
     from sqlalchemy.sql.expression import BinaryExpression, literal
     from sqlalchemy.sql.operators import custom_op
@@ -150,6 +170,10 @@ class SqlAlchemyBatchReference:
 
 class MetaSqlAlchemyDataset(Dataset):
     def __init__(self, *args, **kwargs):
+        # column_map_expectation counts computed by _prefetch_expectation_metrics, keyed by the SQL of their conditions
+        self._column_map_count_cache = {}
+        # values computed by prefetch_column_aggregates, keyed by (aggregate, column)
+        self._prefetched_column_aggregates = {}
         super().__init__(*args, **kwargs)
 
     @classmethod
@@ -182,15 +206,10 @@ class MetaSqlAlchemyDataset(Dataset):
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
-            expected_condition: BinaryExpression = func(self, column, *args, **kwargs)
-
-            # Added to prepare for when an ignore_values argument is added to the expectation
-            ignore_values: list = [None]
             if func.__name__ in [
                 "expect_column_values_to_not_be_null",
                 "expect_column_values_to_be_null",
             ]:
-                ignore_values = []
                 # Counting the number of unexpected values can be expensive when there is a large
                 # number of np.nan values.
                 # This only happens on expect_column_values_to_not_be_null expectations.
@@ -198,104 +217,63 @@ class MetaSqlAlchemyDataset(Dataset):
                 # we will instruct the result formatting method to skip this step.
                 result_format["partial_unexpected_count"] = 0
 
-            ignore_values_conditions: List[BinaryExpression] = []
-            if (
-                len(ignore_values) > 0
-                and None not in ignore_values
-                or len(ignore_values) > 1
-                and None in ignore_values
-            ):
-                ignore_values_conditions += [
-                    sa.column(column).in_(
-                        [val for val in ignore_values if val is not None]
-                    )
-                ]
-            if None in ignore_values:
-                ignore_values_conditions += [sa.column(column).is_(None)]
-
-            ignore_values_condition: BinaryExpression
-            if len(ignore_values_conditions) > 1:
-                ignore_values_condition = sa.or_(*ignore_values_conditions)
-            elif len(ignore_values_conditions) == 1:
-                ignore_values_condition = ignore_values_conditions[0]
-            else:
-                ignore_values_condition = BinaryExpression(
-                    sa.literal(False), sa.literal(True), custom_op("=")
-                )
+            (
+                expected_condition,
+                ignore_values_condition,
+            ) = self._get_column_map_conditions(func, column, *args, **kwargs)
 
-            count_query: Select
-            if self.sql_engine_dialect.name.lower() == "mssql":
-                count_query = self._get_count_query_mssql(
-                    expected_condition=expected_condition,
-                    ignore_values_condition=ignore_values_condition,
-                )
-            else:
-                count_query = self._get_count_query_generic_sqlalchemy(
+            count_results: dict = self._get_column_map_count_results(
+                expected_condition=expected_condition,
+                ignore_values_condition=ignore_values_condition,
+            )
+
+            if count_results["unexpected_count"] > 0:
+                # The update cannot match any row when there are no unexpected values
+                update_query = self._get_update_query_generic_sqlalchemy(
+                    self._get_result_update_column(result_format),
                     expected_condition=expected_condition,
                     ignore_values_condition=ignore_values_condition,
                 )
 
-            count_results: dict = dict(self.engine.execute(count_query).fetchone())
+                self.engine.execute(update_query)
 
-            update_query = self._get_update_query_generic_sqlalchemy(
-                result_format.get("result_update_column") or 'error',
-                expected_condition=expected_condition,
-                ignore_values_condition=ignore_values_condition,
+            nonnull_count: int = (
+                count_results["element_count"] - count_results["null_count"]
             )
 
-            self.engine.execute(update_query)
-
-            # Handle case of empty table gracefully:
-            if (
-                "element_count" not in count_results
-                or count_results["element_count"] is None
-            ):
-                count_results["element_count"] = 0
-            if "null_count" not in count_results or count_results["null_count"] is None:
-                count_results["null_count"] = 0
+            maybe_limited_unexpected_list = []
             if (
-                "unexpected_count" not in count_results
-                or count_results["unexpected_count"] is None
+                count_results["unexpected_count"] > 0
+                and result_format["result_format"] != "BOOLEAN_ONLY"
+                and unexpected_count_limit != 0
             ):
-                count_results["unexpected_count"] = 0
-
-            # Some engines may return Decimal from count queries (lookin' at you MSSQL)
-            # Convert to integers
-            count_results["element_count"] = int(count_results["element_count"])
-            count_results["null_count"] = int(count_results["null_count"])
-            count_results["unexpected_count"] = int(count_results["unexpected_count"])
-
-            # Retrieve unexpected values
-            unexpected_query_results = self.engine.execute(
-                sa.select([sa.column(column)])
-                .select_from(self._table)
-                .where(
-                    sa.and_(
-                        sa.not_(expected_condition), sa.not_(ignore_values_condition)
+                # Retrieve unexpected values
+                unexpected_query_results = self.engine.execute(
+                    sa.select([sa.column(column)])
+                    .select_from(self._table)
+                    .where(
+                        sa.and_(
+                            sa.not_(expected_condition),
+                            sa.not_(ignore_values_condition),
+                        )
                     )
+                    .limit(unexpected_count_limit)
                 )
-                .limit(unexpected_count_limit)
-            )
 
-            nonnull_count: int = (
-                count_results["element_count"] - count_results["null_count"]
-            )
-
-            if "output_strftime_format" in kwargs:
-                output_strftime_format = kwargs["output_strftime_format"]
-                maybe_limited_unexpected_list = []
-                for x in unexpected_query_results.fetchall():
-                    if isinstance(x[column], str):
-                        col = parse(x[column])
-                    else:
-                        col = x[column]
-                    maybe_limited_unexpected_list.append(
-                        datetime.strftime(col, output_strftime_format)
-                    )
-            else:
-                maybe_limited_unexpected_list = [
-                    x[column] for x in unexpected_query_results.fetchall()
-                ]
+                if "output_strftime_format" in kwargs:
+                    output_strftime_format = kwargs["output_strftime_format"]
+                    for x in unexpected_query_results.fetchall():
+                        if isinstance(x[column], str):
+                            col = parse(x[column])
+                        else:
+                            col = x[column]
+                        maybe_limited_unexpected_list.append(
+                            datetime.strftime(col, output_strftime_format)
+                        )
+                else:
+                    maybe_limited_unexpected_list = [
+                        x[column] for x in unexpected_query_results.fetchall()
+                    ]
 
             success_count = nonnull_count - count_results["unexpected_count"]
             success, percent_success = self._calc_map_expectation_success(
@@ -330,9 +308,258 @@ class MetaSqlAlchemyDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        # Exposed so that validate can build the conditions of all column_map_expectations up front
+        inner_wrapper._column_map_condition = func
 
         return inner_wrapper
 
+    def _get_column_map_conditions(
+        self, func, column, *args, **kwargs
+    ) -> Tuple[BinaryExpression, BinaryExpression]:
+        """Return the expected_condition built by a column_map_expectation's func, along with the condition matching
+        the values that the expectation ignores (nulls, except for the null expectations)."""
+        expected_condition: BinaryExpression = func(self, column, *args, **kwargs)
+
+        # Added to prepare for when an ignore_values argument is added to the expectation
+        ignore_values: list = [None]
+        if func.__name__ in [
+            "expect_column_values_to_not_be_null",
+            "expect_column_values_to_be_null",
+        ]:
+            ignore_values = []
+
+        ignore_values_conditions: List[BinaryExpression] = []
+        if (
+            len(ignore_values) > 0
+            and None not in ignore_values
+            or len(ignore_values) > 1
+            and None in ignore_values
+        ):
+            ignore_values_conditions += [
+                sa.column(column).in_([val for val in ignore_values if val is not None])
+            ]
+        if None in ignore_values:
+            ignore_values_conditions += [sa.column(column).is_(None)]
+
+        ignore_values_condition: BinaryExpression
+        if len(ignore_values_conditions) > 1:
+            ignore_values_condition = sa.or_(*ignore_values_conditions)
+        elif len(ignore_values_conditions) == 1:
+            ignore_values_condition = ignore_values_conditions[0]
+        else:
+            ignore_values_condition = BinaryExpression(
+                sa.literal(False), sa.literal(True), custom_op("=")
+            )
+
+        return expected_condition, ignore_values_condition
+
+    def _get_column_map_count_key(
+        self,
+        expected_condition: BinaryExpression,
+        ignore_values_condition: BinaryExpression,
+    ) -> Optional[str]:
+        """Identify the counts of a column_map_expectation by the SQL of its conditions.
+
+        Returns None when the conditions cannot be rendered with their literal values, in which case the counts are not
+        shared across expectations.
+        """
+        try:
+            return str(
+                sa.select(
+                    [
+                        sa.case([(ignore_values_condition, 1)], else_=0),
+                        sa.case([(expected_condition, 1)], else_=0),
+                    ]
+                ).compile(
+                    dialect=self.engine.dialect,
+                    compile_kwargs={"literal_binds": True},
+                )
+            )
+        except Exception as e:
+            logger.debug(f"Unable to compile column map conditions: {str(e)}")
+            return None
+
+    @staticmethod
+    def _normalize_column_map_count_results(count_results: dict) -> dict:
+        # Handle case of empty table gracefully:
+        for key in ["element_count", "null_count", "unexpected_count"]:
+            if key not in count_results or count_results[key] is None:
+                count_results[key] = 0
+            # Some engines may return Decimal from count queries (lookin' at you MSSQL)
+            # Convert to integers
+            count_results[key] = int(count_results[key])
+        return count_results
+
+    def _get_column_map_count_results(
+        self,
+        expected_condition: BinaryExpression,
+        ignore_values_condition: BinaryExpression,
+    ) -> dict:
+        """Return the element, null and unexpected counts of a column_map_expectation, using the counts prefetched
+        by validate when available."""
+        if self._active_validation and self._column_map_count_cache:
+            key = self._get_column_map_count_key(
+                expected_condition=expected_condition,
+                ignore_values_condition=ignore_values_condition,
+            )
+            if key in self._column_map_count_cache:
+                return dict(self._column_map_count_cache[key])
+
+        count_query: Select
+        if self.sql_engine_dialect.name.lower() == "mssql":
+            count_query = self._get_count_query_mssql(
+                expected_condition=expected_condition,
+                ignore_values_condition=ignore_values_condition,
+            )
+        else:
+            count_query = self._get_count_query_generic_sqlalchemy(
+                expected_condition=expected_condition,
+                ignore_values_condition=ignore_values_condition,
+            )
+
+        count_results: dict = dict(self.engine.execute(count_query).fetchone())
+        return self._normalize_column_map_count_results(count_results)
+
+    def _prefetch_expectation_metrics(
+        self, expectations, evaluation_parameters=None, result_format=None
+    ):
+        """Compute the counts of all column_map_expectations in expectations with a few fused SELECT statements.
+
+        Each column_map_expectation otherwise issues its own count query when it is evaluated. Expectations whose
+        conditions cannot be built here are skipped; they run their own queries (and report their errors) as usual.
+        So are expectations on a result_update_column: the counts are computed before any expectation runs, but
+        column_map_expectations update that column as they run.
+        """
+        self._column_map_count_cache = {}
+        if self.sql_engine_dialect.name.lower() == "mssql":
+            # mssql counts unexpected values through a temporary table per expectation
+            return
+
+        column_map_expectations = []
+        update_columns = set()
+        for expectation in expectations:
+            expectation_method = getattr(self, expectation.expectation_type, None)
+            func = getattr(expectation_method, "_column_map_condition", None)
+            if func is None:
+                continue
+            column_map_expectations.append((expectation, func))
+            update_columns.add(
+                self._get_result_update_column(
+                    result_format
+                    if result_format is not None
+                    else expectation.kwargs.get("result_format")
+                )
+            )
+
+        conditions = {}
+        for expectation, func in column_map_expectations:
+            try:
+                evaluation_args, _ = build_evaluation_parameters(
+                    expectation.kwargs,
+                    evaluation_parameters,
+                    self._config.get("interactive_evaluation", True),
+                    self._data_context,
+                )
+                kwargs = {
+                    key: value
+                    for key, value in evaluation_args.items()
+                    if key
+                    not in [
+                        "mostly",
+                        "result_format",
+                        "include_config",
+                        "catch_exceptions",
+                        "meta",
+                    ]
+                }
+                column = kwargs.pop("column")
+                if column in update_columns:
+                    continue
+                if self.batch_kwargs.get("use_quoted_name"):
+                    column = quoted_name(column, quote=True)
+                (
+                    expected_condition,
+                    ignore_values_condition,
+                ) = self._get_column_map_conditions(func, column, **kwargs)
+            except Exception as e:
+                logger.debug(
+                    f"Unable to prefetch counts for {expectation.expectation_type}: {str(e)}"
+                )
+                continue
+            key = self._get_column_map_count_key(
+                expected_condition=expected_condition,
+                ignore_values_condition=ignore_values_condition,
+            )
+            if key is not None:
+                conditions[key] = (expected_condition, ignore_values_condition)
+
+        conditions = list(conditions.items())
+        for start in range(0, len(conditions), FUSED_COUNT_QUERY_MAX_EXPECTATIONS):
+            chunk = conditions[start : start + FUSED_COUNT_QUERY_MAX_EXPECTATIONS]
+            try:
+                count_results = self._get_fused_count_results(
+                    [condition for _, condition in chunk]
+                )
+            except Exception as e:
+                # Fall back to one count query per expectation
+                logger.debug(f"Unable to execute fused count query: {str(e)}")
+                continue
+            for (key, _), results in zip(chunk, count_results):
+                self._column_map_count_cache[key] = results
+
+    def _clear_prefetched_expectation_metrics(self):
+        self._column_map_count_cache = {}
+
+    def _get_result_update_column(self, result_format) -> str:
+        """Return the column that a column_map_expectation with result_format flags its unexpected rows in."""
+        if result_format is None:
+            result_format = self.default_expectation_args["result_format"]
+        if isinstance(result_format, dict):
+            return result_format.get("result_update_column") or "error"
+        return "error"
+
+    def _get_fused_count_results(
+        self, conditions: List[Tuple[BinaryExpression, BinaryExpression]]
+    ) -> List[dict]:
+        """Compute the element, null and unexpected counts of several column_map_expectations in one SELECT."""
+        columns = [sa.func.count().label("element_count")]
+        for idx, (expected_condition, ignore_values_condition) in enumerate(conditions):
+            columns.append(
+                sa.func.sum(sa.case([(ignore_values_condition, 1)], else_=0)).label(
+                    f"null_count_{idx}"
+                )
+            )
+            columns.append(
+                sa.func.sum(
+                    sa.case(
+                        [
+                            (
+                                sa.and_(
+                                    sa.not_(expected_condition),
+                                    sa.not_(ignore_values_condition),
+                                ),
+                                1,
+                            )
+                        ],
+                        else_=0,
+                    )
+                ).label(f"unexpected_count_{idx}")
+            )
+
+        row = dict(
+            self.engine.execute(sa.select(columns).select_from(self._table)).fetchone()
+        )
+        return [
+            self._normalize_column_map_count_results(
+                {
+                    "element_count": row["element_count"],
+                    "null_count": row[f"null_count_{idx}"],
+                    "unexpected_count": row[f"unexpected_count_{idx}"],
+                }
+            )
+            for idx in range(len(conditions))
+        ]
+
     def _get_count_query_mssql(
         self,
         expected_condition: BinaryExpression,
@@ -686,7 +913,110 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             ),
         )
 
+    def random_sample(self, n=5, random_state=None):
+        """Returns a *PandasDataset* with *n* rows drawn uniformly at random from the given Dataset.
+
+        Rows are ordered by the dialect's random function (after a TABLESAMPLE BERNOULLI prefilter, where the dialect
+        supports it); dialects without a known random function fall back to the first *n* rows (see head). SQL random
+        functions are not seeded, so random_state is ignored and the sample is not reproducible across calls.
+        """
+        dialect_name = self.engine.dialect.name.lower()
+        random_function_name = RANDOM_FUNCTION_BY_DIALECT.get(dialect_name)
+        if random_function_name is None:
+            logger.debug(
+                f"Random sampling is not supported for the {dialect_name} dialect; using the first {n} rows"
+            )
+            return self.head(n=n)
+
+        selectable = self._table
+        if dialect_name in TABLESAMPLE_DIALECTS:
+            row_count = self.get_row_count()
+            if row_count > 0:
+                percent = min(100.0, 100.0 * TABLESAMPLE_OVERSAMPLING * n / row_count)
+                selectable = sa.tablesample(selectable, sa.func.bernoulli(percent))
+        query = (
+            sa.select([sa.text("*")])
+            .select_from(selectable)
+            .order_by(getattr(sa.func, random_function_name)())
+            .limit(n)
+        )
+        try:
+            df = pd.read_sql(query, con=self.engine)
+        except SQLAlchemyError as e:
+            logger.debug(
+                f"Unable to draw a random sample ({str(e)}); using the first {n} rows"
+            )
+            return self.head(n=n)
+
+        return PandasDataset(
+            df,
+            expectation_suite=self.get_expectation_suite(
+                discard_failed_expectations=False,
+                discard_result_format_kwargs=False,
+                discard_catch_exceptions_kwargs=False,
+                discard_include_config_kwargs=False,
+            ),
+        )
+
+    def prefetch_column_aggregates(self, columns, aggregates):
+        if not self.caching:
+            return
+
+        aggregate_expressions = {
+            "nonnull_count": lambda column: sa.func.sum(
+                sa.case([(sa.column(column).is_(None), 1)], else_=0)
+            ),
+            "unique_count": lambda column: sa.func.count(
+                sa.func.distinct(sa.column(column))
+            ),
+            "min": lambda column: sa.func.min(sa.column(column)),
+            "max": lambda column: sa.func.max(sa.column(column)),
+            # column * 1.0 needed for correct calculation of avg in MSSQL
+            "mean": lambda column: sa.func.avg(sa.column(column) * 1.0),
+            "sum": lambda column: sa.func.sum(sa.column(column)),
+        }
+        unknown_aggregates = set(aggregates) - set(aggregate_expressions.keys())
+        if unknown_aggregates:
+            raise ValueError(f"Unsupported aggregates: {sorted(unknown_aggregates)}")
+
+        columns = list(columns)
+        for start in range(0, len(columns), FUSED_AGGREGATE_QUERY_MAX_COLUMNS):
+            chunk = columns[start : start + FUSED_AGGREGATE_QUERY_MAX_COLUMNS]
+            select_columns = [sa.func.count().label("row_count")]
+            labels = {}
+            for column_idx, column in enumerate(chunk):
+                for aggregate in aggregates:
+                    label = f"{aggregate}_{column_idx}"
+                    labels[(aggregate, column)] = label
+                    select_columns.append(
+                        aggregate_expressions[aggregate](column).label(label)
+                    )
+            try:
+                row = dict(
+                    self.engine.execute(
+                        sa.select(select_columns).select_from(self._table)
+                    ).fetchone()
+                )
+            except Exception as e:
+                # The getters will compute (and report errors for) these aggregates one at a time
+                logger.debug(f"Unable to prefetch column aggregates: {str(e)}")
+                continue
+
+            row_count = int(row["row_count"] or 0)
+            self._prefetched_column_aggregates[("row_count", None)] = row_count
+            for (aggregate, column), label in labels.items():
+                if aggregate == "nonnull_count":
+                    value = row_count - int(row[label] or 0)
+                else:
+                    value = convert_to_json_serializable(row[label])
+                self._prefetched_column_aggregates[(aggregate, column)] = value
+
     def get_row_count(self, table_name=None):
+        if (
+            table_name is None
+            and ("row_count", None) in self._prefetched_column_aggregates
+        ):
+            return self._prefetched_column_aggregates[("row_count", None)]
         if table_name is None:
             table_name = self._table
         else:
@@ -701,6 +1031,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return [col["name"] for col in self.columns]
 
     def get_column_nonnull_count(self, column):
+        if ("nonnull_count", column) in self._prefetched_column_aggregates:
+            return self._prefetched_column_aggregates[("nonnull_count", column)]
         ignore_values = [None]
         count_query = sa.select(
             [
@@ -731,6 +1063,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return element_count - null_count
 
     def get_column_sum(self, column):
+        if ("sum", column) in self._prefetched_column_aggregates:
+            return self._prefetched_column_aggregates[("sum", column)]
         return convert_to_json_serializable(
             self.engine.execute(
                 sa.select([sa.func.sum(sa.column(column))]).select_from(self._table)
@@ -738,6 +1072,11 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         )
 
     def get_column_max(self, column, parse_strings_as_datetimes=False):
+        if (
+            not parse_strings_as_datetimes
+            and ("max", column) in self._prefetched_column_aggregates
+        ):
+            return self._prefetched_column_aggregates[("max", column)]
         if parse_strings_as_datetimes:
             raise NotImplementedError
         return convert_to_json_serializable(
@@ -747,6 +1086,11 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         )
 
     def get_column_min(self, column, parse_strings_as_datetimes=False):
+        if (
+            not parse_strings_as_datetimes
+            and ("min", column) in self._prefetched_column_aggregates
+        ):
+            return self._prefetched_column_aggregates[("min", column)]
         if parse_strings_as_datetimes:
             raise NotImplementedError
         return convert_to_json_serializable(
@@ -789,6 +1133,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return series
 
     def get_column_mean(self, column):
+        if ("mean", column) in self._prefetched_column_aggregates:
+            return self._prefetched_column_aggregates[("mean", column)]
         # column * 1.0 needed for correct calculation of avg in MSSQL
         return convert_to_json_serializable(
             self.engine.execute(
@@ -799,6 +1145,8 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         )
 
     def get_column_unique_count(self, column):
+        if ("unique_count", column) in self._prefetched_column_aggregates:
+            return self._prefetched_column_aggregates[("unique_count", column)]
         return convert_to_json_serializable(
             self.engine.execute(
                 sa.select(
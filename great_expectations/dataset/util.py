@@ -6,7 +6,6 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
-from scipy import stats
 
 logger = logging.getLogger(__name__)
 
@@ -161,6 +160,8 @@ def kde_partition_data(data, estimate_tails=True):
 
         See :ref:`partition_object`.
     """
+    from scipy import stats
+
     kde = stats.kde.gaussian_kde(data)
     evaluation_bins = np.linspace(
         start=np.min(data) - (kde.covariance_factor() / 2),
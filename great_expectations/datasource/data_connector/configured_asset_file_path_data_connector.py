@@ -1,6 +1,7 @@
+import concurrent.futures
 import copy
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchDefinition
@@ -15,6 +16,9 @@ from great_expectations.execution_engine import ExecutionEngine
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the number of data assets whose data_references are listed and mapped concurrently
+MAX_CACHE_REFRESH_WORKERS: int = 16
+
 
 class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
     """
@@ -99,6 +103,26 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
             )
         return asset
 
+    def _get_data_references_cache_config(self) -> dict:
+        config: dict = super()._get_data_references_cache_config()
+        config["assets"] = {
+            asset_name: {
+                attribute_name: getattr(asset, attribute_name)
+                for attribute_name in [
+                    "base_directory",
+                    "glob_directive",
+                    "pattern",
+                    "group_names",
+                    "bucket",
+                    "prefix",
+                    "delimiter",
+                    "max_keys",
+                ]
+            }
+            for asset_name, asset in self.assets.items()
+        }
+        return config
+
     def get_available_data_asset_names(self) -> List[str]:
         """
         Return the list of asset names known by this DataConnector.
@@ -109,25 +133,79 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
         return list(self.assets.keys())
 
     def _refresh_data_references_cache(self):
+        """
+        Map data_references to batch_definitions for every data asset. Data assets are listed and mapped in a thread
+        pool, so that the listing of one asset (e.g., a paginated S3 listing) does not wait for the others.
+        """
+        self._data_references_cache = self._build_data_references_cache(
+            build_data_reference_sub_cache=self._build_data_reference_sub_cache
+        )
 
-        # Map data_references to batch_definitions
-        self._data_references_cache = {}
+    def _refresh_data_references_cache_incrementally(self):
+        """
+        Bring the data_references cache up to date: only data_references that are not in the cache yet are mapped
+        to batch_definitions, and, where the store supports it (see _get_new_data_reference_list_for_asset()), only
+        those are listed.
+        """
+        if self._data_references_cache is None:
+            self._refresh_data_references_cache()
+            return
+        self._data_references_cache = self._build_data_references_cache(
+            build_data_reference_sub_cache=self._update_data_reference_sub_cache
+        )
 
-        for data_asset_name in self.get_available_data_asset_names():
-            self._data_references_cache[data_asset_name] = {}
+    def _build_data_references_cache(
+        self, build_data_reference_sub_cache
+    ) -> Dict[str, Dict[str, Optional[List[BatchDefinition]]]]:
+        data_asset_names: List[str] = self.get_available_data_asset_names()
+        data_reference_sub_caches: List[dict]
+        if len(data_asset_names) > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(data_asset_names), MAX_CACHE_REFRESH_WORKERS)
+            ) as executor:
+                data_reference_sub_caches = list(
+                    executor.map(build_data_reference_sub_cache, data_asset_names)
+                )
+        else:
+            data_reference_sub_caches = [
+                build_data_reference_sub_cache(data_asset_name)
+                for data_asset_name in data_asset_names
+            ]
+        return dict(zip(data_asset_names, data_reference_sub_caches))
 
-            for data_reference in self._get_data_reference_list(
+    def _build_data_reference_sub_cache(
+        self, data_asset_name: str
+    ) -> Dict[str, Optional[List[BatchDefinition]]]:
+        return self._map_data_reference_list_to_batch_definition_lists(
+            data_reference_list=self._get_data_reference_list(
                 data_asset_name=data_asset_name
-            ):
-                mapped_batch_definition_list: List[
-                    BatchDefinition
-                ] = self._map_data_reference_to_batch_definition_list(
-                    data_reference=data_reference,
-                    data_asset_name=data_asset_name,
-                )
-                self._data_references_cache[data_asset_name][
-                    data_reference
-                ] = mapped_batch_definition_list
+            ),
+            data_asset_name=data_asset_name,
+        )
+
+    def _update_data_reference_sub_cache(
+        self, data_asset_name: str
+    ) -> Dict[str, Optional[List[BatchDefinition]]]:
+        data_reference_sub_cache: Dict[
+            str, Optional[List[BatchDefinition]]
+        ] = self._data_references_cache.get(data_asset_name)
+        if data_reference_sub_cache is None:
+            return self._build_data_reference_sub_cache(data_asset_name=data_asset_name)
+        data_reference_list: List[str]
+        listing_is_complete: bool
+        (
+            data_reference_list,
+            listing_is_complete,
+        ) = self._get_new_data_reference_list_for_asset(
+            asset=self._get_asset(data_asset_name=data_asset_name),
+            data_reference_sub_cache=data_reference_sub_cache,
+        )
+        return self._map_new_data_references(
+            data_reference_sub_cache=data_reference_sub_cache,
+            data_reference_list=data_reference_list,
+            listing_is_complete=listing_is_complete,
+            data_asset_name=data_asset_name,
+        )
 
     def _get_data_reference_list(
         self, data_asset_name: Optional[str] = None
@@ -229,6 +307,20 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
     def _get_data_reference_list_for_asset(self, asset: Optional[Asset]) -> List[str]:
         raise NotImplementedError
 
+    def _get_new_data_reference_list_for_asset(
+        self, asset: Optional[Asset], data_reference_sub_cache: dict
+    ) -> Tuple[List[str], bool]:
+        """
+        List the data_references of asset for an incremental refresh of data_reference_sub_cache, the part of the
+        cache that holds them.
+
+        Returns:
+            The listed data_references and whether the listing is complete (if it is, data_references that are missing
+            from it are dropped from the cache; otherwise, it only has to include data_references added since
+            data_reference_sub_cache was built). By default, every data_reference is listed.
+        """
+        return self._get_data_reference_list_for_asset(asset=asset), True
+
     def _get_full_file_path_for_asset(self, path: str, asset: Optional[Asset]) -> str:
         raise NotImplementedError
 
@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 try:
     import boto3
@@ -89,6 +89,23 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             )
 
     def _get_data_reference_list_for_asset(self, asset: Optional[Asset]) -> List[str]:
+        return self._list_s3_keys_for_asset(asset=asset)
+
+    def _get_new_data_reference_list_for_asset(
+        self, asset: Optional[Asset], data_reference_sub_cache: dict
+    ) -> Tuple[List[str], bool]:
+        """
+        List only the keys that sort after the last key already in data_reference_sub_cache, using "StartAfter".
+
+        This picks up objects added under ever-increasing keys (e.g., date-stamped paths); objects added with earlier
+        keys, and deleted objects, are only reflected by a full refresh of the cache.
+        """
+        start_after: Optional[str] = max(data_reference_sub_cache, default=None)
+        return self._list_s3_keys_for_asset(asset=asset, start_after=start_after), False
+
+    def _list_s3_keys_for_asset(
+        self, asset: Optional[Asset], start_after: Optional[str] = None
+    ) -> List[str]:
         query_options: dict = {
             "Bucket": self._bucket,
             "Prefix": self._prefix,
@@ -104,6 +121,8 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
                 query_options["Delimiter"] = asset.delimiter
             if asset.max_keys:
                 query_options["MaxKeys"] = asset.max_keys
+        if start_after:
+            query_options["StartAfter"] = start_after
 
         path_list: List[str] = [
             key
@@ -119,6 +119,13 @@ class DataConnector:
     ):
         raise NotImplementedError
 
+    def _refresh_data_references_cache_incrementally(self):
+        """
+        Bring the data_references cache up to date, reusing the batch_definitions it already holds. DataConnectors
+        that cannot list only what changed discard the cache, so that it is rebuilt in full on next use.
+        """
+        self._data_references_cache = None
+
     def _get_data_reference_list(
         self, data_asset_name: Optional[str] = None
     ) -> List[str]:
@@ -1,8 +1,14 @@
+import hashlib
+import json
 import logging
-from typing import Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 import great_expectations.exceptions as ge_exceptions
-from great_expectations.core.batch import BatchDefinition, BatchRequest
+from great_expectations.core.batch import (
+    BatchDefinition,
+    BatchRequest,
+    PartitionDefinition,
+)
 from great_expectations.datasource.data_connector.data_connector import DataConnector
 from great_expectations.datasource.data_connector.partition_query import (
     PartitionQuery,
@@ -10,9 +16,9 @@ from great_expectations.datasource.data_connector.partition_query import (
 )
 from great_expectations.datasource.data_connector.sorter import Sorter
 from great_expectations.datasource.data_connector.util import (
-    batch_definition_matches_batch_request,
     build_sorters_from_config,
     map_batch_definition_to_data_reference_string_using_regex,
+    map_data_reference_string_list_to_batch_definition_lists_using_regex,
     map_data_reference_string_to_batch_definition_list_using_regex,
 )
 from great_expectations.datasource.types import PathBatchSpec
@@ -20,6 +26,127 @@ from great_expectations.execution_engine import ExecutionEngine
 
 logger = logging.getLogger(__name__)
 
+# Connector attributes that determine which data_references are listed; a data_references cache snapshot is only
+# valid for the configuration it was saved with (see FilePathDataConnector._get_data_references_cache_config())
+DATA_REFERENCE_LISTING_ATTRIBUTE_NAMES: List[str] = [
+    "_base_directory",
+    "_glob_directive",
+    "_bucket",
+    "_prefix",
+    "_delimiter",
+    "_max_keys",
+]
+
+
+class BatchDefinitionIndex:
+    """
+    The batch_definitions of one data_asset_name (or of every data asset, if data_asset_name is None) of a
+    FilePathDataConnector, in data_references cache order. Hash indexes over partition_definition values, built on first
+    use for each group name, make selecting batch_definitions by partition_identifiers a lookup, and the positions of
+    the batch_definitions in the order of the configured sorters are computed once.
+    """
+
+    def __init__(
+        self,
+        batch_definition_list: List[BatchDefinition],
+        sort_function: Callable[[List[BatchDefinition]], List[BatchDefinition]],
+    ):
+        self._batch_definition_list = batch_definition_list
+        self._sort_function = sort_function
+        self._partition_value_indexes: Dict[str, Optional[Dict[Any, List[int]]]] = {}
+        self._sorted_batch_definition_list: Optional[List[BatchDefinition]] = None
+        self._sort_ranks: Optional[Dict[int, int]] = None
+
+    @property
+    def batch_definition_list(self) -> List[BatchDefinition]:
+        return self._batch_definition_list
+
+    def _get_partition_value_index(self, key: str) -> Optional[Dict[Any, List[int]]]:
+        if key not in self._partition_value_indexes:
+            partition_value_index: Optional[Dict[Any, List[int]]] = {}
+            try:
+                for position, batch_definition in enumerate(
+                    self._batch_definition_list
+                ):
+                    partition_definition: dict = batch_definition.partition_definition
+                    if partition_definition and key in partition_definition:
+                        partition_value_index.setdefault(
+                            partition_definition[key], []
+                        ).append(position)
+            except TypeError:
+                # Unhashable partition_definition values cannot be indexed
+                partition_value_index = None
+            self._partition_value_indexes[key] = partition_value_index
+        return self._partition_value_indexes[key]
+
+    def select(self, partition_identifiers: Optional[dict]) -> List[BatchDefinition]:
+        """
+        Return the batch_definitions whose partition_definition matches every item of partition_identifiers, in cache
+        order; this is the selection batch_definition_matches_batch_request makes.
+        """
+        if not partition_identifiers:
+            return list(self._batch_definition_list)
+        if not isinstance(partition_identifiers, dict):
+            return []
+        position_lists: List[List[int]] = []
+        try:
+            for key, value in partition_identifiers.items():
+                partition_value_index: Optional[
+                    Dict[Any, List[int]]
+                ] = self._get_partition_value_index(key=key)
+                if partition_value_index is None:
+                    break
+                position_lists.append(partition_value_index.get(value, []))
+            else:
+                position_lists.sort(key=len)
+                positions: set = set(position_lists[0]).intersection(
+                    *position_lists[1:]
+                )
+                return [
+                    self._batch_definition_list[position]
+                    for position in sorted(positions)
+                ]
+        except TypeError:
+            # An unhashable partition identifier value; fall back to comparing every batch_definition
+            pass
+        return [
+            batch_definition
+            for batch_definition in self._batch_definition_list
+            if all(
+                key in batch_definition.partition_definition
+                and batch_definition.partition_definition[key] == value
+                for key, value in partition_identifiers.items()
+            )
+        ]
+
+    def _build_sort_order(self):
+        if self._sorted_batch_definition_list is None:
+            self._sorted_batch_definition_list = self._sort_function(
+                list(self._batch_definition_list)
+            )
+            self._sort_ranks = {
+                id(batch_definition): rank
+                for rank, batch_definition in enumerate(
+                    self._sorted_batch_definition_list
+                )
+            }
+
+    @property
+    def sorted_batch_definition_list(self) -> List[BatchDefinition]:
+        self._build_sort_order()
+        return self._sorted_batch_definition_list
+
+    def sort(self, batch_definition_list: List[BatchDefinition]) -> List[BatchDefinition]:
+        """
+        Sort batch_definitions drawn from this index, in cache order, using the precomputed order of the configured
+        sorters. Sorters are stable, so this gives the same order as applying them to batch_definition_list directly.
+        """
+        self._build_sort_order()
+        return sorted(
+            batch_definition_list,
+            key=lambda batch_definition: self._sort_ranks[id(batch_definition)],
+        )
+
 
 class FilePathDataConnector(DataConnector):
     """
@@ -65,6 +192,10 @@ class FilePathDataConnector(DataConnector):
         self._sorters = build_sorters_from_config(config_list=sorters)
         self._validate_sorters_configuration()
 
+        # BatchDefinitionIndex objects by data_asset_name, for the data_references cache they were built from
+        self._batch_definition_indexes: Dict[Optional[str], BatchDefinitionIndex] = {}
+        self._batch_definition_indexes_cache = None
+
     @property
     def sorters(self) -> Optional[dict]:
         return self._sorters
@@ -112,6 +243,9 @@ class FilePathDataConnector(DataConnector):
             - if batch_request also has a partition_query, then select batch_definitions that match partition_query.
             - if data_connector has sorters configured, then sort the batch_definition list before returning.
 
+        Batch definitions are looked up in a BatchDefinitionIndex of the requested data asset, so that selecting by
+        partition_identifiers does not compare every cached batch_definition and sorting does not re-run the sorters.
+
         Args:
             batch_request (BatchRequest): BatchRequest to process
 
@@ -124,17 +258,22 @@ class FilePathDataConnector(DataConnector):
         if self._data_references_cache is None:
             self._refresh_data_references_cache()
 
-        batch_definition_list: List[BatchDefinition] = list(
-            filter(
-                lambda batch_definition: batch_definition_matches_batch_request(
-                    batch_definition=batch_definition, batch_request=batch_request
-                ),
-                self._get_batch_definition_list_from_cache(),
+        batch_definition_index: BatchDefinitionIndex = self._get_batch_definition_index(
+            data_asset_name=batch_request.data_asset_name
+        )
+
+        partition_identifiers: Any = None
+        if batch_request.partition_request:
+            partition_identifiers = batch_request.partition_request.get(
+                "partition_identifiers"
             )
+        batch_definition_list: List[BatchDefinition] = batch_definition_index.select(
+            partition_identifiers=partition_identifiers
         )
 
+        partition_query_obj: Optional[PartitionQuery] = None
         if batch_request.partition_request is not None:
-            partition_query_obj: PartitionQuery = build_partition_query(
+            partition_query_obj = build_partition_query(
                 partition_request_dict=batch_request.partition_request
             )
             batch_definition_list = partition_query_obj.select_from_partition_request(
@@ -142,13 +281,57 @@ class FilePathDataConnector(DataConnector):
             )
 
         if len(self.sorters) > 0:
-            sorted_batch_definition_list = self._sort_batch_definition_list(
+            if not batch_request.partition_request:
+                return list(batch_definition_index.sorted_batch_definition_list)
+            if (
+                isinstance(partition_query_obj.index, slice)
+                and partition_query_obj.index.step is not None
+                and partition_query_obj.index.step < 0
+            ):
+                # The selection is no longer in cache order, which ties between sort keys depend on
+                return self._sort_batch_definition_list(
+                    batch_definition_list=batch_definition_list
+                )
+            return batch_definition_index.sort(
                 batch_definition_list=batch_definition_list
             )
-            return sorted_batch_definition_list
         else:
             return batch_definition_list
 
+    def _get_batch_definition_index(
+        self, data_asset_name: Optional[str] = None
+    ) -> BatchDefinitionIndex:
+        """
+        Return the BatchDefinitionIndex of data_asset_name (of all data assets, if data_asset_name is None), discarding
+        any indexes built from a previous data_references cache.
+        """
+        if self._batch_definition_indexes_cache is not self._data_references_cache:
+            batch_definition_lists: Dict[Optional[str], List[BatchDefinition]] = {
+                None: self._get_batch_definition_list_from_cache()
+            }
+            for batch_definition in batch_definition_lists[None]:
+                if not batch_definition.data_asset_name:
+                    continue
+                batch_definition_lists.setdefault(
+                    batch_definition.data_asset_name, []
+                ).append(batch_definition)
+            self._batch_definition_indexes = {
+                name: BatchDefinitionIndex(
+                    batch_definition_list=batch_definition_list,
+                    sort_function=self._sort_batch_definition_list,
+                )
+                for name, batch_definition_list in batch_definition_lists.items()
+            }
+            self._batch_definition_indexes_cache = self._data_references_cache
+        if not data_asset_name:
+            data_asset_name = None
+        if data_asset_name not in self._batch_definition_indexes:
+            return BatchDefinitionIndex(
+                batch_definition_list=[],
+                sort_function=self._sort_batch_definition_list,
+            )
+        return self._batch_definition_indexes[data_asset_name]
+
     def _sort_batch_definition_list(
         self, batch_definition_list: List[BatchDefinition]
     ) -> List[BatchDefinition]:
@@ -184,6 +367,25 @@ class FilePathDataConnector(DataConnector):
             group_names=group_names,
         )
 
+    def _map_data_reference_list_to_batch_definition_lists(
+        self, data_reference_list: List[str], data_asset_name: str = None
+    ) -> Dict[str, Optional[List[BatchDefinition]]]:
+        """
+        Map data_references in bulk, compiling the regex of data_asset_name once, instead of calling
+        _map_data_reference_to_batch_definition_list for each data_reference; used to refresh the cache.
+        """
+        regex_config: dict = self._get_regex_config(data_asset_name=data_asset_name)
+        pattern: str = regex_config["pattern"]
+        group_names: List[str] = regex_config["group_names"]
+        return map_data_reference_string_list_to_batch_definition_lists_using_regex(
+            datasource_name=self.datasource_name,
+            data_connector_name=self.name,
+            data_asset_name=data_asset_name,
+            data_reference_list=data_reference_list,
+            regex_pattern=pattern,
+            group_names=group_names,
+        )
+
     def _map_batch_definition_to_data_reference(
         self, batch_definition: BatchDefinition
     ) -> str:
@@ -253,6 +455,117 @@ this is fewer than number of sorters specified, which is {len(self.sorters)}.
                     """
                 )
 
+    def save_data_references_cache_snapshot(self, path: str):
+        """
+        Write the data_references cache to a JSON file at path, so that a new process can load it with
+        load_data_references_cache_snapshot() instead of listing every data_reference again.
+        """
+        if self._data_references_cache is None:
+            self._refresh_data_references_cache()
+        snapshot: dict = {
+            "class_name": self.__class__.__name__,
+            "datasource_name": self.datasource_name,
+            "data_connector_name": self.name,
+            "config_fingerprint": self._get_data_references_cache_fingerprint(),
+            "data_references_cache": _encode_data_references_cache(
+                data_references_cache=self._data_references_cache
+            ),
+        }
+        with open(path, "w") as outfile:
+            json.dump(snapshot, outfile)
+
+    def load_data_references_cache_snapshot(self, path: str):
+        """
+        Replace the data_references cache with a snapshot written by save_data_references_cache_snapshot(), then
+        list only the data_references added since (see _refresh_data_references_cache_incrementally()).
+
+        If the regex or asset configuration has changed since the snapshot was saved, its mapping of data_references
+        to batch_definitions is stale; the snapshot is then discarded and the cache is rebuilt from a full listing.
+        """
+        with open(path) as infile:
+            snapshot: dict = json.load(infile)
+        if (
+            snapshot.get("class_name") != self.__class__.__name__
+            or snapshot.get("datasource_name") != self.datasource_name
+            or snapshot.get("data_connector_name") != self.name
+        ):
+            raise ge_exceptions.DataConnectorError(
+                f"""The data references cache snapshot "{path}" was not saved by {self.__class__.__name__} "{self.name}"
+of datasource "{self.datasource_name}".
+                """
+            )
+        if (
+            snapshot.get("config_fingerprint")
+            != self._get_data_references_cache_fingerprint()
+        ):
+            logger.warning(
+                f"""The data references cache snapshot "{path}" was saved with a different configuration of
+{self.__class__.__name__} "{self.name}"; rebuilding the data references cache.
+                """
+            )
+            self._refresh_data_references_cache()
+            return
+        self._data_references_cache = _decode_data_references_cache(
+            encoded_data_references_cache=snapshot["data_references_cache"],
+            datasource_name=self.datasource_name,
+            data_connector_name=self.name,
+        )
+        self._refresh_data_references_cache_incrementally()
+
+    def _get_data_references_cache_config(self) -> dict:
+        """
+        Return the configuration that determines which data_references are listed and how they are mapped to
+        batch_definitions.
+        """
+        config: dict = {"default_regex": self._default_regex}
+        for attribute_name in DATA_REFERENCE_LISTING_ATTRIBUTE_NAMES:
+            if hasattr(self, attribute_name):
+                config[attribute_name] = getattr(self, attribute_name)
+        return config
+
+    def _get_data_references_cache_fingerprint(self) -> str:
+        return hashlib.md5(
+            json.dumps(
+                self._get_data_references_cache_config(), sort_keys=True, default=str
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _map_new_data_references(
+        self,
+        data_reference_sub_cache: Dict[str, Optional[List[BatchDefinition]]],
+        data_reference_list: List[str],
+        listing_is_complete: bool,
+        data_asset_name: Optional[str] = None,
+    ) -> Dict[str, Optional[List[BatchDefinition]]]:
+        """
+        Return a new data_references (sub-)cache that keeps the entries of data_reference_sub_cache and maps only
+        the data_references of data_reference_list that it does not contain yet. If data_reference_list is a complete
+        listing, entries for data_references that no longer exist are dropped.
+        """
+        new_data_reference_list: List[str] = [
+            data_reference
+            for data_reference in data_reference_list
+            if data_reference not in data_reference_sub_cache
+        ]
+        mapped_data_references: Dict[
+            str, Optional[List[BatchDefinition]]
+        ] = self._map_data_reference_list_to_batch_definition_lists(
+            data_reference_list=new_data_reference_list,
+            data_asset_name=data_asset_name,
+        )
+        if listing_is_complete:
+            return {
+                data_reference: data_reference_sub_cache[data_reference]
+                if data_reference in data_reference_sub_cache
+                else mapped_data_references[data_reference]
+                for data_reference in data_reference_list
+            }
+        updated_data_reference_sub_cache: Dict[
+            str, Optional[List[BatchDefinition]]
+        ] = dict(data_reference_sub_cache)
+        updated_data_reference_sub_cache.update(mapped_data_references)
+        return updated_data_reference_sub_cache
+
     def _get_batch_definition_list_from_cache(self) -> List[BatchDefinition]:
         raise NotImplementedError
 
@@ -263,3 +576,52 @@ this is fewer than number of sorters specified, which is {len(self.sorters)}.
         self, path: str, data_asset_name: Optional[str] = None
     ) -> str:
         raise NotImplementedError
+
+
+def _encode_data_references_cache(data_references_cache: dict) -> dict:
+    """Convert a (possibly nested) data_references cache into JSON-serializable form."""
+    encoded_data_references_cache: dict = {}
+    for key, value in data_references_cache.items():
+        if isinstance(value, dict):
+            encoded_data_references_cache[key] = _encode_data_references_cache(
+                data_references_cache=value
+            )
+        elif value is None:
+            encoded_data_references_cache[key] = None
+        else:
+            encoded_data_references_cache[key] = [
+                {
+                    "data_asset_name": batch_definition.data_asset_name,
+                    "partition_definition": dict(batch_definition.partition_definition),
+                }
+                for batch_definition in value
+            ]
+    return encoded_data_references_cache
+
+
+def _decode_data_references_cache(
+    encoded_data_references_cache: dict, datasource_name: str, data_connector_name: str
+) -> dict:
+    data_references_cache: dict = {}
+    for key, value in encoded_data_references_cache.items():
+        if isinstance(value, dict):
+            data_references_cache[key] = _decode_data_references_cache(
+                encoded_data_references_cache=value,
+                datasource_name=datasource_name,
+                data_connector_name=data_connector_name,
+            )
+        elif value is None:
+            data_references_cache[key] = None
+        else:
+            data_references_cache[key] = [
+                BatchDefinition(
+                    datasource_name=datasource_name,
+                    data_connector_name=data_connector_name,
+                    data_asset_name=encoded_batch_definition["data_asset_name"],
+                    partition_definition=PartitionDefinition(
+                        encoded_batch_definition["partition_definition"]
+                    ),
+                )
+                for encoded_batch_definition in value
+            ]
+    return data_references_cache
@@ -55,15 +55,24 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
     def _refresh_data_references_cache(self):
         """ refreshes data_reference cache """
         # Map data_references to batch_definitions
-        self._data_references_cache = {}
-
-        for data_reference in self._get_data_reference_list():
-            mapped_batch_definition_list: List[
-                BatchDefinition
-            ] = self._map_data_reference_to_batch_definition_list(
-                data_reference=data_reference, data_asset_name=None
+        self._data_references_cache = (
+            self._map_data_reference_list_to_batch_definition_lists(
+                data_reference_list=self._get_data_reference_list(),
+                data_asset_name=None,
             )
-            self._data_references_cache[data_reference] = mapped_batch_definition_list
+        )
+
+    def _refresh_data_references_cache_incrementally(self):
+        """ maps only the data_references that are not in the data_reference cache yet """
+        if self._data_references_cache is None:
+            self._refresh_data_references_cache()
+            return
+        self._data_references_cache = self._map_new_data_references(
+            data_reference_sub_cache=self._data_references_cache,
+            data_reference_list=self._get_data_reference_list(),
+            listing_is_complete=True,
+            data_asset_name=None,
+        )
 
     def get_data_reference_list_count(self) -> int:
         """
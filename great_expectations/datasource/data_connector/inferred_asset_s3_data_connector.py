@@ -11,7 +11,9 @@ from great_expectations.core.batch import BatchDefinition
 from great_expectations.datasource.data_connector import (
     InferredAssetFilePathDataConnector,
 )
-from great_expectations.datasource.data_connector.util import list_s3_keys
+from great_expectations.datasource.data_connector.util import (
+    list_s3_keys_concurrently,
+)
 from great_expectations.execution_engine import ExecutionEngine
 
 logger = logging.getLogger(__name__)
@@ -87,7 +89,8 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
         self, data_asset_name: Optional[str] = None
     ) -> List[str]:
         """
-        List objects in the underlying data store to create a list of data_references.
+        List objects in the underlying data store to create a list of data_references.  The common prefixes under
+        the configured prefix are listed concurrently.
 
         This method is used to refresh the cache.
         """
@@ -98,15 +101,10 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             "MaxKeys": self._max_keys,
         }
 
-        path_list: List[str] = [
-            key
-            for key in list_s3_keys(
-                s3=self._s3,
-                query_options=query_options,
-                iterator_dict={},
-                recursive=True,
-            )
-        ]
+        path_list: List[str] = list_s3_keys_concurrently(
+            s3=self._s3,
+            query_options=query_options,
+        )
         return path_list
 
     def _get_full_file_path(
@@ -1,15 +1,22 @@
+import logging
 from typing import Dict, List, Optional
 
 from great_expectations.datasource.data_connector import ConfiguredAssetSqlDataConnector
 from great_expectations.datasource.data_connector.asset import Asset
 from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.util import get_cached_sqlalchemy_metadata
 
 try:
     import sqlalchemy as sa
-    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.exc import OperationalError, SQLAlchemyError
 except ImportError:
     sa = None
 
+logger = logging.getLogger(__name__)
+
+# Dialects whose tables and views are all listed by a single query of information_schema.tables
+INFORMATION_SCHEMA_DIALECTS = ("postgresql", "redshift", "mysql", "mssql", "snowflake")
+
 
 class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
     """
@@ -203,28 +210,54 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         include_views=True,
     ):
         engine = self._execution_engine.engine
+
+        tables = []
+        for metadata in get_cached_sqlalchemy_metadata(
+            engine,
+            "tables",
+            schema_name,
+            fetch=lambda: self._list_tables_and_views(schema_name=schema_name),
+            ttl_seconds=getattr(
+                self._execution_engine, "metadata_cache_ttl_seconds", None
+            ),
+        ):
+            if ignore_information_schemas_and_system_tables and (
+                metadata["schema_name"] in information_schemas
+                or metadata["table_name"] in system_tables
+            ):
+                continue
+
+            if metadata["type"] == "view" and not include_views:
+                continue
+
+            tables.append(metadata)
+
+        return tables
+
+    def _list_tables_and_views(self, schema_name: str = None) -> List[dict]:
+        """List the tables and views of schema_name (by default, of all schemas), with one information_schema query
+        where the dialect supports it, and with per-schema inspector calls otherwise."""
+        engine = self._execution_engine.engine
+        if engine.dialect.name.lower() in INFORMATION_SCHEMA_DIALECTS:
+            try:
+                return self._list_tables_and_views_from_information_schema(
+                    schema_name=schema_name
+                )
+            except SQLAlchemyError as e:
+                logger.debug(
+                    f"Unable to list tables from information_schema ({str(e)}); using the inspector instead"
+                )
+
         inspector = sa.inspect(engine)
 
         selected_schema_name = schema_name
 
         tables = []
         for schema_name in inspector.get_schema_names():
-            if (
-                ignore_information_schemas_and_system_tables
-                and schema_name in information_schemas
-            ):
-                continue
-
             if selected_schema_name is not None and schema_name != selected_schema_name:
                 continue
 
             for table_name in inspector.get_table_names(schema=schema_name):
-
-                if (ignore_information_schemas_and_system_tables) and (
-                    table_name in system_tables
-                ):
-                    continue
-
                 tables.append(
                     {
                         "schema_name": schema_name,
@@ -234,22 +267,48 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
                 )
 
             # Note Abe 20201112: This logic is currently untested.
-            if include_views:
-                # Note: this is not implemented for bigquery
-
-                for view_name in inspector.get_view_names(schema=schema_name):
+            # Note: this is not implemented for bigquery
+            for view_name in inspector.get_view_names(schema=schema_name):
+                tables.append(
+                    {
+                        "schema_name": schema_name,
+                        "table_name": view_name,
+                        "type": "view",
+                    }
+                )
 
-                    if (ignore_information_schemas_and_system_tables) and (
-                        table_name in system_tables
-                    ):
-                        continue
+        return tables
 
-                    tables.append(
-                        {
-                            "schema_name": schema_name,
-                            "table_name": view_name,
-                            "type": "view",
-                        }
-                    )
+    def _list_tables_and_views_from_information_schema(
+        self, schema_name: str = None
+    ) -> List[dict]:
+        engine = self._execution_engine.engine
+        dialect = engine.dialect
+        rows = engine.execute(
+            sa.text(
+                "SELECT table_schema, table_name, table_type FROM information_schema.tables "
+                "WHERE table_type IN ('BASE TABLE', 'VIEW')"
+            )
+        ).fetchall()
 
+        tables = []
+        for table_schema, table_name, table_type in rows:
+            if getattr(dialect, "requires_name_normalize", False):
+                # Report names as the inspector does, e.g. lower case for snowflake
+                table_schema = dialect.normalize_name(table_schema)
+                table_name = dialect.normalize_name(table_name)
+            if dialect.name.lower() in ("postgresql", "redshift") and table_schema.startswith(
+                "pg_"
+            ):
+                # The inspector does not list postgresql's system schemas
+                continue
+            if schema_name is not None and table_schema != schema_name:
+                continue
+            tables.append(
+                {
+                    "schema_name": table_schema,
+                    "table_name": table_name,
+                    "type": "view" if table_type == "VIEW" else "table",
+                }
+            )
         return tables
@@ -1,5 +1,6 @@
 # Utility methods for dealing with DataConnector objects
 
+import concurrent.futures
 import copy
 import logging
 import os
@@ -19,9 +20,6 @@ from great_expectations.core.id_dict import (
 )
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.datasource.data_connector.sorter import Sorter
-from great_expectations.execution_engine.sqlalchemy_execution_engine import (
-    SqlAlchemyBatchData,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +36,9 @@ except ImportError:
 
 DEFAULT_DATA_ASSET_NAME: str = "DEFAULT_ASSET_NAME"
 
+# Upper bound on the number of S3 prefixes that list_s3_keys_concurrently() lists at the same time
+MAX_S3_LISTING_WORKERS: int = 16
+
 
 def batch_definition_matches_batch_request(
     batch_definition: BatchDefinition,
@@ -105,6 +106,49 @@ def map_data_reference_string_to_batch_definition_list_using_regex(
     ]
 
 
+def map_data_reference_string_list_to_batch_definition_lists_using_regex(
+    datasource_name: str,
+    data_connector_name: str,
+    data_reference_list: List[str],
+    regex_pattern: str,
+    group_names: List[str],
+    data_asset_name: Optional[str] = None,
+) -> Dict[str, Optional[List[BatchDefinition]]]:
+    """
+    Bulk equivalent of map_data_reference_string_to_batch_definition_list_using_regex: the regex_pattern is compiled
+    once, and each matching data_reference is mapped straight to its BatchDefinition.
+
+    Returns:
+        A dictionary from each data_reference, in the order given, to its list of BatchDefinition objects (or to None,
+        if the data_reference does not match regex_pattern).
+    """
+    # noinspection PyUnresolvedReferences
+    compiled_regex_pattern: re.Pattern = re.compile(regex_pattern)
+    mapped_data_references: Dict[str, Optional[List[BatchDefinition]]] = {}
+    for data_reference in data_reference_list:
+        # noinspection PyUnresolvedReferences
+        matches: Optional[re.Match] = compiled_regex_pattern.match(data_reference)
+        if matches is None:
+            mapped_data_references[data_reference] = None
+            continue
+        partition_definition: dict = dict(zip(group_names, matches.groups()))
+        # See convert_data_reference_string_to_partition_definition_using_regex on "data_asset_name" as a group name.
+        data_asset_name_from_partition_definition: str = partition_definition.pop(
+            "data_asset_name", DEFAULT_DATA_ASSET_NAME
+        )
+        mapped_data_references[data_reference] = [
+            BatchDefinition(
+                datasource_name=datasource_name,
+                data_connector_name=data_connector_name,
+                data_asset_name=data_asset_name_from_partition_definition
+                if data_asset_name is None
+                else data_asset_name,
+                partition_definition=PartitionDefinition(partition_definition),
+            )
+        ]
+    return mapped_data_references
+
+
 def convert_data_reference_string_to_partition_definition_using_regex(
     data_reference: str,
     regex_pattern: str,
@@ -269,7 +313,7 @@ def list_s3_keys(
     full path that includes both the prefix and the file name.  Otherwise, in the situations where multiple data assets
     share levels of a directory tree, matching files to data assets will not be possible, due to the path ambiguity.
     :param s3: s3 client connection
-    :param query_options: s3 query attributes ("Bucket", "Prefix", "Delimiter", "MaxKeys")
+    :param query_options: s3 query attributes ("Bucket", "Prefix", "Delimiter", "MaxKeys", and optionally "StartAfter")
     :param iterator_dict: dictionary to manage "NextContinuationToken" (if "IsTruncated" is returned from S3)
     :param recursive: True for InferredAssetS3DataConnector and False for ConfiguredAssetS3DataConnector (see above)
     :return: string valued key representing file path on S3 (full prefix and leaf file name)
@@ -285,6 +329,9 @@ def list_s3_keys(
     s3_objects_info: dict = s3.list_objects_v2(**query_options)
 
     if not any(key in s3_objects_info for key in ["Contents", "CommonPrefixes"]):
+        if "StartAfter" in query_options:
+            # No keys were added after "StartAfter"
+            return
         raise ValueError("S3 query may not have been configured correctly.")
 
     if "Contents" in s3_objects_info:
@@ -319,6 +366,89 @@ def list_s3_keys(
         del iterator_dict["continuation_token"]
 
 
+def _list_s3_prefix(s3, query_options: dict) -> List[Tuple[bool, Any]]:
+    """
+    List every page of a single S3 prefix, without descending into its common prefixes.
+
+    Returns:
+        The listing in the order S3 returns it, as (False, list of keys) and (True, common prefix) items.
+    """
+    query_options = dict(query_options)
+    listing: List[Tuple[bool, Any]] = []
+    while True:
+        logger.debug(f"Fetching objects from S3 with query options: {query_options}")
+        s3_objects_info: dict = s3.list_objects_v2(**query_options)
+        if not any(
+            key in s3_objects_info for key in ["Contents", "CommonPrefixes"]
+        ):
+            raise ValueError("S3 query may not have been configured correctly.")
+        if "Contents" in s3_objects_info:
+            listing.append(
+                (
+                    False,
+                    [
+                        item["Key"]
+                        for item in s3_objects_info["Contents"]
+                        if item["Size"] > 0
+                    ],
+                )
+            )
+        for prefix_info in s3_objects_info.get("CommonPrefixes", []):
+            listing.append((True, prefix_info["Prefix"]))
+        if not s3_objects_info["IsTruncated"]:
+            return listing
+        query_options["ContinuationToken"] = s3_objects_info["NextContinuationToken"]
+
+
+def list_s3_keys_concurrently(
+    s3, query_options: dict, max_workers: int = MAX_S3_LISTING_WORKERS
+) -> List[str]:
+    """
+    Recursively list the keys under query_options["Prefix"], like list_s3_keys() with recursive=True, but list the
+    common prefixes discovered through the delimiter (e.g., "year=2020/", "year=2021/", and then "year=2021/month=01/",
+    ...) concurrently, in a pool of at most max_workers threads. S3 returns at most "MaxKeys" keys per request and the
+    pages of one prefix have to be fetched in sequence, so this is what makes listing a large, partitioned bucket
+    bounded by the number of keys per prefix rather than by the total number of keys.
+
+    :param s3: s3 client connection (boto3 clients are thread-safe)
+    :param query_options: s3 query attributes ("Bucket", "Prefix", "Delimiter", "MaxKeys")
+    :param max_workers: maximum number of prefixes listed at the same time
+    :return: the keys, in the same order as list_s3_keys() yields them
+    """
+    root_prefix: str = query_options.get("Prefix", "")
+    listings: Dict[str, List[Tuple[bool, Any]]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Dict[concurrent.futures.Future, str] = {
+            executor.submit(_list_s3_prefix, s3, query_options): root_prefix
+        }
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                prefix: str = pending.pop(future)
+                listings[prefix] = future.result()
+                for is_prefix, value in listings[prefix]:
+                    if is_prefix:
+                        pending[
+                            executor.submit(
+                                _list_s3_prefix,
+                                s3,
+                                dict(query_options, Prefix=value),
+                            )
+                        ] = value
+
+    keys: List[str] = []
+    prefixes_to_merge: List[Tuple[bool, Any]] = [(True, root_prefix)]
+    while prefixes_to_merge:
+        is_prefix, value = prefixes_to_merge.pop()
+        if is_prefix:
+            prefixes_to_merge.extend(reversed(listings[value]))
+        else:
+            keys.extend(value)
+    return keys
+
+
 # TODO: <Alex>We need to move sorters and _validate_sorters_configuration() to DataConnector</Alex>
 # As a rule, this method should not be in "util", but in the specific high-level "DataConnector" class, where it is
 # called (and declared as private in that class).  Currently, this is "FilePathDataConnector".  However, since this
@@ -352,6 +482,11 @@ def _build_sorter_from_config(sorter_config: Dict[str, Any]) -> Sorter:
 
 
 def fetch_batch_data_as_pandas_df(batch_data):
+    # Imported here so that importing the data connectors does not import the SqlAlchemy execution engine
+    from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+        SqlAlchemyBatchData,
+    )
+
     if isinstance(batch_data, pd.DataFrame):
         return batch_data
     if pyspark_sql and isinstance(batch_data, pyspark_sql.DataFrame):
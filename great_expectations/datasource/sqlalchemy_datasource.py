@@ -14,17 +14,16 @@ from great_expectations.exceptions import (
 )
 from great_expectations.types import ClassConfig
 from great_expectations.types.configurations import classConfigSchema
+from great_expectations.util import get_sqlalchemy_engine
 
 logger = logging.getLogger(__name__)
 
 try:
     import sqlalchemy
-    from sqlalchemy import create_engine
     from sqlalchemy.sql.elements import quoted_name
 
 except ImportError:
     sqlalchemy = None
-    create_engine = None
     logger.debug("Unable to import sqlalchemy.")
 
 
@@ -242,13 +241,13 @@ class SqlAlchemyDatasource(LegacyDatasource):
             # if a connection string or url was provided, use that
             elif "connection_string" in kwargs:
                 connection_string = kwargs.pop("connection_string")
-                self.engine = create_engine(connection_string, **kwargs)
+                self.engine = get_sqlalchemy_engine(connection_string, **kwargs)
                 connection = self.engine.connect()
                 connection.close()
             elif "url" in credentials:
                 url = credentials.pop("url")
                 self.drivername = urlparse(url).scheme
-                self.engine = create_engine(url, **kwargs)
+                self.engine = get_sqlalchemy_engine(url, **kwargs)
                 connection = self.engine.connect()
                 connection.close()
 
@@ -260,7 +259,7 @@ class SqlAlchemyDatasource(LegacyDatasource):
                     drivername,
                 ) = self._get_sqlalchemy_connection_options(**kwargs)
                 self.drivername = drivername
-                self.engine = create_engine(options, **create_engine_kwargs)
+                self.engine = get_sqlalchemy_engine(options, **create_engine_kwargs)
                 connection = self.engine.connect()
                 connection.close()
 
@@ -1,4 +1,35 @@
+import importlib
+import sys
+import types
+
 from .execution_engine import ExecutionEngine
-from .pandas_execution_engine import PandasExecutionEngine
-from .sparkdf_execution_engine import SparkDFExecutionEngine
-from .sqlalchemy_execution_engine import SqlAlchemyExecutionEngine
+
+# The concrete engines import pandas, SqlAlchemy and Spark, and are only imported on first access (e.g.
+# "from great_expectations.execution_engine import SqlAlchemyExecutionEngine") so that importing great_expectations
+# does not pay for them. Module-level __getattr__ (PEP 562) needs Python 3.7, so the package module's class is
+# replaced instead.
+_LAZY_EXECUTION_ENGINE_MODULES = {
+    "PandasExecutionEngine": ".pandas_execution_engine",
+    "SparkDFExecutionEngine": ".sparkdf_execution_engine",
+    "SqlAlchemyExecutionEngine": ".sqlalchemy_execution_engine",
+}
+
+__all__ = ["ExecutionEngine"] + list(_LAZY_EXECUTION_ENGINE_MODULES.keys())
+
+
+class _LazyExecutionEngineModule(types.ModuleType):
+    def __getattr__(self, name):
+        module_name = _LAZY_EXECUTION_ENGINE_MODULES.get(name)
+        if module_name is None:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(self.__name__, name)
+            )
+        value = getattr(importlib.import_module(module_name, self.__name__), name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(_LAZY_EXECUTION_ENGINE_MODULES))
+
+
+sys.modules[__name__].__class__ = _LazyExecutionEngineModule
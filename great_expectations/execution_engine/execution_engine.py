@@ -1,7 +1,8 @@
 import copy
 import logging
+import time
 from enum import Enum
-from typing import Any, Dict, Iterable, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
 from ruamel.yaml import YAML
 
@@ -40,6 +41,7 @@ class ExecutionEngine:
     ):
         self.name = name
         self._validator = validator
+        self._metric_resolution_callback = None
 
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
@@ -117,6 +119,23 @@ class ExecutionEngine:
     def config(self) -> dict:
         return self._config
 
+    @property
+    def metric_resolution_callback(self) -> Optional[Callable[[dict], None]]:
+        """Callable invoked with a dictionary describing each resolved metric or metric bundle (see
+        resolve_metrics), or None."""
+        return self._metric_resolution_callback
+
+    @metric_resolution_callback.setter
+    def metric_resolution_callback(
+        self, callback: Optional[Callable[[dict], None]]
+    ) -> None:
+        self._metric_resolution_callback = callback
+
+    def _emit_metric_resolution_event(self, **event) -> None:
+        if self._metric_resolution_callback is not None:
+            event["execution_engine"] = type(self).__name__
+            self._metric_resolution_callback(event)
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -161,6 +180,11 @@ class ExecutionEngine:
         """resolve_metrics is the main entrypoint for an execution engine. The execution engine will compute the value
         of the provided metrics.
 
+        If a metric_resolution_callback is set, it is called once for each metric computed on its own, with a
+        dictionary containing "metric_id", "metric_name", "metric_fn_type" and "duration_seconds", and once for each
+        query that computes a bundle of metrics, with "metric_ids", "metric_names", "bundle" (True) and
+        "duration_seconds" plus any engine-specific keys (e.g. "sql" or "spark_job_ids").
+
         Args:
             metrics_to_resolve: the metrics to evaluate
             metrics: already-computed metrics currently available to the engine
@@ -217,6 +241,7 @@ class ExecutionEngine:
             metric_fn_type = getattr(
                 metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
             )
+            start_time = time.perf_counter()
             if metric_fn_type in [
                 MetricPartialFunctionTypes.MAP_SERIES,
                 MetricPartialFunctionTypes.MAP_FN,
@@ -242,6 +267,12 @@ class ExecutionEngine:
                 resolved_metrics[metric_to_resolve.id] = metric_fn(
                     **metric_provider_kwargs
                 )
+            self._emit_metric_resolution_event(
+                metric_id=metric_to_resolve.id,
+                metric_name=metric_to_resolve.metric_name,
+                metric_fn_type=getattr(metric_fn_type, "value", str(metric_fn_type)),
+                duration_seconds=time.perf_counter() - start_time,
+            )
         if len(metric_fn_bundle) > 0:
             resolved_metrics.update(self.resolve_metric_bundle(metric_fn_bundle))
 
@@ -2,6 +2,7 @@ import copy
 import datetime
 import hashlib
 import logging
+import time
 import uuid
 from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
@@ -27,6 +28,13 @@ from .execution_engine import ExecutionEngine, MetricDomainTypes
 
 logger = logging.getLogger(__name__)
 
+# The local properties SparkContext.setJobGroup sets
+SPARK_JOB_GROUP_PROPERTIES = (
+    "spark.jobGroup.id",
+    "spark.job.description",
+    "spark.job.interruptOnCancel",
+)
+
 try:
     import pyspark
     import pyspark.sql.functions as F
@@ -535,7 +543,35 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 aggregate_id = str(uuid.uuid4())
                 condition_ids.append(aggregate_id)
                 aggregate_cols.append(column_aggregate)
-            res = df.agg(*aggregate_cols).collect()
+            if self.metric_resolution_callback is None:
+                res = df.agg(*aggregate_cols).collect()
+            else:
+                # Tag the Spark jobs of this query so that they can be reported alongside its timing
+                job_group_id = str(uuid.uuid4())
+                spark_context = df.sql_ctx.sparkSession.sparkContext
+                # setJobGroup overwrites these thread-local properties, which the caller may have set
+                previous_job_group_properties = {
+                    key: spark_context.getLocalProperty(key)
+                    for key in SPARK_JOB_GROUP_PROPERTIES
+                }
+                spark_context.setJobGroup(
+                    job_group_id, "great_expectations metric bundle"
+                )
+                start_time = time.perf_counter()
+                try:
+                    res = df.agg(*aggregate_cols).collect()
+                finally:
+                    for key, value in previous_job_group_properties.items():
+                        spark_context.setLocalProperty(key, value)
+                self._emit_metric_resolution_event(
+                    metric_ids=aggregate["ids"],
+                    metric_names=[metric_id[0] for metric_id in aggregate["ids"]],
+                    bundle=True,
+                    duration_seconds=time.perf_counter() - start_time,
+                    spark_job_ids=list(
+                        spark_context.statusTracker().getJobIdsForGroup(job_group_id)
+                    ),
+                )
             assert (
                 len(res) == 1
             ), "all bundle-computed metrics must be single-value statistics"
@@ -1,6 +1,7 @@
 import copy
 import datetime
 import logging
+import time
 import uuid
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
@@ -22,6 +23,7 @@ from great_expectations.expectations.row_conditions import parse_condition_to_sq
 from great_expectations.util import (
     filter_properties_dict,
     get_currently_executing_function_call_arguments,
+    get_sqlalchemy_engine,
     import_library_module,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
@@ -366,6 +368,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         connection_string=None,
         url=None,
         batch_data_dict=None,
+        metadata_cache_ttl_seconds: Optional[float] = None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ):
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -392,9 +395,15 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
+                metadata_cache_ttl_seconds (float or None): \
+                    If set, table listings and column types introspected from the database are reused for this many
+                    seconds, across all engines connected to the same database (see
+                    great_expectations.util.invalidate_sqlalchemy_metadata_cache). If None, every introspection
+                    queries the database.
         """
         super().__init__(name=name, batch_data_dict=batch_data_dict)  # , **kwargs)
         self._name = name
+        self.metadata_cache_ttl_seconds = metadata_cache_ttl_seconds
 
         self._credentials = credentials
         self._connection_string = connection_string
@@ -410,10 +419,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         elif credentials is not None:
             self.engine = self._build_engine(credentials=credentials, **kwargs)
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = get_sqlalchemy_engine(connection_string, **kwargs)
         elif url is not None:
             self.drivername = urlparse(url).scheme
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = get_sqlalchemy_engine(url, **kwargs)
         else:
             raise InvalidConfigError(
                 "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
@@ -521,7 +530,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             options = sa.engine.url.URL(drivername, **credentials)
 
         self.drivername = drivername
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = get_sqlalchemy_engine(options, **create_engine_kwargs)
         return engine
 
     def _get_sqlalchemy_key_pair_auth_url(
@@ -827,9 +836,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 query["domain_kwargs"], domain_type="identity"
             )
             assert len(query["select"]) == len(query["ids"])
-            res = self.engine.execute(
-                sa.select(query["select"]).select_from(selectable)
-            ).fetchall()
+            bundle_query = sa.select(query["select"]).select_from(selectable)
+            start_time = time.perf_counter()
+            res = self.engine.execute(bundle_query).fetchall()
+            if self.metric_resolution_callback is not None:
+                self._emit_metric_resolution_event(
+                    metric_ids=query["ids"],
+                    metric_names=[metric_id[0] for metric_id in query["ids"]],
+                    bundle=True,
+                    duration_seconds=time.perf_counter() - start_time,
+                    sql=str(bundle_query.compile(dialect=self.engine.dialect)),
+                )
             logger.debug(
                 f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(compute_domain_kwargs).to_id()}"
             )
@@ -1,6 +1,5 @@
 from typing import Dict, List, Optional, Union
 
-import altair as alt
 import pandas as pd
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
@@ -189,6 +188,9 @@ class ExpectColumnDistinctValuesToBeInSet(ColumnExpectation):
         runtime_configuration=None,
         **kwargs
     ):
+        # altair is only needed to render charts; importing it lazily keeps it off the import path of the validator
+        import altair as alt
+
         assert result, "Must pass in result."
         value_count_dicts = result.result["details"]["value_counts"]
         if isinstance(value_count_dicts, pd.Series):
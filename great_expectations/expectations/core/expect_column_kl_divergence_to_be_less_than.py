@@ -1,9 +1,7 @@
 from typing import Dict, Optional
 
-import altair as alt
 import numpy as np
 import pandas as pd
-from scipy import stats as stats
 
 from great_expectations.core import ExpectationConfiguration
 from great_expectations.execution_engine import ExecutionEngine
@@ -307,6 +305,8 @@ class ExpectColumnKlDivergenceToBeLessThan(TableExpectation):
         runtime_configuration: dict = None,
         execution_engine: ExecutionEngine = None,
     ):
+        from scipy import stats
+
         bucketize_data = configuration.kwargs.get(
             "bucketize_data", self.default_kwarg_values["bucketize_data"]
         )
@@ -662,6 +662,8 @@ class ExpectColumnKlDivergenceToBeLessThan(TableExpectation):
 
     @classmethod
     def _get_kl_divergence_chart(cls, partition_object, header=None):
+        import altair as alt
+
         weights = partition_object["weights"]
 
         if len(weights) > 60:
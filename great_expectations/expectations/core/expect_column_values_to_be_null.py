@@ -151,7 +151,7 @@ class ExpectColumnValuesToBeNull(ColumnMapExpectation):
         )
 
         # We do not need this metric for a null metric
-        del dependencies["metrics"]["column_values.nonnull.unexpected_count"]
+        dependencies["metrics"].pop("column_values.nonnull.unexpected_count", None)
         return dependencies
 
     def _validate(
@@ -172,6 +172,18 @@ class ExpectColumnValuesToBeNull(ColumnMapExpectation):
             result_format = configuration.kwargs.get(
                 "result_format", self.default_kwarg_values.get("result_format")
             )
+        unexpected_exists = metrics.get(self.map_metric + ".unexpected_exists")
+        if unexpected_exists is not None:
+            return _format_map_output(
+                result_format=parse_result_format(result_format),
+                success=not unexpected_exists,
+                element_count=None,
+                nonnull_count=None,
+                unexpected_count=None,
+                unexpected_list=None,
+                unexpected_index_list=None,
+            )
+
         mostly = self.get_success_kwargs().get(
             "mostly", self.default_kwarg_values.get("mostly")
         )
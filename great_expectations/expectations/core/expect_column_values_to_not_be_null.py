@@ -235,6 +235,18 @@ class ExpectColumnValuesToNotBeNull(ColumnMapExpectation):
             result_format = configuration.kwargs.get(
                 "result_format", self.default_kwarg_values.get("result_format")
             )
+        unexpected_exists = metrics.get(self.map_metric + ".unexpected_exists")
+        if unexpected_exists is not None:
+            return _format_map_output(
+                result_format=parse_result_format(result_format),
+                success=not unexpected_exists,
+                element_count=None,
+                nonnull_count=None,
+                unexpected_count=None,
+                unexpected_list=None,
+                unexpected_index_list=None,
+            )
+
         mostly = self.get_success_kwargs().get(
             "mostly", self.default_kwarg_values.get("mostly")
         )
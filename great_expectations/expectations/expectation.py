@@ -5,7 +5,7 @@ from abc import ABC, ABCMeta, abstractmethod
 from collections import Counter
 from copy import deepcopy
 from inspect import isabstract
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.batch import Batch
@@ -22,6 +22,8 @@ from great_expectations.exceptions import (
     InvalidExpectationKwargsError,
 )
 from great_expectations.expectations.registry import (
+    _load_expectation_from_manifest,
+    _load_metric_from_manifest,
     _registered_metrics,
     _registered_renderers,
     get_metric_kwargs,
@@ -44,7 +46,10 @@ from ..render.types import (
     RenderedTableContent,
 )
 from ..render.util import num_to_str
-from ..validator.validation_graph import MetricConfiguration
+from ..validator.validation_graph import (
+    MetricConfiguration,
+    get_result_format_unneeded_metric_suffixes,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -501,12 +506,18 @@ class Expectation(metaclass=MetaExpectation):
         if configuration is None:
             configuration = self.configuration
         provided_metrics = dict()
-        requested_metrics = self.get_validation_dependencies(
+        validation_dependencies = self.get_validation_dependencies(
             configuration,
             execution_engine=execution_engine,
             runtime_configuration=runtime_configuration,
-        )["metrics"]
-        for name, metric_edge_key in requested_metrics.items():
+        )
+        # metrics the result_format does not use are pruned from the validation graph and never resolved
+        unneeded_metric_names = self.get_result_format_unneeded_metric_names(
+            validation_dependencies["result_format"]
+        )
+        for name, metric_edge_key in validation_dependencies["metrics"].items():
+            if metric_edge_key.metric_name in unneeded_metric_names:
+                continue
             provided_metrics[name] = metrics[metric_edge_key.id]
 
         return self._build_evr(
@@ -550,6 +561,14 @@ class Expectation(metaclass=MetaExpectation):
             "metrics": dict(),
         }
 
+    def get_result_format_unneeded_metric_names(self, result_format: dict) -> Set[str]:
+        """Returns the names of the metric dependencies that are not used by the provided (parsed) result format.
+
+        Only map expectations leave parts of their result out depending on the result format, so by default every
+        metric dependency is needed.
+        """
+        return set()
+
     def get_domain_kwargs(
         self, configuration: Optional[ExpectationConfiguration] = None
     ):
@@ -885,6 +904,8 @@ class Expectation(metaclass=MetaExpectation):
         return validation_results
 
     def _get_supported_renderers(self, snake_name: str) -> List[str]:
+        if snake_name not in _registered_renderers:
+            _load_expectation_from_manifest(snake_name)
         supported_renderers = list(_registered_renderers[snake_name].keys())
         supported_renderers.sort()
         return supported_renderers
@@ -1002,6 +1023,8 @@ class Expectation(metaclass=MetaExpectation):
         ]:
             all_true = True
             for metric in upstream_metrics:
+                if metric not in _registered_metrics:
+                    _load_metric_from_manifest(metric)
                 if not provider in _registered_metrics[metric]["providers"]:
                     all_true = False
                     break
@@ -1197,6 +1220,15 @@ class ColumnMapExpectation(TableExpectation, ABC):
             raise InvalidExpectationConfigurationError(str(e))
         return True
 
+    def get_result_format_unneeded_metric_names(self, result_format: dict) -> Set[str]:
+        if self.map_metric is None:
+            return set()
+        # These metrics only populate the result built by _format_map_output
+        return {
+            self.map_metric + suffix
+            for suffix in get_result_format_unneeded_metric_suffixes(result_format)
+        }
+
     def get_validation_dependencies(
         self,
         configuration: Optional[ExpectationConfiguration] = None,
@@ -1214,6 +1246,25 @@ class ColumnMapExpectation(TableExpectation, ABC):
         ), "ColumnMapExpectation must be configured using map_metric, and cannot have metric_dependencies declared."
         # convenient name for updates
         metric_dependencies = dependencies["metrics"]
+
+        result_format_str = dependencies["result_format"].get("result_format")
+        mostly = self.get_success_kwargs(configuration).get("mostly")
+        if result_format_str == "BOOLEAN_ONLY" and mostly == 1:
+            # Success is then decided by whether any unexpected value exists, which does not require counting rows
+            metric_kwargs = get_metric_kwargs(
+                metric_name=self.map_metric + ".unexpected_exists",
+                configuration=configuration,
+                runtime_configuration=runtime_configuration,
+            )
+            metric_dependencies[
+                self.map_metric + ".unexpected_exists"
+            ] = MetricConfiguration(
+                self.map_metric + ".unexpected_exists",
+                metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
+                metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
+            )
+            return dependencies
+
         metric_kwargs = get_metric_kwargs(
             metric_name="column_values.nonnull.unexpected_count",
             configuration=configuration,
@@ -1239,7 +1290,6 @@ class ColumnMapExpectation(TableExpectation, ABC):
             metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
         )
 
-        result_format_str = dependencies["result_format"].get("result_format")
         metric_kwargs = get_metric_kwargs(
             metric_name="table.row_count",
             configuration=configuration,
@@ -1314,6 +1364,18 @@ class ColumnMapExpectation(TableExpectation, ABC):
             result_format = configuration.kwargs.get(
                 "result_format", self.default_kwarg_values.get("result_format")
             )
+        unexpected_exists = metrics.get(self.map_metric + ".unexpected_exists")
+        if unexpected_exists is not None:
+            return _format_map_output(
+                result_format=parse_result_format(result_format),
+                success=not unexpected_exists,
+                element_count=None,
+                nonnull_count=None,
+                unexpected_count=None,
+                unexpected_list=None,
+                unexpected_index_list=None,
+            )
+
         mostly = self.get_success_kwargs().get(
             "mostly", self.default_kwarg_values.get("mostly")
         )
@@ -1397,6 +1459,15 @@ class ColumnPairMapExpectation(TableExpectation, ABC):
             raise InvalidExpectationConfigurationError(str(e))
         return True
 
+    def get_result_format_unneeded_metric_names(self, result_format: dict) -> Set[str]:
+        if self.map_metric is None:
+            return set()
+        # These metrics only populate the result built by _format_map_output
+        return {
+            self.map_metric + suffix
+            for suffix in get_result_format_unneeded_metric_suffixes(result_format)
+        }
+
     def get_validation_dependencies(
         self,
         configuration: Optional[ExpectationConfiguration] = None,
@@ -1579,6 +1650,10 @@ def _format_map_output(
     if result_format["result_format"] == "BOOLEAN_ONLY":
         return return_obj
 
+    if unexpected_list is None:
+        # unexpected values are not computed when partial_unexpected_count is 0
+        unexpected_list = []
+
     skip_missing = False
 
     if nonnull_count is None:
@@ -30,7 +30,6 @@ except ImportError as e:
     )
 
 import numpy as np
-from scipy import stats
 
 
 class ColumnBootstrappedKSTestPValue(ColumnMetricProvider):
@@ -49,6 +48,8 @@ class ColumnBootstrappedKSTestPValue(ColumnMetricProvider):
         bootstrap_sample_size=None,
         **kwargs
     ):
+        from scipy import stats
+
         if not is_valid_continuous_partition_object(partition_object):
             raise ValueError("Invalid continuous partition object.")
 
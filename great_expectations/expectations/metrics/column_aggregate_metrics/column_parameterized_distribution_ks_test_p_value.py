@@ -28,8 +28,6 @@ except ImportError as e:
         "Unable to load spark context; install optional spark dependency for support."
     )
 
-from scipy import stats
-
 
 class ColumnParameterizedDistributionKSTestPValue(ColumnMetricProvider):
     """MetricProvider Class for Aggregate Standard Deviation metric"""
@@ -39,6 +37,8 @@ class ColumnParameterizedDistributionKSTestPValue(ColumnMetricProvider):
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, distribution, p_value=0.05, params=None, **kwargs):
+        from scipy import stats
+
         if p_value <= 0 or p_value >= 1:
             raise ValueError("p_value must be between 0 and 1 exclusive")
 
@@ -24,6 +24,7 @@ class ColumnValuesBetween(ColumnMapMetricProvider):
         "parse_strings_as_datetimes",
         "allow_cross_type_comparisons",
     )
+    evaluate_on_unique_values = True
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(
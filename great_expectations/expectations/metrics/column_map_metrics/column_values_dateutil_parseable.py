@@ -1,5 +1,4 @@
-from dateutil.parser import parse
-
+from great_expectations.core.pandas_util import column_values_dateutil_parseable
 from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
@@ -12,20 +11,8 @@ from great_expectations.expectations.metrics.map_metric import (
 
 class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
     condition_metric_name = "column_values.dateutil_parseable"
+    evaluate_on_unique_values = True
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
-        def is_parseable(val):
-            try:
-                if type(val) != str:
-                    raise TypeError(
-                        "Values passed to expect_column_values_to_be_dateutil_parseable must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
-                    )
-
-                parse(val)
-                return True
-
-            except (ValueError, OverflowError):
-                return False
-
-        return column.map(is_parseable)
+        return column_values_dateutil_parseable(column)
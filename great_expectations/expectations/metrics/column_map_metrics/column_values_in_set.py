@@ -1,5 +1,6 @@
 import numpy as np
 
+from great_expectations.core.pandas_util import column_values_in_set
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -17,13 +18,14 @@ from great_expectations.expectations.metrics.map_metric import (
 class ColumnValuesInSet(ColumnMapMetricProvider):
     condition_metric_name = "column_values.in_set"
     condition_value_keys = ("value_set",)
+    evaluate_on_unique_values = True
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, value_set, **kwargs):
         if value_set is None:
             # Vacuously true
             return np.ones(len(column), dtype=np.bool_)
-        return column.isin(value_set)
+        return column_values_in_set(column, value_set)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, value_set, **kwargs):
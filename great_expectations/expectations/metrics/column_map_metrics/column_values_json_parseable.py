@@ -1,5 +1,6 @@
 import json
 
+from great_expectations.core.pandas_util import column_values_json_parseable
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -13,17 +14,11 @@ from great_expectations.expectations.metrics.map_metric import (
 
 class ColumnValuesJsonParseable(ColumnMapMetricProvider):
     condition_metric_name = "column_values.json_parseable"
+    evaluate_on_unique_values = True
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
-        def is_json(val):
-            try:
-                json.loads(val)
-                return True
-            except:
-                return False
-
-        return column.map(is_json)
+        return column_values_json_parseable(column)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, json_schema, **kwargs):
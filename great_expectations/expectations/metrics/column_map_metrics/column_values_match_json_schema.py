@@ -2,6 +2,7 @@ import json
 
 import jsonschema
 
+from great_expectations.core.pandas_util import column_values_match_json_schema
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -16,24 +17,11 @@ from great_expectations.expectations.metrics.map_metric import (
 class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
     condition_metric_name = "column_values.match_json_schema"
     condition_value_keys = ("json_schema",)
+    evaluate_on_unique_values = True
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, json_schema, **kwargs):
-        def matches_json_schema(val):
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
-
-        return column.map(matches_json_schema)
+        return column_values_match_json_schema(column, json_schema)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, json_schema, **kwargs):
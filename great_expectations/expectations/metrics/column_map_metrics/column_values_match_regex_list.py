@@ -1,7 +1,6 @@
 import logging
 
-import pandas as pd
-
+from great_expectations.core.pandas_util import column_values_match_regex_list
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -25,14 +24,12 @@ class ColumnValuesMatchRegexList(ColumnMapMetricProvider):
         "regex_list",
         "match_on",
     )
+    evaluate_on_unique_values = True
     default_kwarg_values = {"match_on": "any"}
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex_list, match_on, **kwargs):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
+        regex_match_df = column_values_match_regex_list(column, regex_list)
 
         if match_on == "any":
             result = regex_match_df.any(axis="columns")
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from great_expectations.core.pandas_util import column_values_match_strftime_format
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -14,21 +15,11 @@ from great_expectations.expectations.metrics.map_metric import (
 class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
     condition_metric_name = "column_values.match_strftime_format"
     condition_value_keys = ("strftime_format",)
+    evaluate_on_unique_values = True
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, strftime_format, **kwargs):
-        def is_parseable_by_format(val):
-            try:
-                datetime.strptime(val, strftime_format)
-                return True
-            except TypeError:
-                raise TypeError(
-                    "Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
-                )
-            except ValueError:
-                return False
-
-        return column.map(is_parseable_by_format)
+        return column_values_match_strftime_format(column, strftime_format)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, strftime_format, **kwargs):
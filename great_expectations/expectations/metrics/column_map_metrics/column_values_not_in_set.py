@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 
+from great_expectations.core.pandas_util import column_values_in_set
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -21,6 +22,7 @@ class ColumnValuesNotInSet(ColumnMapMetricProvider):
         "value_set",
         "parse_strings_as_datetimes",
     )
+    evaluate_on_unique_values = True
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, value_set, **kwargs):
@@ -32,7 +34,7 @@ class ColumnValuesNotInSet(ColumnMapMetricProvider):
         else:
             parsed_value_set = value_set
 
-        return ~column.isin(parsed_value_set)
+        return ~column_values_in_set(column, parsed_value_set)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, value_set, parse_strings_as_datetimes, **kwargs):
@@ -1,5 +1,6 @@
 import logging
 
+from great_expectations.core.pandas_util import column_values_match_regex
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -19,10 +20,11 @@ logger = logging.getLogger(__name__)
 class ColumnValuesNotMatchRegex(ColumnMapMetricProvider):
     condition_metric_name = "column_values.not_match_regex"
     condition_value_keys = ("regex",)
+    evaluate_on_unique_values = True
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex, **kwargs):
-        return ~column.astype(str).str.contains(regex)
+        return ~column_values_match_regex(column, regex)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, regex, _dialect, **kwargs):
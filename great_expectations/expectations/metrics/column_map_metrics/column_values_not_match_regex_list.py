@@ -1,7 +1,6 @@
 import logging
 
-import pandas as pd
-
+from great_expectations.core.pandas_util import column_values_match_regex_list
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -22,13 +21,11 @@ logger = logging.getLogger(__name__)
 class ColumnValuesNotMatchRegexList(ColumnMapMetricProvider):
     condition_metric_name = "column_values.not_match_regex_list"
     condition_value_keys = ("regex_list",)
+    evaluate_on_unique_values = True
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex_list, **kwargs):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
+        regex_match_df = column_values_match_regex_list(column, regex_list)
 
         return ~regex_match_df.any(axis="columns")
 
@@ -2,9 +2,6 @@ import numpy as np
 import pandas as pd
 
 from great_expectations.execution_engine import PandasExecutionEngine
-from great_expectations.expectations.core.expect_column_values_to_be_of_type import (
-    _native_type_type_map,
-)
 from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
@@ -14,9 +11,15 @@ from great_expectations.expectations.metrics.map_metric import (
 class ColumnValuesOfType(ColumnMapMetricProvider):
     condition_metric_name = "column_values.of_type"
     condition_value_keys = ("type_",)
+    evaluate_on_unique_values = True
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, type_, **kwargs):
+        # Imported here because the expectations.core package imports the metrics package
+        from great_expectations.expectations.core.expect_column_values_to_be_of_type import (
+            _native_type_type_map,
+        )
+
         comp_types = []
         try:
             comp_types.append(np.dtype(type_).type)
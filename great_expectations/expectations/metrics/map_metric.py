@@ -5,6 +5,10 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 import numpy as np
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.pandas_util import (
+    evaluate_condition_on_unique_values,
+    is_low_cardinality,
+)
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.exceptions.metric_exceptions import (
     MetricError,
@@ -287,12 +291,28 @@ def column_condition_partial(
                 if filter_column_isnull:
                     df = df[df[accessor_domain_kwargs["column"]].notnull()]
 
-                meets_expectation_series = metric_fn(
-                    cls,
-                    df[accessor_domain_kwargs["column"]],
-                    **metric_value_kwargs,
-                    _metrics=metrics,
+                evaluate_on_unique_values = kwargs.get(
+                    "evaluate_on_unique_values",
+                    getattr(cls, "evaluate_on_unique_values", False),
                 )
+                column = df[accessor_domain_kwargs["column"]]
+                if evaluate_on_unique_values and is_low_cardinality(column):
+                    meets_expectation_series = evaluate_condition_on_unique_values(
+                        column,
+                        lambda values: metric_fn(
+                            cls,
+                            values,
+                            **metric_value_kwargs,
+                            _metrics=metrics,
+                        ),
+                    )
+                else:
+                    meets_expectation_series = metric_fn(
+                        cls,
+                        column,
+                        **metric_value_kwargs,
+                        _metrics=metrics,
+                    )
                 return (
                     ~meets_expectation_series,
                     compute_domain_kwargs,
@@ -460,6 +480,18 @@ def _pandas_map_condition_unexpected_count(
     return np.count_nonzero(metrics["unexpected_condition"][0])
 
 
+def _pandas_map_condition_unexpected_exists(
+    cls,
+    execution_engine: "PandasExecutionEngine",
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns whether any row fails the condition for MapExpectations"""
+    return bool(np.any(metrics["unexpected_condition"][0]))
+
+
 def _pandas_column_map_condition_values(
     cls,
     execution_engine: "PandasExecutionEngine",
@@ -806,6 +838,45 @@ def _sqlalchemy_map_condition_unexpected_count_value(
     return convert_to_json_serializable(unexpected_count)
 
 
+def _sqlalchemy_map_condition_unexpected_exists(
+    cls,
+    execution_engine: "SqlAlchemyExecutionEngine",
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns whether any row fails the condition for MapExpectations. The query stops at the first unexpected row
+    instead of counting all of them.
+    """
+    unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics.get(
+        "unexpected_condition"
+    )
+    (selectable, _, _,) = execution_engine.get_compute_domain(
+        compute_domain_kwargs, domain_type="identity"
+    )
+    # The condition is evaluated in a subquery so that window conditions, which cannot appear in a WHERE clause, are
+    # supported as well.
+    condition_subquery = (
+        sa.select(
+            [
+                sa.case(
+                    [(unexpected_condition, 1)],
+                    else_=0,
+                ).label("condition")
+            ]
+        )
+        .select_from(selectable)
+        .alias("UnexpectedConditionSubquery")
+    )
+    query = (
+        sa.select([condition_subquery.c.condition])
+        .where(condition_subquery.c.condition == 1)
+        .limit(1)
+    )
+    return execution_engine.engine.execute(query).fetchone() is not None
+
+
 def _sqlalchemy_column_map_condition_values(
     cls,
     execution_engine: "SqlAlchemyExecutionEngine",
@@ -943,6 +1014,26 @@ def _spark_map_condition_unexpected_count_value(
     return filtered.count()
 
 
+def _spark_map_condition_unexpected_exists(
+    cls,
+    execution_engine: "SparkDFExecutionEngine",
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns whether any row fails the condition for MapExpectations"""
+    unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics.get(
+        "unexpected_condition"
+    )
+    (df, _, _) = execution_engine.get_compute_domain(
+        domain_kwargs=compute_domain_kwargs, domain_type="identity"
+    )
+    data = df.withColumn("__unexpected", unexpected_condition)
+    filtered = data.filter(F.col("__unexpected") == True).drop(F.col("__unexpected"))
+    return len(filtered.take(1)) > 0
+
+
 def spark_column_map_condition_values(
     cls,
     execution_engine: "SparkDFExecutionEngine",
@@ -1052,6 +1143,9 @@ class MapMetricProvider(MetricProvider):
     condition_value_keys = tuple()
     function_value_keys = tuple()
     filter_column_isnull = True
+    # Set to True on providers whose pandas condition is a pure function of each value, so that low-cardinality
+    # columns can be evaluated once per distinct value and broadcast back to the rows.
+    evaluate_on_unique_values = False
 
     @classmethod
     def _register_metric_functions(cls):
@@ -1114,6 +1208,15 @@ class MapMetricProvider(MetricProvider):
                         metric_provider=_pandas_map_condition_unexpected_count,
                         metric_fn_type=MetricFunctionTypes.VALUE,
                     )
+                    register_metric(
+                        metric_name=metric_name + ".unexpected_exists",
+                        metric_domain_keys=metric_domain_keys,
+                        metric_value_keys=metric_value_keys,
+                        execution_engine=engine,
+                        metric_class=cls,
+                        metric_provider=_pandas_map_condition_unexpected_exists,
+                        metric_fn_type=MetricFunctionTypes.VALUE,
+                    )
                     register_metric(
                         metric_name=metric_name + ".unexpected_index_list",
                         metric_domain_keys=metric_domain_keys,
@@ -1193,6 +1296,15 @@ class MapMetricProvider(MetricProvider):
                             metric_provider=_sqlalchemy_map_condition_unexpected_count_value,
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
+                    register_metric(
+                        metric_name=metric_name + ".unexpected_exists",
+                        metric_domain_keys=metric_domain_keys,
+                        metric_value_keys=metric_value_keys,
+                        execution_engine=engine,
+                        metric_class=cls,
+                        metric_provider=_sqlalchemy_map_condition_unexpected_exists,
+                        metric_fn_type=MetricFunctionTypes.VALUE,
+                    )
                     register_metric(
                         metric_name=metric_name + ".unexpected_rows",
                         metric_domain_keys=metric_domain_keys,
@@ -1262,6 +1374,15 @@ class MapMetricProvider(MetricProvider):
                             metric_provider=_spark_map_condition_unexpected_count_value,
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
+                    register_metric(
+                        metric_name=metric_name + ".unexpected_exists",
+                        metric_domain_keys=metric_domain_keys,
+                        metric_value_keys=metric_value_keys,
+                        execution_engine=engine,
+                        metric_class=cls,
+                        metric_provider=_spark_map_condition_unexpected_exists,
+                        metric_fn_type=MetricFunctionTypes.VALUE,
+                    )
                     register_metric(
                         metric_name=metric_name + ".unexpected_rows",
                         metric_domain_keys=metric_domain_keys,
@@ -1358,6 +1479,7 @@ class MapMetricProvider(MetricProvider):
             )
 
         for metric_suffix in [
+            ".unexpected_exists",
             ".unexpected_values",
             ".unexpected_value_counts",
             ".unexpected_index_list",
@@ -17,6 +17,12 @@ from great_expectations.expectations.metrics.import_manager import (
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.expectations.metrics.table_metric import TableMetricProvider
 from great_expectations.expectations.metrics.util import column_reflection_fallback
+from great_expectations.util import get_cached_sqlalchemy_metadata
+
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
 
 
 class ColumnTypes(TableMetricProvider):
@@ -64,7 +70,11 @@ class ColumnTypes(TableMetricProvider):
             raise GreatExpectationsError(
                 "the requested batch is not available; please load the batch into the execution engine."
             )
-        return _get_sqlalchemy_column_metadata(execution_engine.engine, batch_data)
+        return _get_sqlalchemy_column_metadata(
+            execution_engine.engine,
+            batch_data,
+            ttl_seconds=getattr(execution_engine, "metadata_cache_ttl_seconds", None),
+        )
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -83,7 +93,27 @@ class ColumnTypes(TableMetricProvider):
         )
 
 
-def _get_sqlalchemy_column_metadata(engine, batch_data: SqlAlchemyBatchData):
+def _get_sqlalchemy_column_metadata(
+    engine, batch_data: SqlAlchemyBatchData, ttl_seconds: float = None
+):
+    selectable = batch_data.selectable
+    if sa is None or not ttl_seconds or not isinstance(selectable, sa.Table):
+        # Only the columns of named tables are cached; those of queries and temporary tables may change per batch
+        return _reflect_sqlalchemy_column_metadata(engine, batch_data)
+
+    columns = get_cached_sqlalchemy_metadata(
+        engine,
+        "columns",
+        selectable.schema,
+        selectable.name,
+        fetch=lambda: _reflect_sqlalchemy_column_metadata(engine, batch_data),
+        ttl_seconds=ttl_seconds,
+    )
+    # Callers may modify the column dicts, which must not change the cached ones
+    return [dict(column) for column in columns]
+
+
+def _reflect_sqlalchemy_column_metadata(engine, batch_data: SqlAlchemyBatchData):
     insp = reflection.Inspector.from_engine(engine)
     try:
         columns = insp.get_columns(
@@ -1,4 +1,9 @@
+import ast
+import importlib
+import json
 import logging
+import os
+import re
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from great_expectations.core.id_dict import IDDict
@@ -12,6 +17,16 @@ _registered_expectations = dict()
 _registered_metrics = dict()
 _registered_renderers = dict()
 
+# The registry manifest maps expectation types and metric names to the module that defines them, so that providers
+# can be imported the first time they are looked up instead of all at once. It is generated by
+# build_registry_manifest() and shipped with the package; see write_registry_manifest().
+_REGISTRY_MANIFEST_FILENAME = "registry_manifest.json"
+_REGISTRY_MANIFEST_PACKAGES = (
+    "great_expectations.expectations.core",
+    "great_expectations.expectations.metrics",
+)
+_registry_manifest = None
+
 """
 {
   "metric_name"
@@ -64,6 +79,10 @@ def register_renderer(
 
 
 def get_renderer_impl(object_name, renderer_type):
+    if object_name not in _registered_renderers:
+        _load_expectation_from_manifest(object_name) or _load_metric_from_manifest(
+            object_name
+        )
     return _registered_renderers.get(object_name, {}).get(renderer_type)
 
 
@@ -169,6 +188,8 @@ def register_metric(
 def get_metric_provider(
     metric_name: str, execution_engine: "ExecutionEngine"
 ) -> Tuple["MetricProvider", Callable]:
+    if metric_name not in _registered_metrics:
+        _load_metric_from_manifest(metric_name)
     try:
         metric_definition = _registered_metrics[metric_name]
         return metric_definition["providers"][type(execution_engine).__name__]
@@ -181,6 +202,8 @@ def get_metric_provider(
 def get_metric_function_type(
     metric_name: str, execution_engine: "ExecutionEngine"
 ) -> Optional[Union["MetricPartialFunctionTypes", "MetricFunctionTypes"]]:
+    if metric_name not in _registered_metrics:
+        _load_metric_from_manifest(metric_name)
     try:
         metric_definition = _registered_metrics[metric_name]
         provider_fn, provider_class = metric_definition["providers"][
@@ -198,6 +221,8 @@ def get_metric_kwargs(
     configuration: Optional["ExpectationConfiguration"] = None,
     runtime_configuration: Optional[dict] = None,
 ) -> Dict:
+    if metric_name not in _registered_metrics:
+        _load_metric_from_manifest(metric_name)
     try:
         metric_definition = _registered_metrics.get(metric_name)
         if metric_definition is None:
@@ -250,12 +275,15 @@ def get_domain_metrics_dict_by_name(
 
 
 def get_expectation_impl(expectation_name):
+    if expectation_name not in _registered_expectations:
+        _load_expectation_from_manifest(expectation_name)
     return _registered_expectations.get(expectation_name)
 
 
 def list_registered_expectation_implementations(
     expectation_root: Type["Expectation"] = None,
 ) -> List[str]:
+    load_all_expectations_from_manifest()
     registered_expectation_implementations = []
     for (
         expectation_name,
@@ -269,3 +297,119 @@ def list_registered_expectation_implementations(
             registered_expectation_implementations.append(expectation_name)
 
     return registered_expectation_implementations
+
+
+def _get_registry_manifest() -> dict:
+    global _registry_manifest
+    if _registry_manifest is None:
+        manifest_path = os.path.join(
+            os.path.dirname(__file__), _REGISTRY_MANIFEST_FILENAME
+        )
+        try:
+            with open(manifest_path) as infile:
+                _registry_manifest = json.load(infile)
+        except (OSError, ValueError):
+            logger.debug(
+                f"No registry manifest found at {manifest_path}; expectations and metrics must be imported "
+                f"before they are used."
+            )
+            _registry_manifest = {"expectations": {}, "metrics": {}}
+    return _registry_manifest
+
+
+def _load_expectation_from_manifest(expectation_type: str) -> bool:
+    module_name = _get_registry_manifest()["expectations"].get(expectation_type)
+    if module_name is None:
+        return False
+    logger.debug(f"Importing {module_name} to register {expectation_type}.")
+    importlib.import_module(module_name)
+    return True
+
+
+def _load_metric_from_manifest(metric_name: str) -> bool:
+    # Derived metrics such as "column_values.in_set.unexpected_count" are registered by the provider of their base
+    # metric, so strip suffixes until a declared metric name is found.
+    manifest_metrics = _get_registry_manifest()["metrics"]
+    candidate_name = metric_name
+    while candidate_name not in manifest_metrics:
+        if "." not in candidate_name:
+            return False
+        candidate_name = candidate_name.rsplit(".", 1)[0]
+    module_name = manifest_metrics[candidate_name]
+    logger.debug(f"Importing {module_name} to register {metric_name}.")
+    importlib.import_module(module_name)
+    return True
+
+
+def load_all_expectations_from_manifest() -> None:
+    for module_name in set(_get_registry_manifest()["expectations"].values()):
+        importlib.import_module(module_name)
+
+
+def _camel_to_snake(name: str) -> str:
+    # Mirrors expectation.camel_to_snake, which cannot be imported here without a circular import
+    name = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
+    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+
+
+def build_registry_manifest() -> dict:
+    """Build the registry manifest by parsing (not importing) the modules in the core expectation and metric packages.
+
+    Returns:
+        A dictionary with "expectations" and "metrics" keys, each mapping a registered name to a module path.
+    """
+    package_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    manifest = {"expectations": {}, "metrics": {}}
+    for package_name in _REGISTRY_MANIFEST_PACKAGES:
+        package_dir = os.path.join(package_root, *package_name.split("."))
+        for dirpath, dirnames, filenames in os.walk(package_dir):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if not filename.endswith(".py") or filename == "__init__.py":
+                    continue
+                module_path = os.path.join(dirpath, filename)
+                module_name = ".".join(
+                    os.path.relpath(module_path[: -len(".py")], package_root).split(
+                        os.sep
+                    )
+                )
+                with open(module_path) as infile:
+                    module_ast = ast.parse(infile.read(), filename=module_path)
+                for node in module_ast.body:
+                    if not isinstance(node, ast.ClassDef):
+                        continue
+                    if node.name.startswith("Expect"):
+                        manifest["expectations"][
+                            _camel_to_snake(node.name)
+                        ] = module_name
+                    for statement in node.body:
+                        if (
+                            isinstance(statement, ast.Assign)
+                            and len(statement.targets) == 1
+                            and isinstance(statement.targets[0], ast.Name)
+                            and statement.targets[0].id
+                            in (
+                                "metric_name",
+                                "condition_metric_name",
+                                "function_metric_name",
+                            )
+                            and isinstance(statement.value, ast.Str)
+                        ):
+                            manifest["metrics"][statement.value.s] = module_name
+    return manifest
+
+
+def write_registry_manifest(manifest_path: Optional[str] = None) -> str:
+    """Regenerate the registry manifest shipped with the package. Run after adding or renaming a core expectation or
+    metric provider."""
+    global _registry_manifest
+    if manifest_path is None:
+        manifest_path = os.path.join(
+            os.path.dirname(__file__), _REGISTRY_MANIFEST_FILENAME
+        )
+    manifest = build_registry_manifest()
+    with open(manifest_path, "w") as outfile:
+        json.dump(manifest, outfile, indent=2, sort_keys=True)
+        outfile.write("\n")
+    _registry_manifest = manifest
+    return manifest_path
@@ -10,7 +10,7 @@ from dateutil.parser import parse
 from great_expectations.core.expectation_suite import ExpectationSuite
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_asset import DataAsset
-from great_expectations.dataset import Dataset
+from great_expectations.dataset import Dataset, PandasDataset
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.validator.validator import Validator
 
@@ -203,6 +203,151 @@ profiler_semantic_types = {
 }
 
 
+def get_profiling_sample(dataset, sample_size, random_state=0):
+    """
+    Draws a sample of at most sample_size rows from dataset, so that profilers can cheaply classify its columns (by
+    type and cardinality) before computing statistics on the full dataset.
+
+    Rows are drawn uniformly at random: a PandasDataset with DataFrame.sample, other datasets with their random_sample
+    method (see SqlAlchemyDataset.random_sample and SparkDFDataset.random_sample). Datasets without one return their
+    first sample_size rows (see Dataset.head).
+    Args:
+        dataset: A GE Dataset
+        sample_size: The maximum number of rows in the sample
+        random_state: Seed for sampling, where the backend supports one
+
+    Returns:
+        A PandasDataset, or None if dataset has no more than sample_size rows (and should be classified directly)
+    """
+    if sample_size is None or dataset.get_row_count() <= sample_size:
+        return None
+    if isinstance(dataset, PandasDataset):
+        return PandasDataset(dataset.sample(n=sample_size, random_state=random_state))
+    if hasattr(dataset, "random_sample"):
+        return dataset.random_sample(n=sample_size, random_state=random_state)
+    return dataset.head(n=sample_size)
+
+
+def get_sample_coverage(sample, column):
+    """
+    Estimates the fraction of the rows of the full dataset whose value in column also appears in the sample, using the
+    Good-Turing estimate (one minus the fraction of sampled values that were seen exactly once). It measures how much
+    to trust a cardinality classification made on the sample.
+    Args:
+        sample: A PandasDataset sample
+        column: The column for which to estimate coverage
+
+    Returns:
+        The estimated coverage, between 0 and 1
+    """
+    value_counts = sample.get_column_value_counts(column, sort="none")
+    sampled_count = value_counts.sum()
+    if sampled_count == 0:
+        return 1.0
+    return float(1 - (value_counts == 1).sum() / sampled_count)
+
+
+def estimate_column_cardinality_from_sample(sample, column, row_count):
+    """
+    Estimates the number and proportion of unique values of column in a dataset of row_count rows from a random sample
+    of it. The proportion of unique values observed on a sample is inflated (500 distinct values are few among 1e8
+    rows, but many among 10,000 sampled rows), so the number of distinct values is extrapolated with the bias-corrected
+    Chao1 estimator, and divided by the estimated number of non-null rows of the full dataset. A column whose sampled
+    values are all distinct is estimated to be unique.
+
+    The range of numbers of distinct values consistent with the sample goes from the Chao1 estimate, which is a lower
+    bound, to the number reached if every value seen once in the sample stood for as many distinct values as the rows
+    it represents.
+    Args:
+        sample: A PandasDataset sample
+        column: The column for which to estimate cardinality
+        row_count: The number of rows of the full dataset
+
+    Returns:
+        A dict with the estimated "num_unique" and "pct_unique" of the full dataset, and the "min_num_unique",
+        "max_num_unique" and "nonnull_count" against which to classify the range consistent with the sample
+    """
+    value_counts = sample.get_column_value_counts(column, sort="none")
+    sampled_nonnull_count = int(value_counts.sum())
+    if sampled_nonnull_count == 0:
+        return {
+            "num_unique": 0,
+            "pct_unique": None,
+            "min_num_unique": 0,
+            "max_num_unique": 0,
+            "nonnull_count": 0,
+        }
+
+    nonnull_count = max(
+        sampled_nonnull_count,
+        int(round(row_count * sampled_nonnull_count / len(sample))),
+    )
+    observed_num_unique = len(value_counts)
+    singletons = int((value_counts == 1).sum())
+    doubletons = int((value_counts == 2).sum())
+    chao1_num_unique = observed_num_unique + singletons * (singletons - 1) / (
+        2 * (doubletons + 1)
+    )
+    min_num_unique = int(round(min(chao1_num_unique, nonnull_count)))
+    max_num_unique = int(
+        round(
+            min(
+                observed_num_unique
+                + singletons * (nonnull_count / sampled_nonnull_count - 1),
+                nonnull_count,
+            )
+        )
+    )
+    if singletons == sampled_nonnull_count:
+        num_unique = nonnull_count
+    else:
+        num_unique = min_num_unique
+
+    return {
+        "num_unique": num_unique,
+        "pct_unique": num_unique / nonnull_count,
+        "min_num_unique": min_num_unique,
+        "max_num_unique": max_num_unique,
+        "nonnull_count": nonnull_count,
+    }
+
+
+def get_sample_confidence(sample, columns, row_count, get_cardinality):
+    """
+    Estimates the confidence of cardinality classifications made on a sample. A column's classification is trusted
+    when get_cardinality gives the same class at both ends of the range of numbers of distinct values consistent with
+    the sample (see estimate_column_cardinality_from_sample); otherwise it is only trusted as much as the sample covers
+    the column's values (see get_sample_coverage). The confidence is the lowest across columns, so that it drops as
+    soon as the classification of any column could flip on the full dataset.
+    Args:
+        sample: A PandasDataset sample
+        columns: The columns classified on the sample
+        row_count: The number of rows of the full dataset
+        get_cardinality: A function classifying a column from its number and proportion of unique values
+
+    Returns:
+        The confidence, between 0 and 1
+    """
+    confidences = []
+    for column in columns:
+        estimate = estimate_column_cardinality_from_sample(sample, column, row_count)
+        if estimate["nonnull_count"] == 0:
+            continue
+        cardinality_range = [
+            get_cardinality(num_unique, num_unique / estimate["nonnull_count"])
+            for num_unique in (estimate["min_num_unique"], estimate["max_num_unique"])
+        ]
+        if cardinality_range[0] == cardinality_range[1]:
+            confidences.append(1.0)
+        else:
+            logger.info(
+                f"Column {column} could be classified anywhere from {cardinality_range[0]} to "
+                f"{cardinality_range[1]} on the full dataset"
+            )
+            confidences.append(get_sample_coverage(sample, column))
+    return min(confidences, default=1.0)
+
+
 class Profiler(metaclass=abc.ABCMeta):
     """
     Profilers creates suites from various sources of truth.
@@ -5,6 +5,7 @@ from great_expectations.profile.base import (
     ProfilerCardinality,
     ProfilerDataType,
     ProfilerTypeMapping,
+    estimate_column_cardinality_from_sample,
 )
 
 try:
@@ -71,7 +72,12 @@ class BasicDatasetProfilerBase(DatasetProfiler):
         return type_
 
     @classmethod
-    def _get_column_cardinality(cls, df, column):
+    def _get_column_cardinality(cls, df, column, population_row_count=None):
+        """
+        Classifies the cardinality of column. If df is a random sample of a dataset of population_row_count rows, the
+        cardinality of that dataset is estimated from the sample (see estimate_column_cardinality_from_sample) rather
+        than taken from the sample's own proportion of unique values.
+        """
         num_unique = None
         pct_unique = None
         df.set_config_value("interactive_evaluation", True)
@@ -90,6 +96,21 @@ class BasicDatasetProfilerBase(DatasetProfiler):
                 )
             )
 
+        if population_row_count is not None and num_unique:
+            estimate = estimate_column_cardinality_from_sample(
+                df, column, population_row_count
+            )
+            num_unique = estimate["num_unique"]
+            pct_unique = estimate["pct_unique"]
+
+        cardinality = cls._get_cardinality_from_counts(num_unique, pct_unique)
+
+        df.set_config_value("interactive_evaluation", False)
+
+        return cardinality
+
+    @classmethod
+    def _get_cardinality_from_counts(cls, num_unique, pct_unique):
         if num_unique is None or num_unique == 0 or pct_unique is None:
             cardinality = ProfilerCardinality.NONE
         elif pct_unique == 1.0:
@@ -110,8 +131,6 @@ class BasicDatasetProfilerBase(DatasetProfiler):
             else:
                 cardinality = ProfilerCardinality.MANY
 
-        df.set_config_value("interactive_evaluation", False)
-
         return cardinality
 
 
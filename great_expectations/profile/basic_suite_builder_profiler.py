@@ -5,9 +5,15 @@ import numpy as np
 from dateutil.parser import parse
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.dataset import PandasDataset
 from great_expectations.dataset.util import build_categorical_partition_object
 from great_expectations.exceptions import ProfilerError
-from great_expectations.profile.base import ProfilerCardinality, ProfilerDataType
+from great_expectations.profile.base import (
+    ProfilerCardinality,
+    ProfilerDataType,
+    get_profiling_sample,
+    get_sample_confidence,
+)
 from great_expectations.profile.basic_dataset_profiler import (
     BasicDatasetProfilerBase,
     logger,
@@ -78,6 +84,19 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
         }
     )
 
+    On large datasets, a `sample_size` key makes the profiler classify columns
+    (by cardinality and type) on a random sample of at most that many rows,
+    extrapolating the number of distinct values of each column to the full
+    dataset, and only compute the statistics of the resulting expectations on
+    the full dataset. The sample size and a confidence estimate for the
+    classification are recorded in the suite's meta under `profiler_sample`:
+
+
+    suite, validation_result = BasicSuiteBuilderProfiler().profile(
+        dataset,
+        {"sample_size": 10000}
+    )
+
     It can also be used to generate an expectation suite that contains one
     instance of every interesting expectation type.
 
@@ -111,14 +130,18 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
         return column_type
 
     @classmethod
-    def _get_column_cardinality_with_caching(cls, dataset, column_name, cache):
+    def _get_column_cardinality_with_caching(
+        cls, dataset, column_name, cache, population_row_count=None
+    ):
         column_cache_entry = cache.get(column_name)
         if not column_cache_entry:
             column_cache_entry = {}
             cache[column_name] = column_cache_entry
         column_cardinality = column_cache_entry.get("cardinality")
         if not column_cardinality:
-            column_cardinality = cls._get_column_cardinality(dataset, column_name)
+            column_cardinality = cls._get_column_cardinality(
+                dataset, column_name, population_row_count=population_row_count
+            )
             column_cache_entry["cardinality"] = column_cardinality
             # remove the expectations
             dataset.remove_expectation(
@@ -608,13 +631,33 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
         )
 
         column_cache = {}
+        sample = None
+        if configuration:
+            sample = get_profiling_sample(dataset, configuration.get("sample_size"))
+        if sample is not None:
+            # Classify the columns on the sample, then build expectations on the full dataset. Column types are only
+            # inferred from the sample for pandas; other backends report them from the schema, which is already cheap.
+            # The cardinality of the full dataset is estimated from the sample, whose own proportion of unique values
+            # is inflated.
+            sample.set_default_expectation_argument("catch_exceptions", False)
+            classification_dataset = sample
+            type_dataset = sample if isinstance(dataset, PandasDataset) else dataset
+            population_row_count = dataset.get_row_count()
+        else:
+            classification_dataset = dataset
+            type_dataset = dataset
+            population_row_count = None
+
         if selected_columns:
             for column in selected_columns:
                 cardinality = cls._get_column_cardinality_with_caching(
-                    dataset, column, column_cache
+                    classification_dataset,
+                    column,
+                    column_cache,
+                    population_row_count=population_row_count,
                 )
                 column_type = cls._get_column_type_with_caching(
-                    dataset, column, column_cache
+                    type_dataset, column, column_cache
                 )
 
                 if cardinality in [
@@ -684,6 +727,17 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
                         )
 
         expectation_suite = cls._build_column_description_metadata(dataset)
+        if sample is not None:
+            expectation_suite.meta["profiler_sample"] = {
+                "sample_size": len(sample),
+                "row_count": population_row_count,
+                "confidence": get_sample_confidence(
+                    sample,
+                    selected_columns,
+                    population_row_count,
+                    cls._get_cardinality_from_counts,
+                ),
+            }
 
         return expectation_suite
 
@@ -11,6 +11,9 @@ from great_expectations.exceptions import ProfilerError
 from great_expectations.profile.base import (
     OrderedProfilerCardinality,
     ProfilerTypeMapping,
+    estimate_column_cardinality_from_sample,
+    get_profiling_sample,
+    get_sample_confidence,
     profiler_data_types_with_mapping,
     profiler_semantic_types,
 )
@@ -55,6 +58,7 @@ class UserConfigurableProfiler:
         semantic_types_dict: dict = None,
         table_expectations_only: bool = False,
         value_set_threshold: str = "MANY",
+        sample_size: int = None,
     ):
         """
         The UserConfigurableProfiler is used to build an expectation suite from a dataset. The profiler may be
@@ -91,6 +95,11 @@ class UserConfigurableProfiler:
                 add a value_set expectation for columns whose cardinality is one of "one", "two", "very_few" or
                 "few". The default value is "many". For the purposes of comparing whether two tables are identical,
                 it might make the most sense to set this to "unique"
+            sample_size: Integer, default None. If set and the dataset has more rows, columns are classified (by
+                cardinality and type) on a random sample of at most this many rows, extrapolating the number of
+                distinct values of each column to the full dataset, and the statistics of the expectations are then
+                computed on the full dataset. The sample size and a confidence estimate for the
+                classification are recorded in the suite's meta under `profiler_sample`
         """
         self.dataset = dataset
         self.column_info = {}
@@ -139,9 +148,26 @@ class UserConfigurableProfiler:
             if column_name not in self.ignored_columns
         ]
 
+        self.sample_size = sample_size
+        self.sample = get_profiling_sample(dataset, sample_size)
+        if self.sample is None:
+            # Cardinality is needed for every included column; compute it for all of them at once
+            dataset.prefetch_column_aggregates(
+                included_columns, aggregates=["nonnull_count", "unique_count"]
+            )
+            classification_dataset = dataset
+            type_dataset = dataset
+        else:
+            # Column types are only inferred from the sample for pandas; other backends report them from the schema
+            classification_dataset = self.sample
+            type_dataset = (
+                self.sample if isinstance(dataset, PandasDataset) else dataset
+            )
         for column_name in included_columns:
-            self._add_column_cardinality_to_column_info(dataset, column_name)
-            self._add_column_type_to_column_info(dataset, column_name)
+            self._add_column_cardinality_to_column_info(
+                classification_dataset, column_name
+            )
+            self._add_column_type_to_column_info(type_dataset, column_name)
 
         if self.semantic_types_dict is not None:
             self._validate_semantic_types_dict(self.dataset)
@@ -202,6 +228,15 @@ class UserConfigurableProfiler:
                 self.dataset, self.primary_or_compound_key
             )
 
+        self._prefetch_numeric_column_aggregates(
+            self.dataset,
+            [
+                column_name
+                for column_name, column_info in self.column_info.items()
+                if "NUMERIC" in column_info.get("semantic_types")
+            ],
+        )
+        self._prefetch_unique_proportion_aggregates(self.dataset)
         for column_name, column_info in self.column_info.items():
             semantic_types = column_info.get("semantic_types")
             for semantic_type in semantic_types:
@@ -212,6 +247,7 @@ class UserConfigurableProfiler:
             self._build_expectations_for_all_column_types(self.dataset, column_name)
 
         expectation_suite = self._build_column_description_metadata(self.dataset)
+        self._add_profiler_sample_to_meta(expectation_suite)
         self._display_suite_by_column(suite=expectation_suite)
         return expectation_suite
 
@@ -228,6 +264,15 @@ class UserConfigurableProfiler:
                 dataset=self.dataset, column_list=self.primary_or_compound_key
             )
         self._build_expectations_table(dataset=self.dataset)
+        self._prefetch_numeric_column_aggregates(
+            self.dataset,
+            [
+                column_name
+                for column_name, column_info in self.column_info.items()
+                if column_info.get("type") in ("FLOAT", "INT", "NUMERIC")
+            ],
+        )
+        self._prefetch_unique_proportion_aggregates(self.dataset)
         for column_name, column_info in self.column_info.items():
             data_type = column_info.get("type")
             cardinality = column_info.get("cardinality")
@@ -257,11 +302,79 @@ class UserConfigurableProfiler:
             )
 
         expectation_suite = self._build_column_description_metadata(self.dataset)
+        self._add_profiler_sample_to_meta(expectation_suite)
         self._display_suite_by_column(
             suite=expectation_suite
         )  # include in the actual profiler
         return expectation_suite
 
+    def _prefetch_numeric_column_aggregates(self, dataset, columns):
+        """
+        Computes, for all numeric columns at once, the aggregates that _build_expectations_numeric will need, so that
+        building their expectations does not query the dataset column by column
+        Args:
+            dataset: A GE Dataset
+            columns: The numeric columns for which expectations will be built
+
+        Returns:
+            None
+        """
+        aggregates = [
+            aggregate
+            for expectation_type, aggregate in [
+                ("expect_column_min_to_be_between", "min"),
+                ("expect_column_max_to_be_between", "max"),
+                ("expect_column_mean_to_be_between", "mean"),
+            ]
+            if expectation_type not in self.excluded_expectations
+        ]
+        if columns and aggregates:
+            dataset.prefetch_column_aggregates(columns, aggregates=aggregates)
+
+    def _prefetch_unique_proportion_aggregates(self, dataset):
+        """
+        When columns were classified on a sample, the full dataset's cardinality aggregates have not been computed yet;
+        computes them for all columns at once before building `expect_column_proportion_of_unique_values_to_be_between`
+        Args:
+            dataset: A GE Dataset
+
+        Returns:
+            None
+        """
+        if (
+            self.sample is not None
+            and self.column_info
+            and "expect_column_proportion_of_unique_values_to_be_between"
+            not in self.excluded_expectations
+        ):
+            dataset.prefetch_column_aggregates(
+                list(self.column_info.keys()),
+                aggregates=["nonnull_count", "unique_count"],
+            )
+
+    def _add_profiler_sample_to_meta(self, expectation_suite):
+        """
+        Records the sample on which columns were classified, if any, in the meta of the expectation suite
+        Args:
+            expectation_suite: The expectation suite being built
+
+        Returns:
+            None
+        """
+        if self.sample is None:
+            return
+        row_count = self.dataset.get_row_count()
+        expectation_suite.meta["profiler_sample"] = {
+            "sample_size": len(self.sample),
+            "row_count": row_count,
+            "confidence": get_sample_confidence(
+                self.sample,
+                list(self.column_info.keys()),
+                row_count,
+                OrderedProfilerCardinality.get_basic_column_cardinality,
+            ),
+        }
+
     def _validate_semantic_types_dict(self, dataset):
         """
         Validates a semantic_types dict to ensure correct formatting, that all semantic_types are recognized, and that
@@ -463,7 +576,8 @@ class UserConfigurableProfiler:
     def _get_column_cardinality(self, dataset, column):
         """
         Determines the cardinality of a column using the get_basic_column_cardinality method from
-        OrderedProfilerCardinality
+        OrderedProfilerCardinality. When dataset is the sample on which columns are classified, the cardinality of the
+        full dataset is estimated from it (see estimate_column_cardinality_from_sample).
         Args:
             dataset: A GE Dataset
             column: The column for which to get cardinality
@@ -489,6 +603,12 @@ class UserConfigurableProfiler:
                     column
                 )
             )
+        if num_unique and self.sample is not None and dataset is self.sample:
+            estimate = estimate_column_cardinality_from_sample(
+                self.sample, column, self.dataset.get_row_count()
+            )
+            num_unique = estimate["num_unique"]
+            pct_unique = estimate["pct_unique"]
         # Previously, if we had 25 possible categories out of 1000 rows, this would comes up as many, because of its
         #  percentage, so it was tweaked here, but is still experimental.
         cardinality = OrderedProfilerCardinality.get_basic_column_cardinality(
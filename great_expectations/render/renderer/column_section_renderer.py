@@ -3,7 +3,6 @@ import logging
 import re
 import traceback
 
-import altair as alt
 import pandas as pd
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
@@ -12,9 +11,6 @@ from great_expectations.core.expectation_validation_result import (
 )
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.exceptions import ClassInstantiationError
-from great_expectations.expectations.core.expect_column_kl_divergence_to_be_less_than import (
-    ExpectColumnKlDivergenceToBeLessThan,
-)
 from great_expectations.expectations.registry import get_renderer_impl
 from great_expectations.render.renderer.content_block import (
     ExceptionListContentBlockRenderer,
@@ -9,6 +9,7 @@ from great_expectations.expectations.registry import (
     _registered_renderers,
     get_expectation_impl,
     get_renderer_impl,
+    load_all_expectations_from_manifest,
 )
 from great_expectations.render.types import (
     CollapseContent,
@@ -364,6 +365,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
 
     @classmethod
     def list_available_expectations(cls):
+        load_all_expectations_from_manifest()
         expectations = [
             object_name
             for object_name in _registered_renderers
@@ -9,6 +9,7 @@ from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
     SiteSectionIdentifier,
 )
+from great_expectations.data_context.store.validations_store import ValidationsStore
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
@@ -689,6 +690,28 @@ class DefaultSiteIndexBuilder:
         return results
 
     # TODO: deprecate dual batch api support
+    def _get_validation_result_summaries(self, keys, validations_store_name=None):
+        """Return the success flag, batch_kwargs and batch_spec of the validation results of keys, which is all the
+        index page needs; a ValidationsStore reads them from its summary index rather than fetching every result."""
+        if validations_store_name is None:
+            validations_store_name = self.data_context.validations_store_name
+        validations_store = self.data_context.stores[validations_store_name]
+        if isinstance(validations_store, ValidationsStore):
+            return validations_store.get_summaries(keys)
+
+        summaries = {}
+        for key in keys:
+            try:
+                validation = validations_store.get(key)
+            except exceptions.StoreError:
+                continue
+            summaries[key] = {
+                "success": validation.success,
+                "batch_kwargs": validation.meta.get("batch_kwargs", {}),
+                "batch_spec": validation.meta.get("batch_spec", {}),
+            }
+        return summaries
+
     def build(self, skip_and_clean_missing=True, build_index: bool = True):
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
@@ -803,17 +826,16 @@ class DefaultSiteIndexBuilder:
                     validation_result_key, profiling_run_name_filter
                 )
             ]
+            profiling_result_summaries = self._get_validation_result_summaries(
+                keys=profiling_result_site_keys,
+                validations_store_name=self.source_stores.get("profiling"),
+            )
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
-                    )
+                    summary = profiling_result_summaries[profiling_result_key]
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    batch_kwargs = summary.get("batch_kwargs") or {}
+                    batch_spec = summary.get("batch_spec") or {}
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -859,18 +881,17 @@ class DefaultSiteIndexBuilder:
                 validation_result_site_keys = validation_result_site_keys[
                     : self.validation_results_limit
                 ]
+            validation_result_summaries = self._get_validation_result_summaries(
+                keys=validation_result_site_keys,
+                validations_store_name=self.source_stores.get("validations"),
+            )
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
-                    )
+                    summary = validation_result_summaries[validation_result_key]
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    validation_success = summary.get("success")
+                    batch_kwargs = summary.get("batch_kwargs") or {}
+                    batch_spec = summary.get("batch_spec") or {}
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
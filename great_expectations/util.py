@@ -3,6 +3,7 @@ import importlib
 import json
 import logging
 import os
+import threading
 import time
 from collections import OrderedDict
 from functools import wraps
@@ -20,16 +21,17 @@ from inspect import (
 )
 from pathlib import Path
 from types import CodeType, FrameType, ModuleType
-from typing import Any, Callable, Optional
-
-from pkg_resources import Distribution
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from great_expectations.core.expectation_suite import expectationSuiteSchema
 from great_expectations.exceptions import (
     PluginClassNotFoundError,
     PluginModuleNotFoundError,
 )
-from great_expectations.expectations.registry import _registered_expectations
+from great_expectations.expectations.registry import (
+    _registered_expectations,
+    load_all_expectations_from_manifest,
+)
 
 try:
     # This library moved in python 3.8
@@ -38,9 +40,21 @@ except ModuleNotFoundError:
     # Fallback for python < 3.8
     import importlib_metadata
 
+if TYPE_CHECKING:
+    # SQLAlchemy is optional, and only imported where it is used (see get_sqlalchemy_engine)
+    import sqlalchemy as sa
+
 
 logger = logging.getLogger(__name__)
 
+_sqlalchemy_engines = dict()
+_sqlalchemy_engines_lock = threading.Lock()
+
+# (engine url, kind, schema name, ...) -> (time fetched, metadata); see get_cached_sqlalchemy_metadata
+_sqlalchemy_metadata_cache = OrderedDict()
+_sqlalchemy_metadata_cache_lock = threading.Lock()
+SQLALCHEMY_METADATA_CACHE_MAX_ENTRIES = 10000
+
 
 def measure_execution_time(func: Callable = None) -> Callable:
     @wraps(func)
@@ -61,8 +75,8 @@ def measure_execution_time(func: Callable = None) -> Callable:
 
 
 # noinspection SpellCheckingInspection
-def get_project_distribution() -> Optional[Distribution]:
-    ditr: Distribution
+def get_project_distribution() -> Optional[importlib_metadata.Distribution]:
+    ditr: importlib_metadata.Distribution
     for distr in importlib_metadata.distributions():
         relative_path: Path
         try:
@@ -891,8 +905,126 @@ def generate_library_json_from_registered_expectations():
     """Generate the JSON object used to populate the public gallery"""
     library_json = {}
 
+    # Core expectations are only registered once they are first looked up
+    load_all_expectations_from_manifest()
     for expectation_name, expectation in _registered_expectations.items():
         report_object = expectation().run_diagnostics()
         library_json[expectation_name] = report_object
 
     return library_json
+
+
+def get_sqlalchemy_engine(url, **create_engine_kwargs) -> "sa.engine.Engine":
+    """Return the process-wide SQLAlchemy engine for url and create_engine_kwargs, creating it on first use.
+
+    Datasources, execution engines and stores that connect to the same database with the same options share one
+    engine, and so one connection pool; pool behavior is configured with the usual create_engine kwargs (e.g.
+    pool_size, pool_pre_ping, pool_recycle). In-memory SQLite databases are never shared, since each engine is a
+    separate database.
+
+    Args:
+        url: a connection string or sqlalchemy.engine.url.URL, including any credentials
+        **create_engine_kwargs: passed to sqlalchemy.create_engine()
+
+    Returns:
+        A SQLAlchemy Engine
+    """
+    import sqlalchemy as sa
+
+    parsed_url = sa.engine.url.make_url(url)
+    if parsed_url.drivername.startswith("sqlite") and parsed_url.database in (
+        None,
+        "",
+        ":memory:",
+    ):
+        return sa.create_engine(url, **create_engine_kwargs)
+
+    key = (str(parsed_url), repr(sorted(create_engine_kwargs.items())))
+    with _sqlalchemy_engines_lock:
+        engine = _sqlalchemy_engines.get(key)
+        if engine is None:
+            engine = sa.create_engine(url, **create_engine_kwargs)
+            _sqlalchemy_engines[key] = engine
+        else:
+            logger.debug(f"Reusing SQLAlchemy engine for {parsed_url!r}")
+    return engine
+
+
+def dispose_sqlalchemy_engines() -> None:
+    """Close the connection pools of all engines returned by get_sqlalchemy_engine and forget them."""
+    with _sqlalchemy_engines_lock:
+        for engine in _sqlalchemy_engines.values():
+            engine.dispose()
+        _sqlalchemy_engines.clear()
+
+
+def _get_sqlalchemy_metadata_cache_url(engine) -> Optional[str]:
+    # engine may also be a Connection; in-memory SQLite databases are distinct per engine despite their equal URLs
+    url = getattr(engine, "engine", engine).url
+    if url.drivername.startswith("sqlite") and url.database in (None, "", ":memory:"):
+        return None
+    return str(url)
+
+
+def get_cached_sqlalchemy_metadata(
+    engine,
+    kind: str,
+    schema_name: Optional[str],
+    *key,
+    fetch: Callable,
+    ttl_seconds: Optional[float] = None,
+) -> Any:
+    """Return database metadata (e.g. the tables of a schema, or the columns of a table) from the process-wide cache
+    shared by all engines connected to the same database, calling fetch() to introspect it if it is not cached, or
+    was cached more than ttl_seconds ago.
+
+    Args:
+        engine: the SQLAlchemy Engine or Connection the metadata is read with
+        kind: the kind of metadata, e.g. "tables" or "columns"
+        schema_name: the schema the metadata describes, or None if it spans all schemas
+        *key: further identifies the metadata within the schema, e.g. a table name
+        fetch: a function of no arguments that introspects the metadata
+        ttl_seconds: how long the metadata may be reused; None or 0 disables caching
+
+    Returns:
+        The metadata returned by fetch(), now or when it was cached
+    """
+    url = _get_sqlalchemy_metadata_cache_url(engine)
+    if not ttl_seconds or url is None:
+        return fetch()
+
+    cache_key = (url, kind, schema_name) + key
+    with _sqlalchemy_metadata_cache_lock:
+        cached = _sqlalchemy_metadata_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < ttl_seconds:
+        return cached[1]
+
+    fetched_at = time.monotonic()
+    metadata = fetch()
+    with _sqlalchemy_metadata_cache_lock:
+        _sqlalchemy_metadata_cache[cache_key] = (fetched_at, metadata)
+        _sqlalchemy_metadata_cache.move_to_end(cache_key)
+        while len(_sqlalchemy_metadata_cache) > SQLALCHEMY_METADATA_CACHE_MAX_ENTRIES:
+            _sqlalchemy_metadata_cache.popitem(last=False)
+    return metadata
+
+
+def invalidate_sqlalchemy_metadata_cache(
+    engine=None, schema_name: Optional[str] = None
+) -> None:
+    """Forget metadata cached by get_cached_sqlalchemy_metadata, e.g. after tables have been created or altered.
+
+    Args:
+        engine: if given, only forget the metadata of the database engine is connected to
+        schema_name: if given (with engine), only forget the metadata of this schema, and that spanning all schemas
+    """
+    url = _get_sqlalchemy_metadata_cache_url(engine) if engine is not None else None
+    with _sqlalchemy_metadata_cache_lock:
+        if engine is None:
+            _sqlalchemy_metadata_cache.clear()
+            return
+        for cache_key in list(_sqlalchemy_metadata_cache.keys()):
+            if cache_key[0] == url and (
+                schema_name is None or cache_key[2] in (None, schema_name)
+            ):
+                del _sqlalchemy_metadata_cache[cache_key]
@@ -1,8 +1,17 @@
 import copy
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from great_expectations.core.id_dict import IDDict
 
+# Map metrics that are only used to populate the "result" of a map expectation, and so are needed only for some
+# result_formats. For SQL backends, each of them is a separate query that pulls rows back to the client.
+RESULT_FORMAT_DEPENDENT_METRIC_SUFFIXES = (
+    ".unexpected_values",
+    ".unexpected_index_list",
+    ".unexpected_value_counts",
+    ".unexpected_rows",
+)
+
 
 class MetricConfiguration:
     def __init__(
@@ -91,3 +100,52 @@ class ValidationGraph:
     @property
     def edges(self):
         return copy.deepcopy(self._edges)
+
+    @property
+    def metric_configurations(self) -> Dict[Tuple, MetricConfiguration]:
+        """The distinct metrics in the graph, keyed by metric id."""
+        metric_configurations = {}
+        for edge in self._edges:
+            metric_configurations[edge.left.id] = edge.left
+            if edge.right is not None:
+                metric_configurations[edge.right.id] = edge.right
+        return metric_configurations
+
+
+def get_result_format_unneeded_metric_suffixes(result_format: dict) -> Set[str]:
+    """Return the RESULT_FORMAT_DEPENDENT_METRIC_SUFFIXES whose metrics are not used by result_format.
+
+    Args:
+        result_format: a parsed result_format dictionary (see parse_result_format)
+
+    Returns:
+        the set of metric name suffixes that can be pruned from the validation graph
+    """
+    result_format_str = result_format.get("result_format")
+    partial_unexpected_count = result_format.get("partial_unexpected_count", 20)
+
+    if result_format_str == "BOOLEAN_ONLY":
+        needed_suffixes = set()
+    elif result_format_str == "BASIC":
+        needed_suffixes = {".unexpected_values"} if partial_unexpected_count else set()
+    elif result_format_str == "SUMMARY":
+        needed_suffixes = (
+            {".unexpected_values", ".unexpected_index_list", ".unexpected_value_counts"}
+            if partial_unexpected_count
+            else set()
+        )
+    elif result_format_str == "COMPLETE":
+        needed_suffixes = {
+            ".unexpected_values",
+            ".unexpected_index_list",
+            ".unexpected_value_counts",
+        }
+    else:
+        # Unknown result_formats are rejected later on; do not prune anything for them
+        return set()
+
+    # unexpected_rows is not part of any map expectation result; it is computed only when explicitly requested
+    if result_format.get("include_unexpected_rows"):
+        needed_suffixes.add(".unexpected_rows")
+
+    return set(RESULT_FORMAT_DEPENDENT_METRIC_SUFFIXES) - needed_suffixes
@@ -3,11 +3,12 @@ import datetime
 import inspect
 import json
 import logging
+import time
 import traceback
 import warnings
 from collections import defaultdict, namedtuple
 from collections.abc import Hashable
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 import pandas as pd
 from dateutil.parser import parse
@@ -32,6 +33,8 @@ from great_expectations.exceptions import (
     GreatExpectationsError,
     InvalidExpectationConfigurationError,
 )
+from great_expectations.exceptions.metric_exceptions import MetricProviderError
+from great_expectations.execution_engine.execution_engine import MetricFunctionTypes
 from great_expectations.expectations.registry import (
     get_expectation_impl,
     get_metric_provider,
@@ -107,6 +110,18 @@ class Validator:
         # This special state variable tracks whether a validation run is going on, which will disable
         # saving expectation config objects
         self._active_validation = False
+        self._metric_graph_pruning_stats = {
+            "pruned_metric_nodes": 0,
+            "pruned_queries": 0,
+        }
+        self._metric_resolution_callback = None
+        self._metric_resolution_events = []
+        self._metric_resolution_stats = {
+            "resolved_metrics": 0,
+            "reused_metrics": 0,
+            "duration_seconds": 0.0,
+            "events": [],
+        }
         if self._data_context and hasattr(
             self._data_context, "_expectation_explorer_manager"
         ):
@@ -266,6 +281,28 @@ class Validator:
         inst_expectation.__name__ = name
         return inst_expectation
 
+    @property
+    def metric_graph_pruning_stats(self) -> dict:
+        """The number of metric nodes, and of those the number of backend queries, that the most recent call to
+        graph_validate pruned from the validation graph because the active result_format did not need them."""
+        return self._metric_graph_pruning_stats
+
+    @property
+    def metric_resolution_stats(self) -> dict:
+        """Timing of the most recent call to graph_validate: the number of metrics it resolved, the number it reused
+        from previously computed metrics, the total time spent resolving them and the metric resolution events
+        reported by the execution engine (see ExecutionEngine.resolve_metrics). Events are only collected while a
+        metric resolution callback is set, or when "include_metric_resolution_stats" is in the runtime_configuration.
+        """
+        return self._metric_resolution_stats
+
+    def set_metric_resolution_callback(
+        self, callback: Optional[Callable[[dict], None]]
+    ) -> None:
+        """Register a callable that is invoked with each metric resolution event reported by the execution engine,
+        e.g. to export per-metric timings to a tracing or monitoring system. Pass None to remove it."""
+        self._metric_resolution_callback = callback
+
     @property
     def execution_engine(self):
         """Returns the execution engine being used by the validator at the given time"""
@@ -353,7 +390,15 @@ class Validator:
                     from the registry.
                     metrics (dict): A list of currently registered metrics in the registry
                     runtime_configuration (dict): A dictionary of runtime keyword arguments, controlling semantics
-                    such as the result_format.
+                    such as the result_format. If "fail_fast" is True, expectations are validated one at a time
+                    and validation stops after the first unsuccessful result. If "include_metric_resolution_stats"
+                    is True, the execution engine's metric resolution events are collected into
+                    metric_resolution_stats (they are always passed to a callback set with
+                    set_metric_resolution_callback).
+
+                Metrics that only populate parts of the result not included in the active result_format (for example
+                unexpected_values when partial_unexpected_count is 0) are pruned from the graph before it is resolved;
+                the number of pruned metrics is available in metric_graph_pruning_stats.
 
                 Returns:
                     A list of Validations, validating that all necessary metrics are available.
@@ -362,6 +407,32 @@ class Validator:
         if runtime_configuration is None:
             runtime_configuration = dict()
 
+        if metrics is None:
+            metrics = dict()
+
+        if runtime_configuration.get("fail_fast"):
+            # Metrics resolved for one expectation (e.g. table.row_count) are shared with the ones that follow
+            evrs = []
+            pruning_stats = defaultdict(int)
+            resolution_stats = defaultdict(int, events=[])
+            single_runtime_configuration = dict(runtime_configuration, fail_fast=False)
+            for configuration in configurations:
+                configuration_evrs = self.graph_validate(
+                    [configuration],
+                    metrics=metrics,
+                    runtime_configuration=single_runtime_configuration,
+                )
+                evrs.extend(configuration_evrs)
+                for key, value in self._metric_graph_pruning_stats.items():
+                    pruning_stats[key] += value
+                for key, value in self._metric_resolution_stats.items():
+                    resolution_stats[key] += value
+                if not all(evr.success for evr in configuration_evrs):
+                    break
+            self._metric_graph_pruning_stats = dict(pruning_stats)
+            self._metric_resolution_stats = dict(resolution_stats)
+            return evrs
+
         if runtime_configuration.get("catch_exceptions", True):
             catch_exceptions = True
         else:
@@ -369,6 +440,7 @@ class Validator:
 
         processed_configurations = []
         evrs = []
+        pruned_metrics = []
         for configuration in configurations:
             # Validating
             try:
@@ -378,13 +450,22 @@ class Validator:
             except AssertionError as e:
                 raise InvalidExpectationConfigurationError(str(e))
 
-            expectation_impl = get_expectation_impl(configuration.expectation_type)
-            validation_dependencies = expectation_impl().get_validation_dependencies(
+            expectation = get_expectation_impl(configuration.expectation_type)()
+            validation_dependencies = expectation.get_validation_dependencies(
                 configuration, self._execution_engine, runtime_configuration
-            )["metrics"]
+            )
+            unneeded_metric_names = expectation.get_result_format_unneeded_metric_names(
+                validation_dependencies["result_format"]
+            )
+            needed_metrics = []
+            for metric in validation_dependencies["metrics"].values():
+                if metric.metric_name in unneeded_metric_names:
+                    pruned_metrics.append((metric, configuration))
+                else:
+                    needed_metrics.append(metric)
 
             try:
-                for metric in validation_dependencies.values():
+                for metric in needed_metrics:
                     self.build_metric_dependency_graph(
                         graph,
                         metric,
@@ -409,10 +490,22 @@ class Validator:
                 else:
                     raise err
 
-        if metrics is None:
-            metrics = dict()
-
+        self._metric_graph_pruning_stats = self._get_metric_graph_pruning_stats(
+            graph, pruned_metrics
+        )
+        graph_metric_ids = graph.metric_configurations.keys()
+        reused_metrics = len(
+            [metric_id for metric_id in graph_metric_ids if metric_id in metrics]
+        )
+        self._metric_resolution_events = []
+        start_time = time.perf_counter()
         metrics = self.resolve_validation_graph(graph, metrics, runtime_configuration)
+        self._metric_resolution_stats = {
+            "resolved_metrics": len(graph_metric_ids) - reused_metrics,
+            "reused_metrics": reused_metrics,
+            "duration_seconds": time.perf_counter() - start_time,
+            "events": self._metric_resolution_events,
+        }
         for configuration in processed_configurations:
             try:
                 result = configuration.metrics_validate(
@@ -439,6 +532,48 @@ class Validator:
                     raise err
         return evrs
 
+    def _get_metric_graph_pruning_stats(
+        self,
+        graph: ValidationGraph,
+        pruned_metrics: List[tuple],
+    ) -> dict:
+        """Count the pruned metrics that graph does not otherwise contain, and how many of them are value metrics,
+        each of which the execution engine computes with its own query. The dependencies of pruned metrics are not
+        built just to be counted; those of the unexpected values, rows and index list metrics are condition metrics
+        that the needed unexpected_count metric shares."""
+        needed_metric_ids = graph.metric_configurations.keys()
+        pruned_metric_nodes = list(
+            {
+                metric.id: metric
+                for metric, _ in pruned_metrics
+                if metric.id not in needed_metric_ids
+            }.values()
+        )
+        pruned_queries = 0
+        for metric in pruned_metric_nodes:
+            try:
+                _, metric_fn = get_metric_provider(
+                    metric_name=metric.metric_name,
+                    execution_engine=self._execution_engine,
+                )
+            except MetricProviderError:
+                continue
+            if metric_fn is not None and (
+                getattr(metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE)
+                == MetricFunctionTypes.VALUE
+            ):
+                pruned_queries += 1
+
+        if pruned_metric_nodes:
+            logger.debug(
+                f"Pruned {len(pruned_metric_nodes)} metric nodes ({pruned_queries} queries) not required by the "
+                f"active result_format from the validation graph"
+            )
+        return {
+            "pruned_metric_nodes": len(pruned_metric_nodes),
+            "pruned_queries": pruned_queries,
+        }
+
     def resolve_validation_graph(self, graph, metrics, runtime_configuration=None):
         done: bool = False
         while not done:
@@ -486,9 +621,26 @@ class Validator:
     ):
         """A means of accessing the Execution Engine's resolve_metrics method, where missing metric configurations are
         resolved"""
-        return execution_engine.resolve_metrics(
-            metrics_to_resolve, metrics, runtime_configuration
-        )
+        if self._metric_resolution_callback is None and not (
+            runtime_configuration or {}
+        ).get("include_metric_resolution_stats"):
+            # Execution engines only time and describe the queries they run while a callback is installed
+            return execution_engine.resolve_metrics(
+                metrics_to_resolve, metrics, runtime_configuration
+            )
+        previous_callback = execution_engine.metric_resolution_callback
+        execution_engine.metric_resolution_callback = self._on_metric_resolved
+        try:
+            return execution_engine.resolve_metrics(
+                metrics_to_resolve, metrics, runtime_configuration
+            )
+        finally:
+            execution_engine.metric_resolution_callback = previous_callback
+
+    def _on_metric_resolved(self, event: dict) -> None:
+        self._metric_resolution_events.append(event)
+        if self._metric_resolution_callback is not None:
+            self._metric_resolution_callback(event)
 
     def _initialize_expectations(
         self, expectation_suite=None, expectation_suite_name=None
@@ -903,6 +1055,8 @@ class Validator:
         only_return_failures=False,
         run_name=None,
         run_time=None,
+        fail_fast=False,
+        include_metric_resolution_stats=False,
     ):
         """Generates a JSON-formatted report describing the outcome of all expectations.
 
@@ -930,6 +1084,13 @@ class Validator:
                 etc.).
             only_return_failures (boolean): \
                 If True, expectation results are only returned when ``success = False`` \
+            fail_fast (boolean): \
+                If True, validation stops at the first unsuccessful expectation; the remaining expectations are \
+                not evaluated and do not appear in the results. Most useful together with a BOOLEAN_ONLY \
+                result_format, for which column map expectations only check whether any unexpected value exists.
+            include_metric_resolution_stats (boolean): \
+                If True, the metric_resolution_stats of this validation run (per-metric and per-query timings) \
+                are added to the meta of the returned result under "metric_resolution_stats".
 
         Returns:
             A JSON-formatted dictionary containing a list of the validation results. \
@@ -1113,6 +1274,8 @@ class Validator:
                 runtime_configuration={
                     "catch_exceptions": catch_exceptions,
                     "result_format": result_format,
+                    "fail_fast": fail_fast,
+                    "include_metric_resolution_stats": include_metric_resolution_stats,
                 },
             )
             statistics = _calc_validation_statistics(results)
@@ -1146,6 +1309,8 @@ class Validator:
                     "validation_time": validation_time,
                 },
             )
+            if include_metric_resolution_stats:
+                result.meta["metric_resolution_stats"] = self.metric_resolution_stats
 
             self._data_context = validate__data_context
         except Exception as e:
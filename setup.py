@@ -31,6 +31,9 @@ config = {
             "pybigquery==0.4.15",
         ],
         "redshift": ["psycopg2>=2.8"],
+        "orjson": ["orjson>=3.0"],
+        "zstd": ["zstandard>=0.15"],
+        "msgpack": ["msgpack>=1.0"],
         "s3": ["boto3>=1.14"],
         "snowflake": ["snowflake-sqlalchemy>=1.2"],
     },
@@ -428,3 +428,33 @@ def test_remove_all_expectations_of_type(
     assert suite_with_table_and_column_expectations.isEquivalentTo(
         suite_with_column_pair_and_table_expectations
     )
+
+
+def test_find_expectation_indexes_after_in_place_modifications(
+    exp1, exp2, exp4, baseline_suite
+):
+    # Build the indexes, then modify the suite through each of its mutation paths
+    assert baseline_suite.find_expectation_indexes(exp2, "domain") == [1]
+    assert baseline_suite.find_expectation_indexes(exp4, "success") == []
+
+    baseline_suite.add_expectation(exp4, match_type="domain")
+    assert baseline_suite.expectations == [exp1, exp4]
+    assert baseline_suite.find_expectation_indexes(exp4, "success") == [1]
+    assert baseline_suite.find_expectation_indexes(exp2, "success") == []
+
+    baseline_suite.expectations.insert(0, exp2)
+    assert baseline_suite.find_expectation_indexes(exp2, "success") == [0]
+    assert baseline_suite.find_expectation_indexes(exp4, "domain") == [0, 2]
+
+    baseline_suite.remove_expectation(exp2, match_type="success")
+    assert baseline_suite.find_expectation_indexes(exp1, "domain") == [0]
+    assert baseline_suite.find_expectation_indexes(exp4, "domain") == [1]
+
+    baseline_suite.patch_expectation(
+        exp4, op="replace", path="/value_set", value=[-1, -2, -3], match_type="domain"
+    )
+    assert baseline_suite.find_expectation_indexes(exp2, "success") == [1]
+
+    baseline_suite.expectations = [exp2]
+    assert baseline_suite.find_expectation_indexes(exp1, "domain") == []
+    assert baseline_suite.find_expectation_indexes(exp2, "domain") == [0]
@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core import pandas_util
+from great_expectations.core.pandas_util import (
+    column_values_dateutil_parseable,
+    column_values_in_set,
+    column_values_json_parseable,
+    column_values_match_json_schema,
+    column_values_match_regex,
+    column_values_match_strftime_format,
+    evaluate_condition_on_unique_values,
+    get_compiled_regex,
+    get_value_set_index,
+    map_unique_values,
+)
+
+
+@pytest.fixture
+def low_cardinality_series():
+    values = ["a", "b", "c", None, "d"] * 4000
+    return pd.Series(values, name="letters")
+
+
+def test_get_value_set_index_is_cached_by_value_set_and_dtype():
+    first = get_value_set_index(["a", "b"], dtype=np.dtype("O"))
+    assert get_value_set_index(["a", "b"], dtype=np.dtype("O")) is first
+    assert get_value_set_index(["a", "b"], dtype=np.dtype("int64")) is not first
+
+
+def test_get_value_set_index_is_cached_by_member_types():
+    assert get_value_set_index([True], dtype=np.dtype("int64")).dtype == np.bool_
+    assert get_value_set_index([1], dtype=np.dtype("int64")).dtype == np.int64
+
+
+def test_get_value_set_index_with_unhashable_members():
+    index = get_value_set_index([[1, 2], [3]])
+    assert len(index) == 2
+
+
+def test_column_values_in_set_matches_isin_on_object_column(
+    low_cardinality_series,
+):
+    assert pandas_util.is_low_cardinality(low_cardinality_series)
+    value_set = ["a", "d", "z"]
+    result = column_values_in_set(low_cardinality_series, value_set)
+    expected = low_cardinality_series.isin(value_set)
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_column_values_in_set_distinguishes_none_and_nan_on_object_column():
+    column = pd.Series([1.0, 2.0, np.nan, None] * 5000, dtype=object)
+    assert pandas_util.is_low_cardinality(column)
+    for value_set in ([None], [np.nan], [None, 1.0]):
+        pd.testing.assert_series_equal(
+            column_values_in_set(column, value_set), column.isin(value_set)
+        )
+
+
+def test_column_values_in_set_matches_isin_on_categorical_column(
+    low_cardinality_series,
+):
+    categorical = low_cardinality_series.astype("category")
+    for value_set in (["a", "d"], ["a", None], []):
+        result = column_values_in_set(categorical, value_set)
+        expected = low_cardinality_series.isin(value_set)
+        assert result.tolist() == expected.tolist()
+
+
+def test_column_values_in_set_high_cardinality_and_numeric_columns():
+    strings = pd.Series([str(i) for i in range(20000)])
+    assert not pandas_util.is_low_cardinality(strings)
+    assert column_values_in_set(strings, ["1", "2"]).sum() == 2
+
+    numbers = pd.Series([1, 2, 3, np.nan])
+    pd.testing.assert_series_equal(
+        column_values_in_set(numbers, [1, 3]), numbers.isin([1, 3])
+    )
+
+
+def test_get_compiled_regex_is_cached():
+    assert get_compiled_regex("^a.*") is get_compiled_regex("^a.*")
+
+
+def test_map_unique_values_evaluates_once_per_distinct_value(
+    low_cardinality_series,
+):
+    calls = []
+
+    def func(value):
+        calls.append(value)
+        return value is None
+
+    result = map_unique_values(low_cardinality_series, func)
+    # one call per distinct non-null value, plus one per null row
+    assert len(calls) == 4 + 4000
+    pd.testing.assert_series_equal(result, low_cardinality_series.isnull())
+
+
+def test_map_unique_values_falls_back_to_map_for_mixed_columns():
+    mixed = pd.Series([1, True, "1"])
+    assert map_unique_values(mixed, str).tolist() == ["1", "True", "1"]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["abc", "abd", "xyz", None, np.nan, "abc"],
+        [1.5, 2.0, np.nan, 10.0],
+        pd.Series(["abc", "xyz", "abc"]).astype("category"),
+    ],
+)
+def test_column_values_match_regex_matches_str_contains(values):
+    column = pd.Series(values)
+    for regex in ("^ab", "nan|None", r"\d\.0"):
+        expected = column.astype(str).str.contains(regex)
+        assert column_values_match_regex(column, regex).tolist() == expected.tolist()
+
+
+def test_column_values_match_strftime_format():
+    column = pd.Series(["2020-01-01", "2020-13-01", "2020-01-01", "nope"])
+    assert column_values_match_strftime_format(column, "%Y-%m-%d").tolist() == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    with pytest.raises(TypeError):
+        column_values_match_strftime_format(pd.Series([1, 2]), "%Y-%m-%d")
+
+
+def test_column_values_dateutil_parseable():
+    column = pd.Series(["2020-01-01", "not a date", "2020-01-01"])
+    assert column_values_dateutil_parseable(column).tolist() == [True, False, True]
+
+
+def test_column_values_json_parseable_and_match_json_schema():
+    column = pd.Series(['{"a": 1}', '{"a": "x"}', "{", '{"a": 1}'])
+    assert column_values_json_parseable(column).tolist() == [True, True, False, True]
+
+    schema = {"properties": {"a": {"type": "integer"}}}
+    assert column_values_match_json_schema(column[[0, 1, 3]], schema).tolist() == [
+        True,
+        False,
+        True,
+    ]
+
+
+def test_evaluate_condition_on_unique_values(low_cardinality_series):
+    seen_lengths = []
+
+    def condition(series):
+        seen_lengths.append(len(series))
+        return series.isin(["a", "b"])
+
+    result = evaluate_condition_on_unique_values(low_cardinality_series, condition)
+    assert seen_lengths == [4, 4000]
+    pd.testing.assert_series_equal(result, low_cardinality_series.isin(["a", "b"]))
+
+    numbers = pd.Series([1, 2, 3])
+    assert evaluate_condition_on_unique_values(numbers, lambda s: s > 1).tolist() == [
+        False,
+        True,
+        True,
+    ]
@@ -1,8 +1,13 @@
+import json
 import logging
 from decimal import Decimal
 
+import numpy as np
+import pandas as pd
+
 from great_expectations.core.util import (
     convert_to_json_serializable,
+    dumps_json_serializable,
     requires_lossy_conversion,
 )
 
@@ -59,3 +64,49 @@ def test_serialization_of_spark_df(spark_session):
     df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
     sdf = spark_session.createDataFrame(df)
     assert convert_to_json_serializable(sdf) == {"a": [1, 2, 3], "b": [4, 5, 6]}
+
+
+def test_convert_to_json_serializable_numeric_arrays_and_series():
+    assert convert_to_json_serializable(np.array([1, 2, 3])) == [1, 2, 3]
+    assert convert_to_json_serializable(np.array([[1.5, np.nan], [np.inf, 2]])) == [
+        [1.5, None],
+        [float("inf"), 2.0],
+    ]
+    assert convert_to_json_serializable(np.array([True, False])) == [True, False]
+    assert convert_to_json_serializable(
+        pd.Series([1.5, np.nan], index=[3, 4], name="x")
+    ) == [{"index": 3, "x": 1.5}, {"index": 4, "x": None}]
+    assert convert_to_json_serializable(
+        {1: [1, float("nan"), "a", None, (2, np.int64(3))], "b": np.float32(0.5)}
+    ) == {"1": [1, None, "a", None, [2, 3]], "b": 0.5}
+
+    # floats in arrays are not rounded, like np.float64 scalars
+    values = [np.float64(0.1) + np.float64(0.2), 3.3e-20]
+    assert convert_to_json_serializable(np.array(values)) == [
+        0.30000000000000004,
+        3.3e-20,
+    ]
+    assert convert_to_json_serializable(values[0]) == 0.30000000000000004
+    assert convert_to_json_serializable(pd.Series(values)) == [
+        {"index": 0, "value": 0.30000000000000004},
+        {"index": 1, "value": 3.3e-20},
+    ]
+
+    # non-numeric arrays and series keep their element-wise conversion
+    dates = pd.Series(pd.to_datetime(["2020-01-01", None]))
+    assert convert_to_json_serializable(dates) == [
+        {"index": 0, "value": "2020-01-01T00:00:00"},
+        {"index": 1, "value": None},
+    ]
+    assert convert_to_json_serializable(np.array(["a", None], dtype=object)) == [
+        "a",
+        None,
+    ]
+
+
+def test_dumps_json_serializable():
+    data = {"a": [1, 2.5, None, "x"], "b": {"c": True}}
+    assert json.loads(dumps_json_serializable(data)) == data
+    assert dumps_json_serializable(data, indent=2, sort_keys=True) == json.dumps(
+        data, indent=2, sort_keys=True
+    )
@@ -1,12 +1,16 @@
 import logging
+from unittest import mock
 
 import pyparsing as pp
 import pytest
 
 import tests.test_utils as test_utils
 from great_expectations.data_context.store import DatabaseStoreBackend
+from great_expectations.data_context.store.database_store_backend import (
+    _is_upsert_missing_conflict_target_error,
+)
 from great_expectations.data_context.util import instantiate_class_from_config
-from great_expectations.exceptions import StoreBackendError
+from great_expectations.exceptions import StoreBackendError, StoreError
 
 
 def test_database_store_backend_schema_spec(caplog, sa, test_backends):
@@ -105,6 +109,134 @@ def test_database_store_backend_duplicate_key_violation(caplog, sa, test_backend
     assert "Integrity error" in str(exc.value)
 
 
+def test_database_store_backend_get_many_and_set_many(sa):
+    store_backend = DatabaseStoreBackend(
+        url="sqlite://",
+        table_name="test_database_store_backend_get_many_and_set_many",
+        key_columns=["k1", "k2"],
+    )
+    store_backend.set(("a", "1"), "first")
+
+    # More keys than fit in one statement, including an update of an existing key
+    store_backend.BULK_OPERATION_BATCH_SIZE = 2
+    key_value_pairs = [(("a", "1"), "updated")] + [
+        (("b", str(idx)), f"value_{idx}") for idx in range(5)
+    ]
+    store_backend.set_many(key_value_pairs)
+
+    keys = [key for key, _ in key_value_pairs]
+    assert store_backend.get_many(keys) == [value for _, value in key_value_pairs]
+    assert store_backend.get_many(list(reversed(keys))) == [
+        value for _, value in reversed(key_value_pairs)
+    ]
+    assert store_backend.get(("b", "3")) == "value_3"
+
+    # Writing the same values again without updates is not an error
+    store_backend.set_many(key_value_pairs, allow_update=False)
+    with pytest.raises(StoreBackendError):
+        store_backend.set_many([(("b", "0"), "changed")], allow_update=False)
+
+    with pytest.raises(StoreError):
+        store_backend.get_many([("a", "1"), ("c", "1")])
+
+
+def test_database_store_backend_set_many_into_table_without_primary_key(sa):
+    engine = sa.create_engine("sqlite://")
+    sa.Table(
+        "test_database_store_backend_without_primary_key",
+        sa.MetaData(),
+        sa.Column("k1", sa.String),
+        sa.Column("value", sa.String),
+    ).create(engine)
+    store_backend = DatabaseStoreBackend(
+        engine=engine,
+        table_name="test_database_store_backend_without_primary_key",
+        key_columns=["k1"],
+    )
+
+    # Upserts need a unique constraint on the key columns; without one, values are inserted and updated separately
+    assert store_backend._use_upsert is False
+    with mock.patch.object(
+        store_backend, "_build_upsert_statement"
+    ) as build_upsert_statement:
+        store_backend.set_many([(("a",), "first"), (("b",), "second")])
+        store_backend.set_many([(("a",), "updated")])
+    build_upsert_statement.assert_not_called()
+    assert store_backend.get_many([("a",), ("b",)]) == ["updated", "second"]
+
+
+def test_database_store_backend_upserts_into_table_with_unique_constraint(sa):
+    engine = sa.create_engine("sqlite://")
+    sa.Table(
+        "test_database_store_backend_with_unique_constraint",
+        sa.MetaData(),
+        sa.Column("k1", sa.String),
+        sa.Column("value", sa.String),
+        sa.UniqueConstraint("k1"),
+    ).create(engine)
+    store_backend = DatabaseStoreBackend(
+        engine=engine,
+        table_name="test_database_store_backend_with_unique_constraint",
+        key_columns=["k1"],
+    )
+
+    assert store_backend._use_upsert is True
+    store_backend.set_many([(("a",), "first")])
+    store_backend.set_many([(("a",), "updated")])
+    assert store_backend.get(("a",)) == "updated"
+
+
+def test_database_store_backend_set_many_keeps_upserts_after_other_errors(sa):
+    store_backend = DatabaseStoreBackend(
+        url="sqlite://",
+        table_name="test_database_store_backend_keeps_upserts",
+        key_columns=["k1"],
+    )
+    if store_backend._build_upsert_statement() is None:
+        pytest.skip("sqlite upserts require SQLAlchemy>=1.4")
+
+    with mock.patch.object(
+        store_backend.engine,
+        "begin",
+        side_effect=sa.exc.OperationalError(
+            "INSERT", {}, Exception("server closed the connection unexpectedly")
+        ),
+    ):
+        with pytest.raises(StoreBackendError):
+            store_backend.set_many([(("a",), "first")])
+    assert store_backend._use_upsert is True
+
+    store_backend.set_many([(("a",), "first")])
+    assert store_backend.get(("a",)) == "first"
+
+
+def test_is_upsert_missing_conflict_target_error(sa):
+    assert _is_upsert_missing_conflict_target_error(
+        sa.exc.ProgrammingError(
+            "INSERT",
+            {},
+            Exception(
+                "there is no unique or exclusion constraint matching the ON CONFLICT specification"
+            ),
+        )
+    )
+    assert _is_upsert_missing_conflict_target_error(
+        sa.exc.OperationalError(
+            "INSERT",
+            {},
+            Exception(
+                "ON CONFLICT clause does not match any PRIMARY KEY or UNIQUE constraint"
+            ),
+        )
+    )
+    assert not _is_upsert_missing_conflict_target_error(
+        sa.exc.OperationalError("INSERT", {}, Exception("database is locked"))
+    )
+    assert not _is_upsert_missing_conflict_target_error(
+        sa.exc.DataError("INSERT", {}, Exception("value too long for type"))
+    )
+
+
 def test_database_store_backend_url_instantiation(caplog, sa, test_backends):
     if "postgresql" not in test_backends:
         pytest.skip("test_database_store_backend_get_url_for_key requires postgresql")
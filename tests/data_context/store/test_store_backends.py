@@ -388,6 +388,35 @@ test_TupleFilesystemStoreBackend__dir0/
     assert url == "http://www.test.com/my_file_CCC"
 
 
+def test_TupleFilesystemStoreBackend_remove_key_removes_every_readable_suffix(
+    tmp_path_factory,
+):
+    project_path = str(tmp_path_factory.mktemp("remove_key_suffixes"))
+    json_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory=project_path,
+        filepath_suffix=".json",
+        suppress_store_backend_id=True,
+    )
+    json_store.set(("AAA",), "old")
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory=project_path,
+        filepath_suffix=".json.gz",
+        alternate_filepath_suffixes=[".json"],
+        suppress_store_backend_id=True,
+    )
+    my_store.set(("AAA",), b"new")
+    assert my_store.get(("AAA",)) == b"new"
+
+    assert my_store.remove_key(("AAA",))
+    assert not my_store.has_key(("AAA",))
+    with pytest.raises(InvalidKeyError):
+        my_store.get(("AAA",))
+    assert my_store.list_keys() == []
+    assert not my_store.remove_key(("AAA",))
+
+
 def test_TupleFilesystemStoreBackend_ignores_jupyter_notebook_checkpoints(
     tmp_path_factory,
 ):
@@ -861,6 +890,14 @@ def test_TupleGCSStoreBackend():
         mock_blob = mock_bucket.get_blob.return_value
         mock_str = mock_blob.download_as_string.return_value
 
+        # The client and bucket are created once per store backend, and reused by every request
+        my_store = TupleGCSStoreBackend(
+            filepath_template="my_file_{0}",
+            bucket=bucket,
+            prefix=prefix,
+            project=project,
+            suppress_store_backend_id=True,
+        )
         my_store.get(("BBB",))
 
         mock_gcs_client.assert_called_once_with("dummy-project")
@@ -875,13 +912,20 @@ def test_TupleGCSStoreBackend():
 
         mock_client = mock_gcs_client.return_value
 
+        my_store = TupleGCSStoreBackend(
+            filepath_template="my_file_{0}",
+            bucket=bucket,
+            prefix=prefix,
+            project=project,
+            suppress_store_backend_id=True,
+        )
         my_store.list_keys()
 
         mock_client.list_blobs.assert_called_once_with(
             "leakybucket", prefix="this_is_a_test_prefix"
         )
 
-        my_store.remove_key("leakybucket")
+        my_store.remove_key(("leakybucket",))
 
         from google.cloud.exceptions import NotFound
 
@@ -892,6 +936,13 @@ def test_TupleGCSStoreBackend():
 
     with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
         mock_gcs_client.side_effect = InvalidKeyError("Hi I am an InvalidKeyError")
+        my_store = TupleGCSStoreBackend(
+            filepath_template="my_file_{0}",
+            bucket=bucket,
+            prefix=prefix,
+            project=project,
+            suppress_store_backend_id=True,
+        )
         with pytest.raises(InvalidKeyError):
             my_store.get(("non_existent_key",))
 
@@ -974,3 +1025,34 @@ def test_TupleS3StoreBackend_list_over_1000_keys():
     keys = my_store.list_keys()
     # len(keys) == num_keys_to_add + 1 because of the .ge_store_backend_id
     assert len(keys) == num_keys_to_add + 1
+
+
+@mock_s3
+def test_TupleS3StoreBackend_get_many_and_set_many():
+    bucket = "leakybucket"
+    prefix = "my_prefix"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}",
+        bucket=bucket,
+        prefix=prefix,
+        max_concurrent_requests=4,
+    )
+    key_value_pairs = [((f"AAA_{idx}",), f"aaa_{idx}") for idx in range(10)]
+    my_store.set_many(key_value_pairs)
+
+    keys = [key for key, _ in key_value_pairs]
+    assert my_store.get_many(keys) == [value for _, value in key_value_pairs]
+    assert my_store.get_many(list(reversed(keys))) == [
+        value for _, value in reversed(key_value_pairs)
+    ]
+    assert set(my_store.list_keys()) == set(keys) | {StoreBackend.STORE_BACKEND_ID_KEY}
+    assert my_store.has_key(("AAA_3",))
+    assert not my_store.has_key(("BBB",))
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get_many([("AAA_0",), ("BBB",)])
@@ -1,4 +1,5 @@
 import datetime
+import os
 
 import boto3
 import pytest
@@ -15,6 +16,7 @@ from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
+from great_expectations.exceptions import InvalidConfigError
 from great_expectations.util import gen_directory_tree_str
 
 
@@ -241,6 +243,165 @@ test_ValidationResultStore_with_TupleFileSystemStoreBackend__dir0/
     assert my_store.store_backend_id == my_store_duplicate.store_backend_id
 
 
+@pytest.mark.parametrize("serialization_format", ["json.gz", "json.zst", "msgpack"])
+def test_ValidationsStore_serialization_formats_with_TupleFileSystemStoreBackend(
+    tmp_path_factory, serialization_format
+):
+    if serialization_format == "json.zst":
+        pytest.importorskip("zstandard")
+    elif serialization_format == "msgpack":
+        pytest.importorskip("msgpack")
+    path = str(tmp_path_factory.mktemp("validations_store_serialization_formats"))
+    store_backend_config = {
+        "class_name": "TupleFilesystemStoreBackend",
+        "base_directory": "my_store/",
+    }
+    json_store = ValidationsStore(
+        store_backend=dict(store_backend_config),
+        runtime_environment={"root_directory": path},
+    )
+    ns_1 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-100",
+        batch_identifier="batch_id",
+    )
+    json_store.set(ns_1, ExpectationSuiteValidationResult(success=True))
+
+    my_store = ValidationsStore(
+        store_backend=dict(store_backend_config),
+        runtime_environment={"root_directory": path},
+        serialization_format=serialization_format,
+    )
+    ns_2 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id="prod-200",
+        batch_identifier="batch_id",
+    )
+    my_store.set(ns_2, ExpectationSuiteValidationResult(success=False))
+
+    # New results are written in the configured format; those written before remain readable
+    assert set(my_store.list_keys()) == {ns_1, ns_2}
+    assert my_store.get(ns_1) == ExpectationSuiteValidationResult(
+        success=True, statistics={}, results=[]
+    )
+    assert my_store.get(ns_2) == ExpectationSuiteValidationResult(
+        success=False, statistics={}, results=[]
+    )
+    assert my_store.has_key(ns_1) and my_store.has_key(ns_2)
+    filenames = [
+        filename for _, _, filenames in os.walk(path) for filename in filenames
+    ]
+    assert "batch_id.json" in filenames
+    assert (
+        "batch_id" + ValidationsStore.SERIALIZATION_FORMAT_SUFFIXES[serialization_format]
+        in filenames
+    )
+
+
+def test_ValidationsStore_with_DatabaseStoreBackend_rejects_binary_serialization_format(
+    sa,
+):
+    with pytest.raises(InvalidConfigError):
+        ValidationsStore(
+            store_backend={
+                "class_name": "DatabaseStoreBackend",
+                "credentials": {"drivername": "sqlite"},
+            },
+            serialization_format="json.gz",
+        )
+
+
+def test_ValidationsStore_summary_index_with_TupleFileSystemStoreBackend(
+    tmp_path_factory,
+):
+    path = str(tmp_path_factory.mktemp("validations_store_summary_index"))
+    store_backend_config = {
+        "class_name": "TupleFilesystemStoreBackend",
+        "base_directory": "my_store/",
+    }
+    my_store = ValidationsStore(
+        store_backend=dict(store_backend_config),
+        runtime_environment={"root_directory": path},
+        summary_index=True,
+    )
+    keys = [
+        ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+            run_id=f"prod-{idx}",
+            batch_identifier="batch_id",
+        )
+        for idx in range(3)
+    ]
+    my_store.set(
+        keys[0],
+        ExpectationSuiteValidationResult(
+            success=True,
+            statistics={"evaluated_expectations": 1},
+            meta={"batch_kwargs": {"path": "data.csv"}},
+        ),
+    )
+    # Each write appends a segment to the index, so that another store writing to the index loses nothing
+    ValidationsStore(
+        store_backend=dict(store_backend_config),
+        runtime_environment={"root_directory": path},
+        summary_index=True,
+    ).set_many([(keys[1], ExpectationSuiteValidationResult(success=False))])
+    index_directory = os.path.join(
+        path, "my_store", ".ge_validation_result_summary_index"
+    )
+    assert len(os.listdir(index_directory)) == 2
+    # The index segments are not validation results
+    assert set(my_store.list_keys()) == {keys[0], keys[1]}
+
+    # A result written without the index is read in full once, and added to the index
+    ValidationsStore(
+        store_backend=dict(store_backend_config),
+        runtime_environment={"root_directory": path},
+    ).set(keys[2], ExpectationSuiteValidationResult(success=True))
+
+    summaries = my_store.get_summaries()
+    assert summaries == {
+        keys[0]: {
+            "success": True,
+            "statistics": {"evaluated_expectations": 1},
+            "validation_time": None,
+            "batch_kwargs": {"path": "data.csv"},
+            "batch_spec": {},
+        },
+        keys[1]: {
+            "success": False,
+            "statistics": {},
+            "validation_time": None,
+            "batch_kwargs": {},
+            "batch_spec": {},
+        },
+        keys[2]: {
+            "success": True,
+            "statistics": {},
+            "validation_time": None,
+            "batch_kwargs": {},
+            "batch_spec": {},
+        },
+    }
+    # Listing all results compacted the index into one segment
+    assert len(os.listdir(index_directory)) == 1
+    indexed_summaries, _ = my_store._load_summary_index()
+    assert set(indexed_summaries.keys()) == {key.to_tuple() for key in keys}
+    assert my_store.get_summaries([keys[1]]) == {keys[1]: summaries[keys[1]]}
+
+    # Later segments take precedence over the compacted one
+    my_store.set(keys[1], ExpectationSuiteValidationResult(success=True))
+    assert my_store.get_summaries([keys[1]])[keys[1]]["success"] is True
+    # Reading several segments compacts the index even when only some results are asked for, keeping the others
+    assert len(os.listdir(index_directory)) == 1
+    indexed_summaries, _ = my_store._load_summary_index()
+    assert set(indexed_summaries.keys()) == {key.to_tuple() for key in keys}
+    assert indexed_summaries[keys[1].to_tuple()]["success"] is True
+    my_store.store_backend.remove_key(keys[0].to_tuple())
+    assert set(my_store.get_summaries().keys()) == {keys[1], keys[2]}
+    assert len(os.listdir(index_directory)) == 1
+
+
 def test_ValidationsStore_with_DatabaseStoreBackend(sa):
     # Use sqlite so we don't require postgres for this test.
     connection_kwargs = {"drivername": "sqlite"}
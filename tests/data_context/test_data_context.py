@@ -1969,3 +1969,45 @@ def test_get_batch_multiple_datasources_do_not_scan_all(
         expectation_suite_name=expectation_suite,
     )
     assert len(batch) == 3
+
+
+def test_session_caches_expectation_suites(empty_data_context, monkeypatch):
+    context = empty_data_context
+    context.create_expectation_suite(expectation_suite_name="session_suite")
+    context.start_session(ttl_seconds=60)
+
+    store_reads = []
+    original_get = context.expectations_store.get
+
+    def counting_get(key):
+        store_reads.append(key)
+        return original_get(key)
+
+    monkeypatch.setattr(context.expectations_store, "get", counting_get)
+
+    suite = context.get_expectation_suite("session_suite")
+    assert context.get_expectation_suite("session_suite") == suite
+    assert len(store_reads) == 1
+
+    # Callers get their own copy, so changing one does not change the cached suite
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 1},
+        )
+    )
+    assert len(context.get_expectation_suite("session_suite").expectations) == 0
+
+    # Saving through the context updates the session
+    context.save_expectation_suite(suite)
+    assert len(context.get_expectation_suite("session_suite").expectations) == 1
+    assert len(store_reads) == 2
+
+    context.refresh_session()
+    context.get_expectation_suite("session_suite")
+    assert len(store_reads) == 3
+
+    context.end_session()
+    context.get_expectation_suite("session_suite")
+    context.get_expectation_suite("session_suite")
+    assert len(store_reads) == 5
@@ -66,3 +66,23 @@ def test_head(test_backend):
     assert isinstance(head, PandasDataset)
     assert len(head) == 0
     assert list(head.columns) == ["a"]
+
+
+def test_random_sample(test_backend):
+    if test_backend == "PandasDataset":
+        pytest.skip("PandasDataset is sampled with DataFrame.sample")
+
+    dataset = get_dataset(
+        test_backend, data, schemas=schemas.get(test_backend), caching=True
+    )
+    dataset.expect_column_mean_to_be_between("b", 5, 5)
+    sample = dataset.random_sample(1)
+    assert isinstance(sample, PandasDataset)
+    assert len(sample) == 1
+    assert list(sample.columns) == ["a", "b", "c", "d"]
+    assert sample["a"].iloc[0] in data["a"]
+    assert len(sample.get_expectation_suite().expectations) == 5
+
+    # a sample at least as large as the dataset returns every row
+    sample = dataset.random_sample(10)
+    assert sorted(sample["a"]) == sorted(data["a"])
@@ -293,6 +293,102 @@ def test_sqlalchemy_dataset_unexpected_count_calculations(sa, unexpected_count_d
     assert res2.result["unexpected_count"] == 5
 
 
+def test_validate_fuses_column_map_count_queries(sa):
+    engine = sa.create_engine("sqlite://")
+    data = pd.DataFrame(
+        {
+            "c1": [2, 2, 2, 2, 0],
+            "c2": [4, 4, 5, None, 7],
+        }
+    )
+    data.to_sql(name="test_data", con=engine, index=False)
+    dataset = SqlAlchemyDataset("test_data", engine=engine)
+    dataset.expect_column_values_to_not_be_null("c1")
+    dataset.expect_column_values_to_be_in_set("c1", [0, 2])
+    dataset.expect_column_values_to_be_between("c2", 0, 10)
+    dataset.expect_column_values_to_be_in_set("c2", [4, 5, 7], mostly=0.5)
+    dataset.expect_table_row_count_to_equal(5)
+    expected_results = [
+        (evr.success, evr.result)
+        for evr in dataset.validate(result_format="SUMMARY").results
+    ]
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", count_statement)
+    with mock.patch.object(
+        SqlAlchemyDataset, "_prefetch_expectation_metrics", lambda *args: None
+    ):
+        unfused_results = dataset.validate(result_format="SUMMARY").results
+    unfused_statement_count = len(statements)
+
+    statements.clear()
+    results = dataset.validate(result_format="SUMMARY").results
+    sa.event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert [(evr.success, evr.result) for evr in results] == expected_results
+    assert [(evr.success, evr.result) for evr in unfused_results] == expected_results
+    assert len(results) == 5
+    # one fused count query replaces the four per-expectation count queries
+    assert unfused_statement_count - len(statements) == 3
+
+
+def test_validate_does_not_fuse_count_queries_on_the_result_update_column(sa):
+    engine = sa.create_engine("sqlite://")
+    data = pd.DataFrame({"a": [1, 1, 2, 3], "error": [0, 0, 0, 0]})
+    data.to_sql(name="test_data", con=engine, index=False)
+    dataset = SqlAlchemyDataset("test_data", engine=engine)
+    dataset.expect_column_values_to_be_in_set("a", [1])
+    dataset.expect_column_values_to_be_in_set("error", [0])
+
+    # The expectation on "a" flags its unexpected rows in "error" before the expectation on "error" runs
+    results = dataset.validate(result_format="SUMMARY").results
+
+    assert [evr.success for evr in results] == [False, False]
+    assert results[0].result["unexpected_count"] == 2
+    assert results[1].result["unexpected_count"] == 2
+
+
+def test_prefetch_column_aggregates(sa):
+    engine = sa.create_engine("sqlite://")
+    data = pd.DataFrame({"c1": [2, 2, 2, 2, 0], "c2": [4, 4, 5, None, 7]})
+    data.to_sql(name="test_data", con=engine, index=False)
+    aggregates = ["nonnull_count", "unique_count", "min", "max", "mean", "sum"]
+
+    expected = SqlAlchemyDataset("test_data", engine=engine)
+    dataset = SqlAlchemyDataset("test_data", engine=engine)
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", count_statement)
+    dataset.prefetch_column_aggregates(["c1", "c2"], aggregates=aggregates)
+    assert len(statements) == 1
+    for column in ["c1", "c2"]:
+        assert dataset.get_column_nonnull_count(
+            column
+        ) == expected.get_column_nonnull_count(column)
+        assert dataset.get_column_unique_count(
+            column
+        ) == expected.get_column_unique_count(column)
+        assert dataset.get_column_min(column) == expected.get_column_min(column)
+        assert dataset.get_column_max(column) == expected.get_column_max(column)
+        assert dataset.get_column_mean(column) == expected.get_column_mean(column)
+        assert dataset.get_column_sum(column) == expected.get_column_sum(column)
+    assert dataset.get_row_count() == 5
+    sa.event.remove(engine, "before_cursor_execute", count_statement)
+    # every value read from the prefetched aggregates, the rest from the reference dataset
+    assert len(statements) == 1 + 6 * 2
+
+    with pytest.raises(ValueError):
+        dataset.prefetch_column_aggregates(["c1"], aggregates=["mode"])
+
+
 def test_result_format_warning(sa, unexpected_count_df):
     with pytest.warns(
         UserWarning,
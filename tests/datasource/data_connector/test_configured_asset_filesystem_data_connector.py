@@ -1290,3 +1290,115 @@ def test_basic_instantiation_with_nested_directories(tmp_path_factory):
         "unmatched_data_reference_count": 1,
         "example_data_reference": {},
     }
+
+
+def test_incremental_refresh_and_data_references_cache_snapshot(tmp_path_factory):
+    base_directory = str(
+        tmp_path_factory.mktemp(
+            "test_incremental_refresh_and_data_references_cache_snapshot"
+        )
+    )
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=[
+            "alpha-1.csv",
+            "alpha-2.csv",
+            "beta-1.csv",
+        ],
+    )
+
+    def build_data_connector(
+        pattern: str = "(.+)-(\\d+)\\.csv",
+    ) -> ConfiguredAssetFilesystemDataConnector:
+        return ConfiguredAssetFilesystemDataConnector(
+            name="my_data_connector",
+            datasource_name="FAKE_DATASOURCE_NAME",
+            default_regex={
+                "pattern": pattern,
+                "group_names": ["name", "index"],
+            },
+            base_directory=base_directory,
+            assets={
+                "alpha": {"glob_directive": "alpha-*"},
+                "beta": {"glob_directive": "beta-*"},
+            },
+        )
+
+    my_data_connector = build_data_connector()
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache()
+    # noinspection PyProtectedMember
+    alpha_1_batch_definitions = my_data_connector._data_references_cache["alpha"][
+        "alpha-1.csv"
+    ]
+
+    create_files_in_directory(
+        directory=base_directory, file_name_list=["alpha-3.csv", "beta-2.csv"]
+    )
+    os.remove(os.path.join(base_directory, "alpha-2.csv"))
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache_incrementally()
+    assert my_data_connector._get_data_reference_list_from_cache_by_data_asset_name(
+        "alpha"
+    ) == ["alpha-1.csv", "alpha-3.csv"]
+    # Data references that were already cached are not mapped again
+    # noinspection PyProtectedMember
+    assert (
+        my_data_connector._data_references_cache["alpha"]["alpha-1.csv"]
+        is alpha_1_batch_definitions
+    )
+    assert my_data_connector.get_data_reference_list_count() == 4
+
+    snapshot_path = os.path.join(
+        str(tmp_path_factory.mktemp("snapshot")), "data_references_cache.json"
+    )
+    my_data_connector.save_data_references_cache_snapshot(snapshot_path)
+    create_files_in_directory(directory=base_directory, file_name_list=["beta-3.csv"])
+
+    restarted_data_connector = build_data_connector()
+    restarted_data_connector.load_data_references_cache_snapshot(snapshot_path)
+    assert restarted_data_connector.get_data_reference_list_count() == 5
+    assert (
+        restarted_data_connector.get_batch_definition_list_from_batch_request(
+            BatchRequest(
+                datasource_name="FAKE_DATASOURCE_NAME",
+                data_connector_name="my_data_connector",
+                data_asset_name="beta",
+            )
+        )
+        == my_data_connector.get_batch_definition_list_from_batch_request(
+            BatchRequest(
+                datasource_name="FAKE_DATASOURCE_NAME",
+                data_connector_name="my_data_connector",
+                data_asset_name="beta",
+            )
+        )
+        + [
+            BatchDefinition(
+                datasource_name="FAKE_DATASOURCE_NAME",
+                data_connector_name="my_data_connector",
+                data_asset_name="beta",
+                partition_definition=PartitionDefinition(
+                    {"name": "beta", "index": "3"}
+                ),
+            )
+        ]
+    )
+
+    # A snapshot saved with another regex is stale: it is discarded and the cache is rebuilt
+    reconfigured_data_connector = build_data_connector(pattern="(.+)-(1)\\.csv")
+    reconfigured_data_connector.load_data_references_cache_snapshot(snapshot_path)
+    assert reconfigured_data_connector.get_data_reference_list_count() == 5
+    assert sorted(reconfigured_data_connector.get_unmatched_data_references()) == [
+        "alpha-3.csv",
+        "beta-2.csv",
+        "beta-3.csv",
+    ]
+
+    with pytest.raises(ge_exceptions.DataConnectorError):
+        ConfiguredAssetFilesystemDataConnector(
+            name="another_data_connector",
+            datasource_name="FAKE_DATASOURCE_NAME",
+            base_directory=base_directory,
+            assets={"alpha": {}},
+        ).load_data_references_cache_snapshot(snapshot_path)
@@ -1053,3 +1053,58 @@ assets:
         )
         == 5
     )
+
+
+@mock_s3
+def test_incremental_refresh_lists_only_keys_after_the_cached_ones():
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+
+    test_df: pd.DataFrame = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+
+    def put_objects(keys: List[str]):
+        for key in keys:
+            client.put_object(
+                Bucket=bucket,
+                Body=test_df.to_csv(index=False).encode("utf-8"),
+                Key=key,
+            )
+
+    put_objects(["alpha-1.csv", "alpha-2.csv"])
+
+    my_data_connector = ConfiguredAssetS3DataConnector(
+        name="my_data_connector",
+        datasource_name="FAKE_DATASOURCE_NAME",
+        default_regex={
+            "pattern": "alpha-(.*)\\.csv",
+            "group_names": ["index"],
+        },
+        bucket=bucket,
+        prefix="",
+        assets={"alpha": {}},
+    )
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache()
+    assert my_data_connector.get_data_reference_list_count() == 2
+
+    # No new keys
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache_incrementally()
+    assert my_data_connector.get_data_reference_list_count() == 2
+
+    put_objects(["alpha-3.csv", "alpha-0.csv"])
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache_incrementally()
+    # Only keys after the last cached key ("alpha-2.csv") are listed
+    assert sorted(
+        my_data_connector._get_data_reference_list_from_cache_by_data_asset_name(
+            "alpha"
+        )
+    ) == ["alpha-1.csv", "alpha-2.csv", "alpha-3.csv"]
+
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache()
+    assert my_data_connector.get_data_reference_list_count() == 4
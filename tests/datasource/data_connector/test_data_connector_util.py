@@ -15,6 +15,7 @@ from great_expectations.datasource.data_connector.util import (
     convert_data_reference_string_to_partition_definition_using_regex,
     convert_partition_definition_to_data_reference_string_using_regex,
     map_batch_definition_to_data_reference_string_using_regex,
+    map_data_reference_string_list_to_batch_definition_lists_using_regex,
     map_data_reference_string_to_batch_definition_list_using_regex,
 )
 
@@ -175,6 +176,42 @@ def test_map_data_reference_string_to_batch_definition_list_using_regex():
     ]
 
 
+def test_map_data_reference_string_list_to_batch_definition_lists_using_regex():
+    data_reference_list = [
+        "alex_20200809_1000.csv",
+        "eugene_20200809_1500.csv",
+        "abe_20200809_1040.txt",
+    ]
+    for regex_pattern, group_names, data_asset_name in [
+        (r"^(.+)_(\d+)_(\d+)\.csv$", ["name", "timestamp", "price"], None),
+        (r"^(.+)_(\d+)_(\d+)\.csv$", ["name", "timestamp", "price"], "test_asset"),
+        (r"^(.+)_(\d+)_(\d+)\.csv$", ["data_asset_name", "timestamp", "price"], None),
+    ]:
+        mapped_data_references = (
+            map_data_reference_string_list_to_batch_definition_lists_using_regex(
+                datasource_name="test_datasource",
+                data_connector_name="test_data_connector",
+                data_asset_name=data_asset_name,
+                data_reference_list=data_reference_list,
+                regex_pattern=regex_pattern,
+                group_names=group_names,
+            )
+        )
+        assert list(mapped_data_references.keys()) == data_reference_list
+        assert mapped_data_references["abe_20200809_1040.txt"] is None
+        for data_reference in data_reference_list:
+            assert mapped_data_references[
+                data_reference
+            ] == map_data_reference_string_to_batch_definition_list_using_regex(
+                datasource_name="test_datasource",
+                data_connector_name="test_data_connector",
+                data_asset_name=data_asset_name,
+                data_reference=data_reference,
+                regex_pattern=regex_pattern,
+                group_names=group_names,
+            )
+
+
 def test_convert_data_reference_string_to_partition_definition_using_regex():
     data_reference = "alex_20200809_1000.csv"
     pattern = r"^(.+)_(\d+)_(\d+)\.csv$"
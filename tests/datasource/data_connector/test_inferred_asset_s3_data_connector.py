@@ -14,6 +14,9 @@ from great_expectations.core.batch import (
 )
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.datasource.data_connector import InferredAssetS3DataConnector
+from great_expectations.datasource.data_connector.util import (
+    list_s3_keys_concurrently,
+)
 
 yaml = YAML()
 
@@ -985,3 +988,35 @@ def test_redundant_information_in_naming_convention_bucket_too_many_sorters():
                 "module_name": "great_expectations.datasource.data_connector"
             },
         )
+
+
+@mock_s3
+def test_list_s3_keys_concurrently():
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+
+    keys: List[str] = [
+        f"data/year={year}/month={month:02d}/part-{part}.csv"
+        for year in (2019, 2020, 2021)
+        for month in range(1, 13)
+        for part in range(3)
+    ] + ["data/top_level.csv", "data/year=2020/summary.csv"]
+    for key in keys:
+        client.put_object(Bucket=bucket, Body=b"x,y\n1,2\n", Key=key)
+
+    # A small MaxKeys makes every prefix span several pages
+    listed_keys: List[str] = list_s3_keys_concurrently(
+        s3=client,
+        query_options={
+            "Bucket": bucket,
+            "Prefix": "data/",
+            "Delimiter": "/",
+            "MaxKeys": 2,
+        },
+        max_workers=4,
+    )
+    assert len(listed_keys) == len(keys)
+    assert sorted(listed_keys) == sorted(keys)
@@ -852,3 +852,37 @@ def test_partition_request_for_data_asset_name(
         ),
     ]
     assert returned_batch_definition_list == expected
+
+
+def test_partition_request_partition_identifiers_after_data_references_cache_refresh(
+    create_files_and_instantiate_data_connector,
+):
+    my_data_connector = create_files_and_instantiate_data_connector
+    batch_request = BatchRequest(
+        datasource_name="test_environment",
+        data_connector_name="general_filesystem_data_connector",
+        data_asset_name="TestFiles",
+        partition_request={"partition_identifiers": {"name": "alex"}},
+    )
+    returned_batch_definition_list = (
+        my_data_connector.get_batch_definition_list_from_batch_request(batch_request)
+    )
+    assert [
+        batch_definition.partition_definition["timestamp"]
+        for batch_definition in returned_batch_definition_list
+    ] == ["20200819", "20200809"]
+
+    # Batch definitions are indexed per data_references cache, so new data references are picked up on refresh
+    create_files_in_directory(
+        directory=my_data_connector.base_directory,
+        file_name_list=["alex_20200901_1100.csv"],
+    )
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache()
+    returned_batch_definition_list = (
+        my_data_connector.get_batch_definition_list_from_batch_request(batch_request)
+    )
+    assert [
+        batch_definition.partition_definition["timestamp"]
+        for batch_definition in returned_batch_definition_list
+    ] == ["20200901", "20200819", "20200809"]
@@ -177,6 +177,27 @@ def test_map_value_set_sa(sa):
     assert results == {desired_metric.id: 0}
 
 
+def test_map_unexpected_exists_sa(sa):
+    engine = _build_sa_engine(pd.DataFrame({"a": [1, 2, 3, 3, None]}), sa)
+    for value_set, expected in [([1, 2, 3], False), ([1, 2], True)]:
+        condition_metric = MetricConfiguration(
+            metric_name="column_values.in_set.condition",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"value_set": value_set},
+        )
+        metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,))
+        desired_metric = MetricConfiguration(
+            metric_name="column_values.in_set.unexpected_exists",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"value_set": value_set},
+            metric_dependencies={"unexpected_condition": condition_metric},
+        )
+        results = engine.resolve_metrics(
+            metrics_to_resolve=(desired_metric,), metrics=metrics
+        )
+        assert results[desired_metric.id] is expected
+
+
 def test_map_of_type_sa(sa):
     eng = sa.create_engine("sqlite://")
     df = pd.DataFrame({"a": [1, 2, 3, 3, None]})
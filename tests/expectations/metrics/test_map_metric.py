@@ -1,3 +1,5 @@
+import pandas as pd
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -77,3 +79,20 @@ def test_get_map_metric_dependencies():
     metric = MetricConfiguration("foo.unexpected_index_list", dict(), dict())
     dependencies = mp.get_evaluation_dependencies(metric)
     assert dependencies["unexpected_condition"].id[0] == "foo.condition"
+
+
+def test_pandas_condition_on_low_cardinality_column_is_evaluated_on_unique_values():
+    values = ["apple", "banana", None, "cherry"] * 5000
+    df = pd.DataFrame({"a": values}, index=range(10, 20010))
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    desired_metric = MetricConfiguration(
+        metric_name="column_values.match_regex.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"regex": "^b"},
+    )
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    unexpected_condition, _, _ = results[desired_metric.id]
+
+    nonnull = df["a"][df["a"].notnull()]
+    expected = ~nonnull.astype(str).str.contains("^b")
+    pd.testing.assert_series_equal(unexpected_condition, expected, check_names=False)
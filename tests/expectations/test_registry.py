@@ -1,8 +1,19 @@
+import json
+import os
+import subprocess
+import sys
+
+import great_expectations.expectations.registry
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.expectations.core.expect_column_values_to_be_in_set import (
     ExpectColumnValuesToBeInSet,
 )
-from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.expectations.registry import (
+    _load_metric_from_manifest,
+    _registered_metrics,
+    build_registry_manifest,
+    get_expectation_impl,
+)
 
 
 def test_registry_basics():
@@ -16,3 +27,38 @@ def test_registry_from_configuration():
         kwargs={"column": "PClass", "value_set": [1, 2, 3]},
     )
     assert configuration._get_expectation_impl() == ExpectColumnValuesToBeInSet
+
+
+def test_registry_manifest_is_up_to_date():
+    with open(
+        os.path.join(
+            os.path.dirname(great_expectations.expectations.registry.__file__),
+            "registry_manifest.json",
+        )
+    ) as infile:
+        shipped_manifest = json.load(infile)
+    assert shipped_manifest == build_registry_manifest()
+
+
+def test_registry_manifest_resolves_derived_metric_names():
+    manifest = build_registry_manifest()
+    assert (
+        manifest["expectations"]["expect_column_values_to_be_in_set"]
+        == "great_expectations.expectations.core.expect_column_values_to_be_in_set"
+    )
+    assert _load_metric_from_manifest("column_values.in_set.unexpected_count")
+    assert "column_values.in_set.unexpected_count" in _registered_metrics
+    assert not _load_metric_from_manifest("column_values.not_a_metric")
+
+
+def test_metrics_package_imports_first_in_fresh_process():
+    # The metrics package must not depend on the expectations.core package having been imported already
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-c",
+            "from great_expectations.expectations.metrics import ColumnMapMetricProvider; "
+            "from great_expectations.expectations.registry import _load_metric_from_manifest; "
+            "assert _load_metric_from_manifest('column_values.of_type.unexpected_count')",
+        ]
+    )
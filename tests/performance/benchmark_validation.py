@@ -0,0 +1,512 @@
+"""
+Benchmarks for validation throughput, profiling, store listing and Data Docs builds.
+
+Synthetic datasets of configurable shape (number of rows and columns, and the number of distinct values per column)
+are validated on each requested execution engine with a fixed suite at each result_format level. Every benchmark
+writes one JSON record, so that rows/sec and per-expectation latency can be tracked over time:
+
+    python -m tests.performance.benchmark_validation --engines pandas sqlite spark \\
+        --tiers 1e5 1e6 --columns 5 50 --cardinality 10 100000 --output benchmark_results.json
+
+Row counts are given either as size tiers (1e5 to 1e8 rows) or directly with --rows. The time taken by
+`import great_expectations` in a fresh interpreter is recorded as well, and checked against an import-time budget
+(--import-time-budget): the record lists the lazily loaded modules (execution engines, renderers, expectations and
+metrics) that the import pulled in anyway, and the script exits with status 1 when the budget is exceeded.
+
+The module is not collected by pytest; test_benchmark_validation.py runs a tiny configuration as a smoke test.
+"""
+import argparse
+import datetime
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from great_expectations import __version__ as ge_version
+from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context import BaseDataContext
+from great_expectations.data_context.types.base import (
+    DataContextConfig,
+    FilesystemStoreBackendDefaults,
+)
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+from great_expectations.dataset import PandasDataset
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyBatchData,
+)
+from great_expectations.profile.user_configurable_profiler import (
+    UserConfigurableProfiler,
+)
+from great_expectations.validator.validator import Validator
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ("pandas", "sqlite", "spark")
+RESULT_FORMATS = ("BOOLEAN_ONLY", "BASIC", "SUMMARY", "COMPLETE")
+ROW_COUNT_TIERS = {
+    "1e5": 10 ** 5,
+    "1e6": 10 ** 6,
+    "1e7": 10 ** 7,
+    "1e8": 10 ** 8,
+}
+DEFAULT_ROW_COUNT_TIERS = ("1e5",)
+# Budget for `import great_expectations` in a fresh interpreter
+IMPORT_TIME_BUDGET_SECONDS = 2.0
+# Modules that are only imported on first use, and should not be imported by `import great_expectations`
+LAZILY_IMPORTED_MODULES = (
+    "great_expectations.execution_engine.pandas_execution_engine",
+    "great_expectations.execution_engine.sparkdf_execution_engine",
+    "great_expectations.execution_engine.sqlalchemy_execution_engine",
+    "great_expectations.render.renderer",
+    "great_expectations.expectations.core",
+    "great_expectations.expectations.metrics",
+)
+
+
+def generate_dataframe(
+    n_rows: int, n_columns: int, cardinality: int, seed: int = 0
+) -> pd.DataFrame:
+    """Alternate integer and string columns, each with at most cardinality distinct values and 1% nulls."""
+    random_state = np.random.RandomState(seed)
+    data = {}
+    for idx in range(n_columns):
+        values = random_state.randint(0, cardinality, size=n_rows)
+        if idx % 2 == 0:
+            column = pd.Series(values, dtype="float64")
+        else:
+            column = pd.Series(values).map("value_{}".format)
+        column[random_state.rand(n_rows) < 0.01] = None
+        data[f"col_{idx}"] = column
+    return pd.DataFrame(data)
+
+
+def build_expectation_configurations(
+    df: pd.DataFrame, cardinality: int
+) -> List[ExpectationConfiguration]:
+    """A suite of the most commonly used column map and aggregate expectations; about 1% of values are unexpected."""
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 0, "max_value": None},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_table_columns_to_match_ordered_list",
+            kwargs={"column_list": list(df.columns)},
+        ),
+    ]
+    in_set_size = max(1, int(cardinality * 0.99))
+    for idx, column in enumerate(df.columns):
+        configurations.append(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": column, "mostly": 0.95},
+            )
+        )
+        if idx % 2 == 0:
+            configurations.extend(
+                [
+                    ExpectationConfiguration(
+                        expectation_type="expect_column_values_to_be_between",
+                        kwargs={
+                            "column": column,
+                            "min_value": 0,
+                            "max_value": in_set_size - 1,
+                        },
+                    ),
+                    ExpectationConfiguration(
+                        expectation_type="expect_column_mean_to_be_between",
+                        kwargs={"column": column, "min_value": 0, "max_value": None},
+                    ),
+                ]
+            )
+        else:
+            configurations.extend(
+                [
+                    ExpectationConfiguration(
+                        expectation_type="expect_column_values_to_be_in_set",
+                        kwargs={
+                            "column": column,
+                            "value_set": [
+                                f"value_{value}" for value in range(in_set_size)
+                            ],
+                        },
+                    ),
+                    ExpectationConfiguration(
+                        expectation_type="expect_column_values_to_match_regex",
+                        kwargs={"column": column, "regex": r"^value_\d+$"},
+                    ),
+                ]
+            )
+    return configurations
+
+
+def build_validator(engine_name: str, df: pd.DataFrame) -> Validator:
+    if engine_name == "pandas":
+        batch = Batch(data=df)
+        return Validator(execution_engine=PandasExecutionEngine(), batches=(batch,))
+    elif engine_name == "sqlite":
+        import sqlalchemy as sa
+
+        engine = sa.create_engine("sqlite://")
+        df.to_sql(name="benchmark", con=engine, index=False, chunksize=10000)
+        batch = Batch(data=SqlAlchemyBatchData(engine=engine, table_name="benchmark"))
+        return Validator(
+            execution_engine=SqlAlchemyExecutionEngine(engine=engine),
+            batches=(batch,),
+        )
+    elif engine_name == "spark":
+        from pyspark.sql import SparkSession
+
+        spark = SparkSession.builder.getOrCreate()
+        spark_df = spark.createDataFrame(df.astype(object).where(df.notnull(), None))
+        batch = Batch(data=spark_df)
+        return Validator(execution_engine=SparkDFExecutionEngine(), batches=(batch,))
+    raise ValueError(f"Unknown engine {engine_name}; choose from {ENGINES}")
+
+
+def build_dataset(engine_name: str, df: pd.DataFrame, validator: Validator):
+    """The (V2) Dataset equivalent of the validator's batch, for the profiler benchmark."""
+    if engine_name == "pandas":
+        return PandasDataset(df)
+    elif engine_name == "sqlite":
+        from great_expectations.dataset import SqlAlchemyDataset
+
+        return SqlAlchemyDataset(
+            table_name="benchmark", engine=validator.execution_engine.engine
+        )
+    elif engine_name == "spark":
+        from pyspark.sql import SparkSession
+
+        from great_expectations.dataset import SparkDFDataset
+
+        spark = SparkSession.builder.getOrCreate()
+        return SparkDFDataset(
+            spark.createDataFrame(df.astype(object).where(df.notnull(), None))
+        )
+    raise ValueError(f"Unknown engine {engine_name}; choose from {ENGINES}")
+
+
+def _time(fn: Callable, repeat: int) -> float:
+    """The best of repeat runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start_time)
+    return min(timings)
+
+
+def benchmark_graph_validate(
+    validator: Validator,
+    configurations: List[ExpectationConfiguration],
+    result_format: str,
+    n_rows: int,
+    repeat: int = 1,
+) -> dict:
+    runtime_configuration = {"result_format": result_format}
+    seconds = _time(
+        lambda: validator.graph_validate(
+            configurations, runtime_configuration=runtime_configuration
+        ),
+        repeat,
+    )
+    # Collecting metric resolution events adds overhead, so they come from a separate, untimed run
+    validator.graph_validate(
+        configurations,
+        runtime_configuration=dict(
+            runtime_configuration, include_metric_resolution_stats=True
+        ),
+    )
+    # Bundled queries compute several metrics at once; their time is split evenly between them
+    metric_resolution_seconds: Dict[str, float] = {}
+    for event in validator.metric_resolution_stats["events"]:
+        metric_names = event.get("metric_names") or [event["metric_name"]]
+        for metric_name in metric_names:
+            metric_resolution_seconds[metric_name] = metric_resolution_seconds.get(
+                metric_name, 0.0
+            ) + event["duration_seconds"] / len(metric_names)
+
+    expectation_seconds: Dict[str, float] = {}
+    for configuration in configurations:
+        expectation_seconds[configuration.expectation_type] = expectation_seconds.get(
+            configuration.expectation_type, 0.0
+        ) + _time(
+            lambda: validator.graph_validate(
+                [configuration], runtime_configuration=runtime_configuration
+            ),
+            repeat,
+        )
+    return {
+        "seconds": seconds,
+        "rows_per_second": n_rows / seconds if seconds else None,
+        "expectation_seconds": expectation_seconds,
+        "metric_resolution_seconds": metric_resolution_seconds,
+    }
+
+
+def benchmark_profiler(dataset, repeat: int = 1) -> dict:
+    return {
+        "seconds": _time(lambda: UserConfigurableProfiler(dataset).build_suite(), repeat)
+    }
+
+
+def benchmark_import_time(
+    repeat: int = 1, budget_seconds: float = IMPORT_TIME_BUDGET_SECONDS
+) -> dict:
+    """Time `import great_expectations` in fresh interpreters against budget_seconds, and list the slowest modules
+    reported by `python -X importtime` (cumulative microseconds) and the lazily imported modules that were loaded."""
+    command = [sys.executable, "-X", "importtime", "-c", "import great_expectations"]
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        completed = subprocess.run(
+            command, stderr=subprocess.PIPE, universal_newlines=True, check=True
+        )
+        timings.append(time.perf_counter() - start_time)
+
+    module_microseconds = {}
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module_name = line[len("import time:") :].split("|")
+        module_microseconds[module_name.strip()] = int(cumulative)
+    slowest_modules = sorted(
+        module_microseconds.items(), key=lambda item: item[1], reverse=True
+    )[:20]
+    seconds = min(timings)
+    return {
+        "seconds": seconds,
+        "budget_seconds": budget_seconds,
+        "within_budget": seconds <= budget_seconds,
+        "slowest_modules_cumulative_microseconds": dict(slowest_modules),
+        "eagerly_imported_lazy_modules": [
+            module_name
+            for module_name in LAZILY_IMPORTED_MODULES
+            if module_name in module_microseconds
+        ],
+    }
+
+
+def benchmark_stores_and_data_docs(
+    validator: Validator,
+    configurations: List[ExpectationConfiguration],
+    n_validation_results: int,
+    repeat: int = 1,
+) -> dict:
+    """Store n_validation_results copies of a validation result in a filesystem ValidationsStore, then time listing
+    the store and building the local Data Docs site."""
+    with tempfile.TemporaryDirectory() as root_directory:
+        context = BaseDataContext(
+            project_config=DataContextConfig(
+                store_backend_defaults=FilesystemStoreBackendDefaults(
+                    root_directory=root_directory
+                ),
+            ),
+            context_root_dir=root_directory,
+        )
+        suite = context.create_expectation_suite("benchmark")
+        for configuration in configurations:
+            suite.add_expectation(configuration)
+        context.save_expectation_suite(suite)
+        validation_result = validator.validate(expectation_suite=suite)
+
+        start_time = time.perf_counter()
+        for idx in range(n_validation_results):
+            context.validations_store.set(
+                ValidationResultIdentifier(
+                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                        "benchmark"
+                    ),
+                    run_id=RunIdentifier(run_name=f"run_{idx}"),
+                    batch_identifier="benchmark_batch",
+                ),
+                validation_result,
+            )
+        store_set_seconds = time.perf_counter() - start_time
+        return {
+            "validation_results": n_validation_results,
+            "store_set_seconds": store_set_seconds,
+            "store_list_keys_seconds": _time(
+                context.validations_store.list_keys, repeat
+            ),
+            "data_docs_build_seconds": _time(context.build_data_docs, repeat),
+        }
+
+
+def run_benchmarks(
+    engines=("pandas",),
+    row_counts=(100000,),
+    column_counts=(5,),
+    cardinalities=(10,),
+    result_formats=RESULT_FORMATS,
+    repeat: int = 1,
+    profile: bool = True,
+    n_validation_results: Optional[int] = 50,
+    import_time: bool = True,
+    import_time_budget_seconds: float = IMPORT_TIME_BUDGET_SECONDS,
+) -> List[dict]:
+    """Run every benchmark for each combination of engine and dataset shape, and return one record per benchmark."""
+    records = []
+    if import_time:
+        records.append(
+            dict(
+                benchmark="import_time",
+                **benchmark_import_time(
+                    repeat=repeat, budget_seconds=import_time_budget_seconds
+                ),
+            )
+        )
+    for n_rows in row_counts:
+        for n_columns in column_counts:
+            for cardinality in cardinalities:
+                df = generate_dataframe(n_rows, n_columns, cardinality)
+                configurations = build_expectation_configurations(df, cardinality)
+                for engine_name in engines:
+                    logger.info(
+                        f"Benchmarking {engine_name} on {n_rows} rows x {n_columns} columns with "
+                        f"cardinality {cardinality}"
+                    )
+                    validator = build_validator(engine_name, df)
+                    dataset = {
+                        "engine": engine_name,
+                        "rows": n_rows,
+                        "columns": n_columns,
+                        "cardinality": cardinality,
+                    }
+                    for result_format in result_formats:
+                        records.append(
+                            dict(
+                                dataset,
+                                benchmark="graph_validate",
+                                result_format=result_format,
+                                **benchmark_graph_validate(
+                                    validator,
+                                    configurations,
+                                    result_format,
+                                    n_rows,
+                                    repeat=repeat,
+                                ),
+                            )
+                        )
+                    if profile:
+                        records.append(
+                            dict(
+                                dataset,
+                                benchmark="user_configurable_profiler",
+                                **benchmark_profiler(
+                                    build_dataset(engine_name, df, validator),
+                                    repeat=repeat,
+                                ),
+                            )
+                        )
+                    if n_validation_results:
+                        records.append(
+                            dict(
+                                dataset,
+                                benchmark="stores_and_data_docs",
+                                **benchmark_stores_and_data_docs(
+                                    validator,
+                                    configurations,
+                                    n_validation_results,
+                                    repeat=repeat,
+                                ),
+                            )
+                        )
+    return records
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=["pandas"])
+    parser.add_argument(
+        "--tiers",
+        nargs="+",
+        choices=list(ROW_COUNT_TIERS),
+        help=f"Row count tiers to benchmark; defaults to {' '.join(DEFAULT_ROW_COUNT_TIERS)} unless --rows is given.",
+    )
+    parser.add_argument("--rows", nargs="+", type=int, default=[])
+    parser.add_argument("--columns", nargs="+", type=int, default=[5])
+    parser.add_argument("--cardinality", nargs="+", type=int, default=[10])
+    parser.add_argument(
+        "--result-formats", nargs="+", choices=RESULT_FORMATS, default=RESULT_FORMATS
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--skip-profiler", action="store_true")
+    parser.add_argument("--skip-import-time", action="store_true")
+    parser.add_argument(
+        "--import-time-budget",
+        type=float,
+        default=IMPORT_TIME_BUDGET_SECONDS,
+        help="Exit with status 1 if `import great_expectations` takes longer than this many seconds.",
+    )
+    parser.add_argument(
+        "--validation-results",
+        type=int,
+        default=50,
+        help="Number of validation results to store before timing store listing and Data Docs builds; 0 to skip.",
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    args = parser.parse_args(args)
+
+    tiers = args.tiers or ([] if args.rows else DEFAULT_ROW_COUNT_TIERS)
+    row_counts = [ROW_COUNT_TIERS[tier] for tier in tiers] + args.rows
+
+    records = run_benchmarks(
+        engines=args.engines,
+        row_counts=row_counts,
+        column_counts=args.columns,
+        cardinalities=args.cardinality,
+        result_formats=args.result_formats,
+        repeat=args.repeat,
+        profile=not args.skip_profiler,
+        n_validation_results=args.validation_results,
+        import_time=not args.skip_import_time,
+        import_time_budget_seconds=args.import_time_budget,
+    )
+    output = {
+        "great_expectations_version": ge_version,
+        "python_version": platform.python_version(),
+        "run_time": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "results": records,
+    }
+    if args.output:
+        with open(args.output, "w") as outfile:
+            json.dump(output, outfile, indent=2)
+    else:
+        print(json.dumps(output, indent=2))
+
+    over_budget_records = [
+        record
+        for record in records
+        if record["benchmark"] == "import_time" and not record["within_budget"]
+    ]
+    if over_budget_records:
+        logger.error(
+            f"import great_expectations took {over_budget_records[0]['seconds']:.2f} seconds, over the budget of "
+            f"{args.import_time_budget:.2f} seconds"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
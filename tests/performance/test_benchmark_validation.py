@@ -0,0 +1,66 @@
+import json
+
+from tests.performance.benchmark_validation import RESULT_FORMATS, main, run_benchmarks
+
+
+def test_run_benchmarks_pandas_smoke():
+    records = run_benchmarks(
+        engines=("pandas",),
+        row_counts=(200,),
+        column_counts=(2,),
+        cardinalities=(5,),
+        n_validation_results=2,
+    )
+    validate_records = [
+        record for record in records if record["benchmark"] == "graph_validate"
+    ]
+    assert [record["result_format"] for record in validate_records] == list(
+        RESULT_FORMATS
+    )
+    (import_time_record,) = [
+        record for record in records if record["benchmark"] == "import_time"
+    ]
+    assert import_time_record["seconds"] > 0
+    assert "great_expectations" in import_time_record[
+        "slowest_modules_cumulative_microseconds"
+    ]
+    assert import_time_record["within_budget"] == (
+        import_time_record["seconds"] <= import_time_record["budget_seconds"]
+    )
+    assert import_time_record["eagerly_imported_lazy_modules"] == []
+    for record in validate_records:
+        assert record["rows_per_second"] > 0
+        assert "expect_column_values_to_be_in_set" in record["expectation_seconds"]
+        assert "table.row_count" in record["metric_resolution_seconds"]
+    assert {record["benchmark"] for record in records} == {
+        "import_time",
+        "graph_validate",
+        "user_configurable_profiler",
+        "stores_and_data_docs",
+    }
+
+
+def test_main_writes_json_output(tmp_path):
+    output_path = tmp_path / "benchmark_results.json"
+    exit_status = main(
+        [
+            "--rows",
+            "100",
+            "--columns",
+            "1",
+            "--result-formats",
+            "BASIC",
+            "--skip-profiler",
+            "--skip-import-time",
+            "--validation-results",
+            "0",
+            "--output",
+            str(output_path),
+        ]
+    )
+    assert exit_status == 0
+    with open(output_path) as infile:
+        output = json.load(infile)
+    assert len(output["results"]) == 1
+    assert output["results"][0]["engine"] == "pandas"
+    assert output["results"][0]["rows"] == 100
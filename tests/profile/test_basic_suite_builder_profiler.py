@@ -1345,3 +1345,25 @@ def test_snapshot_BasicSuiteBuilderProfiler_on_titanic_with_builder_configuratio
     del evrs.meta["validation_time"]
 
     assert evrs == expected_evrs
+
+
+def test_BasicSuiteBuilderProfiler_classifies_columns_on_a_sample():
+    df = ge.dataset.PandasDataset(
+        {
+            "id": list(range(0, 1000)),
+            "category": [str(i % 3) for i in range(0, 1000)],
+        }
+    )
+
+    full_suite, _ = BasicSuiteBuilderProfiler().profile(ge.dataset.PandasDataset(df))
+    sampled_suite, _ = BasicSuiteBuilderProfiler().profile(
+        ge.dataset.PandasDataset(df), profiler_configuration={"sample_size": 200}
+    )
+
+    assert "profiler_sample" not in full_suite.meta
+    assert sampled_suite.meta["profiler_sample"] == {
+        "sample_size": 200,
+        "row_count": 1000,
+        "confidence": 1.0,
+    }
+    assert sampled_suite.expectations == full_suite.expectations
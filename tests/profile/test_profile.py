@@ -5,7 +5,15 @@ import pytest
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.dataset.pandas_dataset import PandasDataset
 from great_expectations.datasource import PandasDatasource
-from great_expectations.profile.base import DatasetProfiler, Profiler
+from great_expectations.profile.base import (
+    DatasetProfiler,
+    OrderedProfilerCardinality,
+    Profiler,
+    estimate_column_cardinality_from_sample,
+    get_profiling_sample,
+    get_sample_confidence,
+    get_sample_coverage,
+)
 from great_expectations.profile.basic_dataset_profiler import BasicDatasetProfiler
 from great_expectations.profile.columns_exist import ColumnsExistProfiler
 
@@ -412,3 +420,48 @@ def test_context_profiler_without_generator_name_arg_on_datasource_with_no_gener
     )
 
     assert profiling_result == {"success": False, "error": {"code": 4}}
+
+
+def test_get_profiling_sample_and_sample_coverage():
+    dataset = PandasDataset(
+        {"a": [i % 2 for i in range(100)], "b": [i for i in range(100)]}
+    )
+    assert get_profiling_sample(dataset, None) is None
+    assert get_profiling_sample(dataset, 100) is None
+
+    sample = get_profiling_sample(dataset, 50)
+    assert isinstance(sample, PandasDataset)
+    assert len(sample) == 50
+    assert get_sample_coverage(sample, "a") == 1.0
+    assert get_sample_coverage(sample, "b") == 0.0
+
+    get_cardinality = OrderedProfilerCardinality.get_basic_column_cardinality
+    assert get_sample_confidence(sample, ["a", "b"], 100, get_cardinality) == 1.0
+    assert get_sample_confidence(sample, [], 100, get_cardinality) == 1.0
+
+
+def test_estimate_column_cardinality_from_sample():
+    # 500 distinct values are few among 100,000 rows, but most of the 1,000 sampled values are distinct
+    dataset = PandasDataset(
+        {"a": [i % 500 for i in range(100000)], "b": [i for i in range(100000)]}
+    )
+    sample = get_profiling_sample(dataset, 1000)
+    assert sample.get_column_unique_count("a") / len(sample) > 0.1
+
+    estimate = estimate_column_cardinality_from_sample(sample, "a", 100000)
+    assert 400 <= estimate["num_unique"] <= 600
+    assert estimate["pct_unique"] == estimate["num_unique"] / 100000
+    assert estimate["min_num_unique"] == estimate["num_unique"]
+    assert estimate["max_num_unique"] > estimate["num_unique"]
+    assert estimate["nonnull_count"] == 100000
+
+    # a column whose sampled values are all distinct is estimated to be unique
+    estimate = estimate_column_cardinality_from_sample(sample, "b", 100000)
+    assert estimate["num_unique"] == 100000
+    assert estimate["pct_unique"] == 1.0
+
+    # the class of "a" could flip on the full dataset, so the confidence is its coverage
+    get_cardinality = OrderedProfilerCardinality.get_basic_column_cardinality
+    confidence = get_sample_confidence(sample, ["a"], 100000, get_cardinality)
+    assert confidence == get_sample_coverage(sample, "a")
+    assert 0.0 < confidence < 1.0
@@ -542,3 +542,81 @@ def test_column_cardinality_functions(cardinality_dataset):
         OrderedProfilerCardinality.get_basic_column_cardinality(pct_unique=0.5)
     )
     assert cardinality_with_large_pct_and_no_num.name == "NONE"
+
+
+def test_profiler_prefetches_column_aggregates_on_sqlalchemy_dataset(sa):
+    from great_expectations.dataset import SqlAlchemyDataset
+
+    engine = sa.create_engine("sqlite://")
+    df = pd.DataFrame(
+        {
+            "col_int": [i % 10 for i in range(0, 100)],
+            "col_float": [i / 4 for i in range(0, 100)],
+            "col_string": [str(i % 3) for i in range(0, 100)],
+        }
+    )
+    df.to_sql(name="test_data", con=engine, index=False)
+
+    suites = []
+    for caching in [True, False]:
+        dataset = SqlAlchemyDataset("test_data", engine=engine, caching=caching)
+        # sqlite does not support the percentile functions used for quantiles
+        profiler = UserConfigurableProfiler(
+            dataset,
+            excluded_expectations=["expect_column_quantile_values_to_be_between"],
+        )
+        suites.append(profiler.build_suite())
+
+        numeric_columns = [
+            column
+            for column, column_info in profiler.column_info.items()
+            if column_info["type"] in ("FLOAT", "INT", "NUMERIC")
+        ]
+        assert "col_float" in numeric_columns
+        expected_prefetched_aggregates = (
+            {
+                (aggregate, column)
+                for aggregate in ["nonnull_count", "unique_count"]
+                for column in df.columns
+            }
+            | {
+                (aggregate, column)
+                for aggregate in ["min", "max", "mean"]
+                for column in numeric_columns
+            }
+            | {("row_count", None)}
+        )
+        assert set(dataset._prefetched_column_aggregates.keys()) == (
+            expected_prefetched_aggregates if caching else set()
+        )
+
+    assert suites[0].expectations == suites[1].expectations
+
+
+def test_profiler_classifies_columns_on_a_sample():
+    df = pd.DataFrame(
+        {
+            "col_int": list(range(0, 1000)),
+            "col_string": [str(i % 3) for i in range(0, 1000)],
+        }
+    )
+
+    full_profiler = UserConfigurableProfiler(PandasDataset(df))
+    full_suite = full_profiler.build_suite()
+    assert "profiler_sample" not in full_suite.meta
+
+    sampled_profiler = UserConfigurableProfiler(PandasDataset(df), sample_size=200)
+    sampled_suite = sampled_profiler.build_suite()
+
+    assert sampled_profiler.column_info == full_profiler.column_info
+    assert sampled_suite.expectations == full_suite.expectations
+    assert sampled_suite.meta["profiler_sample"] == {
+        "sample_size": 200,
+        "row_count": 1000,
+        "confidence": 1.0,
+    }
+
+    # a sample at least as large as the dataset profiles the dataset directly
+    profiler = UserConfigurableProfiler(PandasDataset(df), sample_size=1000)
+    assert profiler.sample is None
+    assert "profiler_sample" not in profiler.build_suite().meta
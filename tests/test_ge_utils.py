@@ -7,8 +7,12 @@ import great_expectations as ge
 from great_expectations.core.util import nested_update
 from great_expectations.dataset.util import check_sql_engine_dialect
 from great_expectations.util import (
+    dispose_sqlalchemy_engines,
     filter_properties_dict,
+    get_cached_sqlalchemy_metadata,
     get_currently_executing_function_call_arguments,
+    get_sqlalchemy_engine,
+    invalidate_sqlalchemy_metadata_cache,
     lint_code,
 )
 
@@ -336,3 +340,88 @@ def test_filter_properties_dict():
     d5_end = copy.deepcopy(d5_begin)
     d5_end_expected = {"c": "xyz_0", "d": 1}
     assert d5_end == d5_end_expected
+
+
+def test_get_sqlalchemy_engine_shares_engines_by_url_and_options(tmp_path):
+    pytest.importorskip("sqlalchemy")
+    url = f"sqlite:///{tmp_path / 'shared.db'}"
+    try:
+        engine = get_sqlalchemy_engine(url)
+        assert get_sqlalchemy_engine(url) is engine
+        assert get_sqlalchemy_engine(url, pool_pre_ping=True) is not engine
+        assert get_sqlalchemy_engine(f"sqlite:///{tmp_path / 'other.db'}") is not engine
+        # Every in-memory database is distinct, so their engines are never shared
+        assert get_sqlalchemy_engine("sqlite://") is not get_sqlalchemy_engine(
+            "sqlite://"
+        )
+    finally:
+        dispose_sqlalchemy_engines()
+    assert get_sqlalchemy_engine(url) is not engine
+    dispose_sqlalchemy_engines()
+
+
+
+def test_get_cached_sqlalchemy_metadata_caches_by_url_until_invalidated(tmp_path):
+    sa = pytest.importorskip("sqlalchemy")
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'metadata.db'}")
+    other_engine = sa.create_engine(f"sqlite:///{tmp_path / 'metadata.db'}")
+    fetches = []
+
+    def fetch():
+        fetches.append(None)
+        return len(fetches)
+
+    try:
+        assert get_cached_sqlalchemy_metadata(engine, "tables", None, fetch=fetch) == 1
+        assert get_cached_sqlalchemy_metadata(engine, "tables", None, fetch=fetch) == 2
+
+        assert (
+            get_cached_sqlalchemy_metadata(
+                engine, "tables", None, fetch=fetch, ttl_seconds=60
+            )
+            == 3
+        )
+        # Engines connected to the same database share cached metadata
+        assert (
+            get_cached_sqlalchemy_metadata(
+                other_engine, "tables", None, fetch=fetch, ttl_seconds=60
+            )
+            == 3
+        )
+        assert (
+            get_cached_sqlalchemy_metadata(
+                engine, "columns", "main", "my_table", fetch=fetch, ttl_seconds=60
+            )
+            == 4
+        )
+
+        invalidate_sqlalchemy_metadata_cache(engine, schema_name="main")
+        assert (
+            get_cached_sqlalchemy_metadata(
+                engine, "columns", "main", "my_table", fetch=fetch, ttl_seconds=60
+            )
+            == 5
+        )
+        assert (
+            get_cached_sqlalchemy_metadata(
+                engine, "tables", None, fetch=fetch, ttl_seconds=60
+            )
+            == 6
+        )
+
+        # Every in-memory database is distinct, so their metadata is never cached
+        in_memory_engine = sa.create_engine("sqlite://")
+        assert (
+            get_cached_sqlalchemy_metadata(
+                in_memory_engine, "tables", None, fetch=fetch, ttl_seconds=60
+            )
+            == 7
+        )
+        assert (
+            get_cached_sqlalchemy_metadata(
+                in_memory_engine, "tables", None, fetch=fetch, ttl_seconds=60
+            )
+            == 8
+        )
+    finally:
+        invalidate_sqlalchemy_metadata_cache()
@@ -1,6 +1,8 @@
 import os
 import random
 import re
+import subprocess
+import sys
 import unittest
 
 import pandas as pd
@@ -1095,5 +1097,39 @@ class TestIO(unittest.TestCase):
         assert isinstance(df, PandasDataset)
 
 
+def test_import_great_expectations_does_not_import_execution_engines_or_renderers():
+    # The concrete execution engines and the render stack are imported on first use (see
+    # great_expectations/execution_engine/__init__.py)
+    script = """
+import sys
+import great_expectations
+import great_expectations.execution_engine
+for module_name in [
+    "great_expectations.execution_engine.pandas_execution_engine",
+    "great_expectations.execution_engine.sparkdf_execution_engine",
+    "great_expectations.execution_engine.sqlalchemy_execution_engine",
+    "great_expectations.render",
+]:
+    assert module_name not in sys.modules, module_name
+
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+assert "great_expectations.execution_engine.sqlalchemy_execution_engine" in sys.modules
+assert "great_expectations.execution_engine.pandas_execution_engine" not in sys.modules
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_import_great_expectations_does_not_import_optional_heavy_modules():
+    # scipy, altair and IPython are only needed by some expectations, chart renderers and notebooks; they are imported
+    # on first use so that they do not slow down importing great_expectations (and every CLI invocation)
+    script = """
+import sys
+import great_expectations
+for module_name in ["scipy.stats", "altair", "IPython"]:
+    assert module_name not in sys.modules, module_name
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
 if __name__ == "__main__":
     unittest.main()
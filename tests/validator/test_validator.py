@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pandas as pd
 
 import great_expectations.expectations.metrics
@@ -316,6 +318,93 @@ def test_graph_validate_with_runtime_config(basic_datasource):
     ]
 
 
+def _get_single_batch_from_df(basic_datasource, df):
+    return basic_datasource.get_single_batch_from_batch_request(
+        BatchRequest(
+            **{
+                "datasource_name": "my_datasource",
+                "data_connector_name": "test_runtime_data_connector",
+                "batch_data": df,
+                "partition_request": PartitionRequest(
+                    **{
+                        "partition_identifiers": {
+                            "pipeline_stage_name": 0,
+                            "airflow_run_id": 0,
+                            "custom_key_0": 0,
+                        }
+                    }
+                ),
+            }
+        )
+    )
+
+
+def test_graph_validate_boolean_only_uses_unexpected_exists(basic_datasource):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    batch = _get_single_batch_from_df(basic_datasource, df)
+    validator = Validator(execution_engine=PandasExecutionEngine(), batches=[batch])
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "a", "value_set": [1, 3, 5, 10, 22]},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "b"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "a", "value_set": [1, 3, 5], "mostly": 0.5},
+        ),
+    ]
+    metrics = {}
+    result = validator.graph_validate(
+        configurations=configurations,
+        metrics=metrics,
+        runtime_configuration={"result_format": "BOOLEAN_ONLY"},
+    )
+    assert [evr.success for evr in result] == [True, False, True]
+    assert [evr.result for evr in result] == [{}, {}, {}]
+
+    resolved_metric_names = {metric_id[0] for metric_id in metrics}
+    assert "column_values.in_set.unexpected_exists" in resolved_metric_names
+    assert "column_values.nonnull.unexpected_exists" in resolved_metric_names
+    # mostly < 1 still requires the counts
+    assert "column_values.in_set.unexpected_count" in resolved_metric_names
+    assert "column_values.in_set.unexpected_values" not in resolved_metric_names
+
+
+def test_graph_validate_fail_fast(basic_datasource):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    batch = _get_single_batch_from_df(basic_datasource, df)
+    validator = Validator(execution_engine=PandasExecutionEngine(), batches=[batch])
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "b"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "a", "min_value": 1, "max_value": 29},
+        ),
+    ]
+    result = validator.graph_validate(
+        configurations=configurations,
+        runtime_configuration={"result_format": "BOOLEAN_ONLY", "fail_fast": True},
+    )
+    assert [evr.success for evr in result] == [True, False]
+
+    result = validator.graph_validate(
+        configurations=configurations,
+        runtime_configuration={"result_format": "BOOLEAN_ONLY"},
+    )
+    assert [evr.success for evr in result] == [True, False, True]
+
+
 def test_validator_default_expectation_args__pandas(basic_datasource):
     df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
     expectationConfiguration = ExpectationConfiguration(
@@ -366,3 +455,130 @@ def test_validator_default_expectation_args__sql(
     )
 
     print(my_validator.get_default_expectation_arguments())
+
+
+def test_graph_validate_prunes_metrics_not_needed_by_result_format(
+    basic_datasource,
+):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    batch = _get_single_batch_from_df(basic_datasource, df)
+    validator = Validator(execution_engine=PandasExecutionEngine(), batches=[batch])
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "a", "value_set": [1, 3, 5]},
+    )
+
+    metrics = {}
+    result = validator.graph_validate(
+        configurations=[configuration],
+        metrics=metrics,
+        runtime_configuration={
+            "result_format": {
+                "result_format": "COMPLETE",
+                "partial_unexpected_count": 20,
+            }
+        },
+    )
+    resolved_metric_names = {metric_id[0] for metric_id in metrics}
+    assert "column_values.in_set.unexpected_values" in resolved_metric_names
+    assert "column_values.in_set.unexpected_index_list" in resolved_metric_names
+    # unexpected_rows is not part of the result unless explicitly requested
+    assert "column_values.in_set.unexpected_rows" not in resolved_metric_names
+    assert validator.metric_graph_pruning_stats == {
+        "pruned_metric_nodes": 1,
+        "pruned_queries": 1,
+    }
+    assert result[0].result["unexpected_list"] == [22, 10]
+
+    metrics = {}
+    result = validator.graph_validate(
+        configurations=[configuration],
+        metrics=metrics,
+        runtime_configuration={
+            "result_format": {"result_format": "BASIC", "partial_unexpected_count": 0}
+        },
+    )
+    resolved_metric_names = {metric_id[0] for metric_id in metrics}
+    assert "column_values.in_set.unexpected_values" not in resolved_metric_names
+    assert validator.metric_graph_pruning_stats["pruned_metric_nodes"] == 1
+    assert result[0].success == False
+    assert result[0].result["unexpected_count"] == 2
+    assert result[0].result["partial_unexpected_list"] == []
+
+
+def test_only_map_expectations_prune_metrics_not_needed_by_result_format():
+    result_format = {"result_format": "BOOLEAN_ONLY", "partial_unexpected_count": 20}
+
+    map_expectation = get_expectation_impl("expect_column_values_to_be_in_set")()
+    assert map_expectation.get_result_format_unneeded_metric_names(result_format) == {
+        "column_values.in_set.unexpected_values",
+        "column_values.in_set.unexpected_index_list",
+        "column_values.in_set.unexpected_value_counts",
+        "column_values.in_set.unexpected_rows",
+    }
+    # Other expectations may use such metrics for more than their result, so they keep all their dependencies
+    column_expectation = get_expectation_impl("expect_column_max_to_be_between")()
+    assert (
+        column_expectation.get_result_format_unneeded_metric_names(result_format)
+        == set()
+    )
+
+
+def test_graph_validate_reports_metric_resolution_events(basic_datasource):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    batch = _get_single_batch_from_df(basic_datasource, df)
+    validator = Validator(execution_engine=PandasExecutionEngine(), batches=[batch])
+    events = []
+    validator.set_metric_resolution_callback(events.append)
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_max_to_be_between",
+        kwargs={"column": "a", "min_value": 1, "max_value": 29},
+    )
+
+    metrics = {}
+    result = validator.graph_validate(configurations=[configuration], metrics=metrics)
+    assert result[0].success == True
+    assert {event["metric_name"] for event in events} == {
+        metric_id[0] for metric_id in metrics
+    }
+    assert all(event["duration_seconds"] >= 0 for event in events)
+    assert all(event["execution_engine"] == "PandasExecutionEngine" for event in events)
+    stats = validator.metric_resolution_stats
+    assert stats["resolved_metrics"] == len(metrics)
+    assert stats["reused_metrics"] == 0
+    assert stats["events"] == events
+
+    # Metrics that were already computed are reused rather than resolved again
+    events.clear()
+    validator.graph_validate(configurations=[configuration], metrics=metrics)
+    assert events == []
+    assert validator.metric_resolution_stats["resolved_metrics"] == 0
+    assert validator.metric_resolution_stats["reused_metrics"] == len(metrics)
+    assert validator.execution_engine.metric_resolution_callback is None
+
+
+def test_graph_validate_collects_metric_resolution_events_only_when_requested(
+    basic_datasource,
+):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    batch = _get_single_batch_from_df(basic_datasource, df)
+    validator = Validator(execution_engine=PandasExecutionEngine(), batches=[batch])
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_max_to_be_between",
+        kwargs={"column": "a", "min_value": 1, "max_value": 29},
+    )
+
+    with mock.patch.object(
+        validator, "_on_metric_resolved", wraps=validator._on_metric_resolved
+    ) as on_metric_resolved:
+        validator.graph_validate(configurations=[configuration])
+        assert on_metric_resolved.call_count == 0
+        assert validator.metric_resolution_stats["events"] == []
+        assert validator.metric_resolution_stats["resolved_metrics"] > 0
+
+        validator.graph_validate(
+            configurations=[configuration],
+            runtime_configuration={"include_metric_resolution_stats": True},
+        )
+        assert on_metric_resolved.call_count > 0
+        assert len(validator.metric_resolution_stats["events"]) > 0